@@ -6,7 +6,6 @@ import sys
 import os
 import html
 import datetime
-import re
 import time
 from webbrowser import open as url_open
 import threading
@@ -16,7 +15,7 @@ from .comments import BackgroundCommentFetcher, display_comments_for_story, fetc
 from .colors import Colors, ColorScheme, colorize, supports_color
 from .getch import getch
 from .utils import (
-    get_story, format_comment_count, format_time_ago,
+    compile_keyword_pattern, get_story, format_comment_count, format_time_ago,
     filter_stories_by_keywords, sort_stories_by_score,
     sort_stories_by_comments, sort_stories_by_time,
     get_stories
@@ -24,6 +23,10 @@ from .utils import (
 
 USE_COLORS = supports_color()
 
+# Escape sequences around highlighted keywords, built once
+_HIGHLIGHT_ON = ColorScheme.HIGHLIGHT
+_HIGHLIGHT_OFF = Colors.RESET
+
 def clear_screen():
     """Clear the terminal screen."""
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -146,26 +149,16 @@ def highlight_keywords_in_text(text, keywords, case_sensitive=False):
     if not text or not keywords:
         return text
     
-    # Create a copy of the original text for highlighting
-    highlighted = text
-    
-    for keyword in keywords:
-        if not keyword:
-            continue
-        
-        # For case-insensitive, we need a regular expression with the i flag
-        if case_sensitive:
-            pattern = re.compile(re.escape(keyword))
-        else:
-            pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-        
-        # Replace all occurrences with highlighted version
-        if USE_COLORS:
-            highlighted = pattern.sub(lambda m: colorize(m.group(0), Colors.BRIGHT_YELLOW + Colors.BOLD), highlighted)
-        else:
-            highlighted = pattern.sub(lambda m: f"*{m.group(0)}*", highlighted)
+    terms = tuple(k for k in keywords if k)
+    if not terms:
+        return text
     
-    return highlighted
+    # One cached pattern for all keywords, applied in a single pass, so a
+    # keyword is never matched inside markers added for another one
+    pattern = compile_keyword_pattern(terms, case_sensitive)
+    if USE_COLORS:
+        return pattern.sub(lambda m: f"{_HIGHLIGHT_ON}{m.group(0)}{_HIGHLIGHT_OFF}", text)
+    return pattern.sub(lambda m: f"*{m.group(0)}*", text)
 
 def display_ask_story_details(story_id, keywords=None, case_sensitive=False):
     """
@@ -556,7 +549,7 @@ class AskStoryMonitor:
             self.story_ids.add(story_id)
             
             # Fetch initial data for this story
-            story = fetch_item(story_id)
+            story = fetch_item(story_id, refresh=True)
             if story:
                 comment_count = len(story.get('kids', []))
                 
@@ -652,7 +645,7 @@ class AskStoryMonitor:
         """Fetch initial data for all stories in the monitor."""
         with self.story_data_lock:
             for story_id in list(self.story_ids):
-                story = fetch_item(story_id)
+                story = fetch_item(story_id, refresh=True)
                 if not story:
                     self.story_ids.remove(story_id)
                     continue
@@ -689,7 +682,7 @@ class AskStoryMonitor:
                     if not self.running:  # Check if we should exit
                         break
                         
-                    updated_story = fetch_item(story_id)
+                    updated_story = fetch_item(story_id, refresh=True)
                     if not updated_story:
                         continue
                         
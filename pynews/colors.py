@@ -75,6 +75,9 @@ class ColorScheme:
     # Prompts
     PROMPT = Colors.BRIGHT_GREEN
     INPUT = Colors.BRIGHT_CYAN
+    
+    # Search matches
+    HIGHLIGHT = Colors.BRIGHT_YELLOW + Colors.BOLD
 
 def colorize(text, color_code):
     """Wrap text with color codes and reset afterwards."""
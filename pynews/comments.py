@@ -3,32 +3,47 @@ Functions for retrieving and displaying comments from HackerNews.
 """
 import datetime
 import html
+import re
 import textwrap
 import requests
 import time
 import sys
 import os
 import select
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import partial
 import json
 import csv
 import threading
 import queue
 
-from .constants import URLS
+from .cache import TTLCache
+from .constants import ITEM_CACHE_SIZE, ITEM_CACHE_TTL, REQUEST_TIMEOUT, URLS, item_url
 from .loading import with_loading, with_progress, LoadingIndicator, ProgressBar, IndeterminateProgressBar
 # Make sure to import Colors
 from .colors import ColorScheme, colorize, supports_color, Colors
 from .getch import getch
 from .exporters import export_comments_to_json, export_comments_to_csv
-
-
-sys.path.append("..")
+from .utils import create_session
 
 # Check for color support
 USE_COLORS = supports_color()
 
+# Kept-alive connections to the HN API, so fetching a thread's comments
+# doesn't pay a new handshake per item
+_SESSION = create_session()
+
+# Items fetched by fetch_item, shared by every view of the same thread
+_ITEM_CACHE = TTLCache(maxsize=ITEM_CACHE_SIZE, ttl=ITEM_CACHE_TTL)
+
+# Markup in comment HTML, matched in one pass: code blocks, paragraph and
+# line breaks, any other tag, and character references
+_COMMENT_MARKUP = re.compile(
+    r'<pre>(?:<code>)?(.*?)(?:</code>)?</pre>|<(p|br)\b[^>]*>|<[^>]*>|&#?\w+;',
+    re.DOTALL | re.IGNORECASE
+)
+
 
 class CommentSortOrder(Enum):
     """Enum for different comment sorting orders."""
@@ -37,17 +52,125 @@ class CommentSortOrder(Enum):
     DEFAULT = "default"  # Maintains the original API order/structure
 
 
-def fetch_item(item_id):
-    """Fetch a single item (story or comment) from the HackerNews API."""
-    url = URLS["item"].format(item_id)
+def clear_item_cache():
+    """Forget every item fetched so far, forcing the next lookups to hit the API."""
+    _ITEM_CACHE.clear()
+
+
+def fetch_item(item_id, refresh=False):
+    """
+    Fetch a single item (story or comment) from the HackerNews API.
+
+    Items are reused from a short-lived cache, so paging back and forth or
+    re-sorting a thread doesn't request the same comments again.
+
+    Args:
+        item_id: ID of the item to fetch
+        refresh: If True, skip the cache and fetch the current version,
+            as the live-update monitors do to spot new replies
+
+    Returns:
+        The item dictionary, or None if it couldn't be fetched
+    """
+    if not refresh:
+        item = _ITEM_CACHE.get(item_id)
+        if item is not None:
+            return item
+
+    url = item_url(item_id)
     try:
-        response = requests.get(url)
-        return response.json() if response.status_code == 200 else None
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
+        item = response.json() if response.status_code == 200 else None
     except requests.RequestException:
         return None
 
+    if item is not None:
+        _ITEM_CACHE.set(item_id, item)
+    return item
+
+
+def _comments_from_item_tree(nodes):
+    """
+    Convert the nested children of an Algolia item into HN API-shaped comments.
+
+    Deleted comments, which come back without an author, are dropped along
+    with their replies, as fetch_comment_tree does.
+
+    Args:
+        nodes: The 'children' list of an Algolia item
+
+    Returns:
+        List of comment dictionaries with 'kids' and 'children' fields
+    """
+    comments = []
+    stack = [(nodes, comments)]
+    while stack:
+        nodes, siblings = stack.pop()
+        for node in nodes:
+            if node.get('type') != 'comment' or not node.get('author'):
+                continue
+            children = node.get('children') or []
+            comment = {
+                'id': node['id'],
+                'by': node['author'],
+                'text': node.get('text'),
+                'time': node.get('created_at_i'),
+                'parent': node.get('parent_id'),
+                'type': 'comment',
+                'kids': [child['id'] for child in children],
+                'children': [],
+            }
+            siblings.append(comment)
+            stack.append((children, comment['children']))
+    return comments
+
+
+def fetch_comment_tree_bulk(root_id, comment_ids=None):
+    """
+    Fetch the whole comment tree under an item in a single request.
+
+    Args:
+        root_id: ID of the story (or comment) whose replies to fetch
+        comment_ids: Optional IDs of the item's direct replies according to
+            the HN API, in its ranked order; the Algolia index can lag behind
+            new comments, so a tree missing any of them is treated as
+            unavailable, and the top-level comments are put in this order
+
+    Returns:
+        List of comment dictionaries with a 'children' field, or None if
+        the tree couldn't be fetched (or is stale) and the caller should
+        fall back to fetching item by item. Algolia doesn't know HN's
+        ranking, so replies below the top level keep Algolia's order.
+    """
+    url = URLS["item_tree"].format(root_id)
+    try:
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 200:
+            return None
+        item = response.json()
+    except (requests.RequestException, ValueError):
+        return None
+
+    if not isinstance(item, dict):
+        return None
 
-def fetch_comment_tree(comment_ids, max_threads=10, progress_callback=None):
+    children = item.get('children') or []
+    if comment_ids is not None:
+        # Deleted replies are still listed here, so only a lagging index misses an ID
+        indexed_ids = {child.get('id') for child in children}
+        if not indexed_ids.issuperset(comment_ids):
+            return None
+
+    comments = _comments_from_item_tree(children)
+    if comment_ids is not None:
+        # Show the top level in HN's ranked order, as the per-item walk does
+        rank = {comment_id: index for index, comment_id in enumerate(comment_ids)}
+        comments.sort(key=lambda comment: rank.get(comment['id'], len(rank)))
+    return comments
+
+
+def fetch_comment_tree(comment_ids, max_threads=10, progress_callback=None, root_id=None,
+                       refresh=False):
     """
     Fetch all comments for the given comment IDs, including child comments.
     Returns a list of comment dictionaries with a 'children' field.
@@ -56,53 +179,59 @@ def fetch_comment_tree(comment_ids, max_threads=10, progress_callback=None):
         comment_ids: List of comment IDs to fetch
         max_threads: Maximum number of concurrent requests
         progress_callback: Callback function to update progress
+        root_id: Optional ID of the item the comments reply to; when given,
+            the whole tree is first requested at once with fetch_comment_tree_bulk
+        refresh: If True, fetch every comment again instead of using cached ones
     """
     if not comment_ids:
         return []
 
+    if root_id is not None:
+        comments = fetch_comment_tree_bulk(root_id, comment_ids)
+        if comments is not None:
+            if progress_callback:
+                progress_callback(100)
+            return comments
+
     comments = []
     id_to_comment = {}
 
-    # Queue to track comment IDs to fetch
-    queue = list(comment_ids)
-    processed_ids = set()
+    # Comment IDs of the tree level being fetched, in API order
+    level = list(dict.fromkeys(comment_ids))
+    processed_ids = set(level)
 
     # Estimate total operations for progress tracking
     if progress_callback:
-        # Initial queue + potential child comments (estimate)
+        # Initial level + potential child comments (estimate)
         # Rough estimate assuming 50% have children
-        estimated_total = len(queue) * 1.5
+        estimated_total = len(level) * 1.5
         current_progress = 0
         progress_callback(0)  # Initialize progress to 0
 
-    while queue:
-        batch = [item_id for item_id in queue[:max_threads]
-                 if item_id not in processed_ids]
-        queue = queue[len(batch):]
-
-        if not batch:
-            continue
-
-        with ThreadPoolExecutor(max_workers=max_threads) as executor:
-            futures = {executor.submit(
-                fetch_item, item_id): item_id for item_id in batch}
+    fetch = partial(fetch_item, refresh=True) if refresh else fetch_item
 
-            for future in as_completed(futures):
-                item_id = futures[future]
-                processed_ids.add(item_id)
+    # Fetch the tree one level at a time, all siblings of a level in parallel
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        while level:
+            futures = [executor.submit(fetch, item_id) for item_id in level]
+            next_level = []
 
+            # Results are read in submission order so children keep the API order
+            for item_id, future in zip(level, futures):
                 try:
                     comment = future.result()
                     if not comment or comment.get('deleted', False) or comment.get('dead', False):
                         continue
 
-                    # Initialize children list
-                    comment['children'] = []
+                    # Copy with an empty children list, leaving the cached item untouched
+                    comment = {**comment, 'children': []}
                     id_to_comment[item_id] = comment
 
-                    # Add any child comments to the queue
-                    if 'kids' in comment and comment['kids']:
-                        queue.extend(comment['kids'])
+                    # Queue any unseen child comments for the next level
+                    for kid_id in comment.get('kids') or ():
+                        if kid_id not in processed_ids:
+                            processed_ids.add(kid_id)
+                            next_level.append(kid_id)
 
                     # Update progress
                     if progress_callback:
@@ -117,6 +246,8 @@ def fetch_comment_tree(comment_ids, max_threads=10, progress_callback=None):
                         error_msg = colorize(error_msg, ColorScheme.ERROR)
                     print(error_msg)
 
+            level = next_level
+
     # Build the comment tree
     for comment_id, comment in id_to_comment.items():
         # If this is a top-level comment, add it to the result
@@ -137,10 +268,16 @@ def fetch_comment_tree(comment_ids, max_threads=10, progress_callback=None):
     return comments
 
 
+def _comment_time(comment):
+    """Sort key for comments: their timestamp, with missing times sorting as 0."""
+    return comment.get('time', 0)
+
+
 def sort_comment_tree(comment_tree, sort_order=CommentSortOrder.DEFAULT, progress_callback=None):
     """
     Sort the comment tree according to the given sort order.
-    This function recursively sorts all levels of the tree.
+    Every level of the tree is sorted, walking it with an explicit stack so
+    deep reply chains can't hit the recursion limit.
 
     Args:
         comment_tree: List of comments to sort
@@ -159,14 +296,29 @@ def sort_comment_tree(comment_tree, sort_order=CommentSortOrder.DEFAULT, progres
     if progress_callback:
         progress_callback(0)  # Initialize progress
 
-    def sort_level(comments, level=0):
-        nonlocal processed
+    if sort_order == CommentSortOrder.NEWEST_FIRST:
+        # Sort by timestamp, newest first
+        reverse = True
+    elif sort_order == CommentSortOrder.OLDEST_FIRST:
+        # Sort by timestamp, oldest first
+        reverse = False
+    else:
+        # Default: maintain API order
+        reverse = None
 
-        # First, sort all children recursively
-        for i, comment in enumerate(comments):
-            if comment.get('children'):
-                comment['children'] = sort_level(
-                    comment['children'], level + 1)
+    def sort_level(comments):
+        if reverse is None:
+            return comments
+        return sorted(comments, key=_comment_time, reverse=reverse)
+
+    result = sort_level(comment_tree)
+    levels = [result]
+    while levels:
+        for comment in levels.pop():
+            children = comment.get('children')
+            if children:
+                comment['children'] = sort_level(children)
+                levels.append(comment['children'])
 
             # Update progress after processing each comment
             if progress_callback:
@@ -175,19 +327,6 @@ def sort_comment_tree(comment_tree, sort_order=CommentSortOrder.DEFAULT, progres
                     int((processed / total_comments) * 100), 99)
                 progress_callback(progress_percent)
 
-        # Then sort this level
-        if sort_order == CommentSortOrder.NEWEST_FIRST:
-            # Sort by timestamp, newest first
-            return sorted(comments, key=lambda c: c.get('time', 0), reverse=True)
-        elif sort_order == CommentSortOrder.OLDEST_FIRST:
-            # Sort by timestamp, oldest first
-            return sorted(comments, key=lambda c: c.get('time', 0))
-        else:
-            # Default: maintain API order
-            return comments
-
-    result = sort_level(comment_tree)
-
     # Final progress update to 100%
     if progress_callback:
         progress_callback(100)
@@ -208,31 +347,31 @@ def format_timestamp(unix_time):
         return colorize("Unknown time", ColorScheme.TIME) if USE_COLORS else "Unknown time"
 
 
+def _replace_comment_markup(match):
+    """Return the plain text for one piece of markup matched by _COMMENT_MARKUP."""
+    code, tag = match.group(1, 2)
+    if code is not None:
+        # Indent code blocks, decoding any markup inside them, and end them
+        # on their own line so following text doesn't run into the code
+        code = _COMMENT_MARKUP.sub(_replace_comment_markup, code).rstrip('\n')
+        return '\n\n' + textwrap.indent(code, '    ') + '\n'
+    if tag:
+        return '\n\n' if tag.lower() == 'p' else '\n'
+    markup = match.group(0)
+    if markup[0] == '&':
+        return html.unescape(markup)
+    return ''
+
+
 def clean_comment_text(text):
     """Clean and format comment text for display."""
     if not text:
         return "[No content]"
 
-    # Decode HTML entities
-    text = html.unescape(text)
-
-    # Replace some HTML tags with plain text alternatives
-    text = text.replace('<p>', '\n\n')
-    text = text.replace('<i>', '_').replace('</i>', '_')
-    text = text.replace('<b>', '*').replace('</b>', '*')
-    text = text.replace('<code>', '`').replace('</code>', '`')
-    text = text.replace('<pre>', '\n```\n').replace('</pre>', '\n```\n')
-
-    # Remove other HTML tags
-    while '<' in text and '>' in text:
-        start = text.find('<')
-        end = text.find('>', start)
-        if start != -1 and end != -1:
-            text = text[:start] + text[end+1:]
-        else:
-            break
-
-    return text.strip()
+    # Decode entities and replace or drop tags in a single scan, so decoded
+    # text like "&lt;b&gt;" is never mistaken for a tag. Only newlines are
+    # trimmed from the start so a leading code block keeps its indent
+    return _COMMENT_MARKUP.sub(_replace_comment_markup, text).lstrip('\n').rstrip()
 
 
 def format_comment(comment, indent_level=0, width=80):
@@ -408,9 +547,15 @@ def count_comment_tree(comments):
     if not comments:
         return 0
 
-    count = len(comments)
-    for comment in comments:
-        count += count_comment_tree(comment.get('children', []))
+    count = 0
+    levels = [comments]
+    while levels:
+        level = levels.pop()
+        count += len(level)
+        for comment in level:
+            children = comment.get('children')
+            if children:
+                levels.append(children)
 
     return count
 
@@ -752,7 +897,8 @@ def display_comments_for_story(story_id, page_size=10, page_num=1, width=80,
         comment_tree = fetch_comment_tree(
             comment_ids,
             max_threads=10,
-            progress_callback=progress_bar.update
+            progress_callback=progress_bar.update,
+            root_id=story_id
         )
     finally:
         progress_bar.stop()
@@ -1189,7 +1335,7 @@ class BackgroundCommentFetcher:
         
         try:
             # Fetch the story first
-            self.story = fetch_item(self.story_id)
+            self.story = fetch_item(self.story_id, refresh=True)
             self._update_refresh_status(True, 20)
             
             if not self.story:
@@ -1204,7 +1350,8 @@ class BackgroundCommentFetcher:
                 
             # Fetch the initial comment tree
             self.comment_tree = fetch_comment_tree(comment_ids, progress_callback=lambda p: 
-                                                  self._update_refresh_status(True, 40 + int(p * 0.5)))
+                                                  self._update_refresh_status(True, 40 + int(p * 0.5)),
+                                                  refresh=True)
             self.total_comments = count_comment_tree(self.comment_tree)
             self._update_refresh_status(True, 95)
             
@@ -1237,7 +1384,7 @@ class BackgroundCommentFetcher:
                 self._update_refresh_status(True, 0)
                     
                 # Fetch the story again to get updated comment IDs
-                updated_story = fetch_item(self.story_id)
+                updated_story = fetch_item(self.story_id, refresh=True)
                 self._update_refresh_status(True, 20)
                 
                 if not updated_story:
@@ -1258,7 +1405,8 @@ class BackgroundCommentFetcher:
                 
                 updated_tree = fetch_comment_tree(
                     current_comment_ids,
-                    progress_callback=progress_callback
+                    progress_callback=progress_callback,
+                    refresh=True
                 )
                 self._update_refresh_status(True, 90)
                 
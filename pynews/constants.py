@@ -2,6 +2,25 @@ import multiprocessing
 
 DEFAULT_THREADS_NUMBER = multiprocessing.cpu_count()
 
+# Connections kept alive per host by the shared HTTP sessions; large enough
+# that the thread pools fanning out item requests don't exhaust it
+HTTP_POOL_SIZE = max(DEFAULT_THREADS_NUMBER, 32)
+
+# Seconds to wait for the HN API before giving up on a request
+REQUEST_TIMEOUT = 10
+
+# Fetched items are reused for this many seconds across menu rebuilds,
+# re-sorts and filter changes before being requested again
+ITEM_CACHE_TTL = 300
+
+ITEM_CACHE_SIZE = 4096
+
+# User records are shared by the profile, karma, creation date and submissions
+# lookups; they change more often than items, so they're kept for less time
+USER_CACHE_TTL = 60
+
+USER_CACHE_SIZE = 256
+
 URL_NEWS_STORIES = "https://hacker-news.firebaseio.com/v0/newstories.json"
 
 URL_TOP_STORIES = "https://hacker-news.firebaseio.com/v0/topstories.json"
@@ -12,10 +31,17 @@ URL_JOB_STORIES = "https://hacker-news.firebaseio.com/v0/jobstories.json"
 
 URL_POLL_STORIES = "https://hacker-news.firebaseio.com/v0/topstories.json"  # Using topstories as a source for polls
 
-URL_ITEM = "https://hacker-news.firebaseio.com/v0/item/{}.json"
+ITEM_URL_PREFIX = "https://hacker-news.firebaseio.com/v0/item/"
+
+ITEM_URL_SUFFIX = ".json"
+
+URL_ITEM = ITEM_URL_PREFIX + "{}" + ITEM_URL_SUFFIX
 
 URL_USER = "https://hacker-news.firebaseio.com/v0/user/{}.json"
 
+# Algolia's HN mirror returns an item with its whole comment tree nested in one response
+URL_ITEM_TREE = "https://hn.algolia.com/api/v1/items/{}"
+
 URLS = {
     "top": URL_TOP_STORIES, 
     "news": URL_NEWS_STORIES, 
@@ -23,5 +49,11 @@ URLS = {
     "job": URL_JOB_STORIES, 
     "poll": URL_POLL_STORIES, 
     "item": URL_ITEM,
+    "item_tree": URL_ITEM_TREE,
     "user": URL_USER
-}
\ No newline at end of file
+}
+
+
+def item_url(item_id):
+    """Return the API URL of an item without re-parsing URL_ITEM for every request."""
+    return f"{ITEM_URL_PREFIX}{item_id}{ITEM_URL_SUFFIX}"
@@ -15,21 +15,30 @@ import threading
 import queue
 from .comments import BackgroundCommentFetcher, display_comments_for_story, fetch_item, format_timestamp
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from .colors import Colors, ColorScheme, colorize, supports_color
 from .getch import getch
-from .utils import get_story, get_stories, format_time_ago
+from .utils import compile_keyword_pattern, get_story, get_stories, format_time_ago
 from .loading import LoadingIndicator
 
 USE_COLORS = supports_color()
 
+# Escape sequences around highlighted keywords, built once
+_HIGHLIGHT_ON = ColorScheme.HIGHLIGHT
+_HIGHLIGHT_OFF = Colors.RESET
+
 def clear_screen():
     """Clear the terminal screen."""
     os.system('cls' if os.name == 'nt' else 'clear')
 
+@lru_cache(maxsize=1024)
 def format_absolute_date(timestamp):
     """
     Format a Unix timestamp as an absolute date string.
     
+    Results are cached, since every repaint of the listing formats the
+    same job timestamps again.
+    
     Args:
         timestamp: Unix timestamp (seconds since epoch)
         
@@ -118,6 +127,31 @@ def extract_company_name(title):
     # Fallback: Couldn't extract a company
     return None, title
 
+def _load_jobs(job_ids):
+    """
+    Fetch job listings in parallel and add their company, position and search text.
+    
+    Args:
+        job_ids: IDs of the job stories to fetch
+        
+    Returns:
+        List of job dictionaries in the order of job_ids, skipping IDs that returned nothing
+    """
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        fetched = list(executor.map(get_story, job_ids))
+    
+    jobs = []
+    for job in fetched:
+        if job:  # Make sure we have a valid job
+            # Extract company name and add to job data
+            company, position = extract_company_name(job.get('title', ''))
+            job['company'] = company
+            job['position'] = position
+            # Lowercased title and text for case-insensitive keyword filtering
+            job['search_text'] = f"{job.get('title', '')} {job.get('text', '')}".lower()
+            jobs.append(job)
+    return jobs
+
 def filter_jobs_by_company(jobs, company_name, case_sensitive=False):
     """
     Filter job listings to show only those from a specific company.
@@ -170,36 +204,72 @@ def filter_jobs_by_keywords(jobs, keywords, match_all=False, case_sensitive=Fals
     
     filtered_jobs = []
     
+    # Prepare the keywords once for the whole list
+    if not case_sensitive:
+        search_keywords = [k.lower() for k in keywords]
+    else:
+        search_keywords = keywords
+    
     for job in jobs:
-        title = job.get('title', '')
-        text = job.get('text', '')
-        
-        # Combine title and text for searching
-        content = title + ' ' + text
+        # Jobs from _load_jobs carry their lowercased search text already
+        content = None if case_sensitive else job.get('search_text')
+        if content is None:
+            # Combine title and text for searching
+            content = job.get('title', '') + ' ' + job.get('text', '')
+            
+            # For case-insensitive search, convert to lowercase
+            if not case_sensitive:
+                content = content.lower()
         
-        # For case-insensitive search, convert to lowercase
-        if not case_sensitive:
-            content = content.lower()
-            search_keywords = [k.lower() for k in keywords]
+        # Check the keywords, stopping at the first miss (match_all) or hit (any)
+        if match_all:
+            keep = all(keyword in content for keyword in search_keywords)
         else:
-            search_keywords = keywords
-        
-        # Check if the keywords are in the content
-        matches = []
-        for keyword in search_keywords:
-            if keyword in content:
-                matches.append(True)
-            else:
-                matches.append(False)
+            keep = any(keyword in content for keyword in search_keywords)
         
-        # Determine if the job should be included based on matching strategy
-        if match_all and all(matches):
-            filtered_jobs.append(job)
-        elif not match_all and any(matches):
+        if keep:
             filtered_jobs.append(job)
     
     return filtered_jobs
 
+def _highlight_literal(text, keyword, case_sensitive, wrap):
+    """
+    Wrap every occurrence of one literal keyword using str.find.
+    
+    Returns None when lowercasing changes the text's length (some non-ASCII
+    characters do), since match offsets would then no longer line up; the
+    caller falls back to the regex path in that case.
+    """
+    if case_sensitive:
+        haystack, needle = text, keyword
+    else:
+        haystack, needle = text.lower(), keyword.lower()
+        if len(haystack) != len(text):
+            return None
+    
+    size = len(needle)
+    parts = []
+    pos = 0
+    index = haystack.find(needle)
+    while index != -1:
+        parts.append(text[pos:index])
+        parts.append(wrap(text[index:index + size]))
+        pos = index + size
+        index = haystack.find(needle, pos)
+    
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return "".join(parts)
+
+def _wrap_highlight_color(match):
+    """Wrap a keyword match in the highlight color."""
+    return f"{_HIGHLIGHT_ON}{match}{_HIGHLIGHT_OFF}"
+
+def _wrap_highlight_plain(match):
+    """Wrap a keyword match in asterisks."""
+    return f"*{match}*"
+
 def highlight_keywords(text, keywords, case_sensitive=False):
     """
     Highlight keywords in text by adding formatting or markers.
@@ -215,28 +285,20 @@ def highlight_keywords(text, keywords, case_sensitive=False):
     if not text or not keywords or not any(keywords):
         return text
     
-    # For each keyword, highlight it in the text
-    highlighted_text = text
-    for keyword in keywords:
-        if not keyword:
-            continue
-            
-        # Create regex pattern based on case sensitivity
-        if case_sensitive:
-            pattern = re.compile(f'({re.escape(keyword)})')
-        else:
-            pattern = re.compile(f'({re.escape(keyword)})', re.IGNORECASE)
-            
-        # Apply highlighting
-        if USE_COLORS:
-            highlighted_text = pattern.sub(
-                lambda m: colorize(m.group(0), Colors.BRIGHT_YELLOW + Colors.BOLD), 
-                highlighted_text
-            )
-        else:
-            highlighted_text = pattern.sub(r'*\1*', highlighted_text)
-            
-    return highlighted_text
+    wrap = _wrap_highlight_color if USE_COLORS else _wrap_highlight_plain
+    
+    terms = tuple(k for k in keywords if k)
+    
+    # A single keyword is a plain literal, so scan for it without a regex
+    if len(terms) == 1:
+        highlighted = _highlight_literal(text, terms[0], case_sensitive, wrap)
+        if highlighted is not None:
+            return highlighted
+    
+    # One pattern for all keywords, compiled once per keyword set, applied in
+    # a single pass that keeps the matched text's casing
+    pattern = compile_keyword_pattern(terms, case_sensitive)
+    return pattern.sub(lambda m: wrap(m.group(0)), text)
 
 def sort_jobs_by_date(jobs, newest_first=True):
     """
@@ -361,15 +423,7 @@ def display_job_listings(limit=20, page_size=10, sort_newest_first=True, sort_by
     loader = LoadingIndicator(message="Loading job details...")
     loader.start()
     try:
-        jobs = []
-        for job_id in job_ids[:min(limit * 3, len(job_ids))]:  # Fetch more to allow for filtering
-            job = get_story(job_id)
-            if job:  # Make sure we have a valid job
-                # Extract company name and add to job data
-                company, position = extract_company_name(job.get('title', ''))
-                job['company'] = company
-                job['position'] = position
-                jobs.append(job)
+        jobs = _load_jobs(job_ids[:min(limit * 3, len(job_ids))])  # Fetch more to allow for filtering
     finally:
         loader.stop()
     
@@ -749,17 +803,10 @@ def display_job_listings(limit=20, page_size=10, sort_newest_first=True, sort_by
                         current_keywords = new_keywords
                         
                         # Reload all jobs and apply all filters
-                        jobs = []
                         loader = LoadingIndicator(message="Applying keyword filter...")
                         loader.start()
                         try:
-                            for job_id in job_ids[:min(limit * 3, len(job_ids))]:
-                                job = get_story(job_id)
-                                if job:
-                                    company, position = extract_company_name(job.get('title', ''))
-                                    job['company'] = company
-                                    job['position'] = position
-                                    jobs.append(job)
+                            jobs = _load_jobs(job_ids[:min(limit * 3, len(job_ids))])
                                     
                             #  Apply all active filters
                             jobs = filter_jobs_by_keywords(
@@ -794,17 +841,10 @@ def display_job_listings(limit=20, page_size=10, sort_newest_first=True, sort_by
                             current_keywords = []
                                 
                             # Reload all jobs again without keyword filter
-                            jobs = []
                             loader = LoadingIndicator(message="Reloading jobs...")
                             loader.start()
                             try:
-                                for job_id in job_ids[:min(limit * 3, len(job_ids))]:
-                                    job = get_story(job_id)
-                                    if job:
-                                        company, position = extract_company_name(job.get('title', ''))
-                                        job['company'] = company
-                                        job['position'] = position
-                                        jobs.append(job)
+                                jobs = _load_jobs(job_ids[:min(limit * 3, len(job_ids))])
                                         
                                 # Apply remaining active filters
                                 if current_min_score is not None and current_min_score > 0:
@@ -846,14 +886,7 @@ def display_job_listings(limit=20, page_size=10, sort_newest_first=True, sort_by
             loader.start()
             try:
                 # Reload all jobs
-                jobs = []
-                for job_id in job_ids[:min(limit * 3, len(job_ids))]:
-                    job = get_story(job_id)
-                    if job:
-                        company, position = extract_company_name(job.get('title', ''))
-                        job['company'] = company
-                        job['position'] = position
-                        jobs.append(job)
+                jobs = _load_jobs(job_ids[:min(limit * 3, len(job_ids))])
                         
                 # Apply all filters with new match type
                 jobs = filter_jobs_by_keywords(
@@ -890,14 +923,7 @@ def display_job_listings(limit=20, page_size=10, sort_newest_first=True, sort_by
                 loader = LoadingIndicator(message="Reverting to previous filter...")
                 loader.start()
                 try:
-                    jobs = []
-                    for job_id in job_ids[:min(limit * 3, len(job_ids))]:
-                        job = get_story(job_id)
-                        if job:
-                            company, position = extract_company_name(job.get('title', ''))
-                            job['company'] = company
-                            job['position'] = position
-                            jobs.append(job)
+                    jobs = _load_jobs(job_ids[:min(limit * 3, len(job_ids))])
                             
                     # Re-apply all filters with original match type
                     jobs = filter_jobs_by_keywords(
@@ -959,17 +985,10 @@ def display_job_listings(limit=20, page_size=10, sort_newest_first=True, sort_by
                 if new_filter:
                     current_company_filter = new_filter
                     # Reload all jobs and apply the filter
-                    jobs = []
                     loader = LoadingIndicator(message="Reloading job listings...")
                     loader.start()
                     try:
-                        for job_id in job_ids[:min(limit * 3, len(job_ids))]:
-                            job = get_story(job_id)
-                            if job:
-                                company, position = extract_company_name(job.get('title', ''))
-                                job['company'] = company
-                                job['position'] = position
-                                jobs.append(job)
+                        jobs = _load_jobs(job_ids[:min(limit * 3, len(job_ids))])
                     finally:
                         loader.stop()
                     
@@ -1020,17 +1039,10 @@ def display_job_listings(limit=20, page_size=10, sort_newest_first=True, sort_by
                             current_min_score = new_min_score
                             
                             # Reload all jobs and apply the filter
-                            jobs = []
                             loader = LoadingIndicator(message="Reloading job listings...")
                             loader.start()
                             try:
-                                for job_id in job_ids[:min(limit * 3, len(job_ids))]:
-                                    job = get_story(job_id)
-                                    if job:
-                                        company, position = extract_company_name(job.get('title', ''))
-                                        job['company'] = company
-                                        job['position'] = position
-                                        jobs.append(job)
+                                jobs = _load_jobs(job_ids[:min(limit * 3, len(job_ids))])
                             finally:
                                 loader.stop()
                             
@@ -1087,17 +1099,10 @@ def display_job_listings(limit=20, page_size=10, sort_newest_first=True, sort_by
             current_keywords = []
             
             # Reload all jobs without filtering
-            jobs = []
             loader = LoadingIndicator(message="Reloading job listings...")
             loader.start()
             try:
-                for job_id in job_ids[:min(limit, len(job_ids))]:
-                    job = get_story(job_id)
-                    if job:
-                        company, position = extract_company_name(job.get('title', ''))
-                        job['company'] = company
-                        job['position'] = position
-                        jobs.append(job)
+                jobs = _load_jobs(job_ids[:min(limit, len(job_ids))])
             finally:
                 loader.stop()
             
@@ -1272,7 +1277,7 @@ class JobMonitor:
             self.job_ids.add(job_id)
             
             # Fetch initial data for this job
-            job = fetch_item(job_id)
+            job = fetch_item(job_id, refresh=True)
             if job:
                 comment_count = len(job.get('kids', []))
                 
@@ -1339,7 +1344,7 @@ class JobMonitor:
         """Fetch initial data for all jobs in the monitor."""
         with self.job_data_lock:
             for job_id in list(self.job_ids):
-                job = fetch_item(job_id)
+                job = fetch_item(job_id, refresh=True)
                 if not job:
                     self.job_ids.remove(job_id)
                     continue
@@ -1376,7 +1381,7 @@ class JobMonitor:
                     if not self.running:  # Check if we should exit
                         break
                         
-                    updated_job = fetch_item(job_id)
+                    updated_job = fetch_item(job_id, refresh=True)
                     if not updated_job:
                         continue
                         
@@ -1667,7 +1672,7 @@ def browse_job_listings_for_dashboard(monitor):
         loading_indicator.stop()
     
     # Sort by comment count (most commented first)
-    jobs_with_comments.sort(key=lambda j: len(j.get('kids', [])), reverse=True)
+    jobs_with_comments.sort(key=lambda j: len(j.get('kids') or ()), reverse=True)
     
     # Display paginated list with selection interface
     selected_jobs = []
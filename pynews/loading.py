@@ -2,13 +2,15 @@
 Loading indicator functionality for PyNews CLI.
 """
 import sys
-import time
 import threading
 import shutil
 from itertools import cycle
 
 from .colors import ColorScheme, colorize, supports_color
 
+# Check if terminal supports colors
+USE_COLORS = supports_color()
+
 class LoadingIndicator:
     """
     A simple loading indicator that shows animation while a process is running.
@@ -24,8 +26,9 @@ class LoadingIndicator:
         self.message = message
         self.animation = animation or ['⣾', '⣷', '⣯', '⣟', '⡿', '⢿', '⣻', '⣽']
         self._running = False
+        self._stop_event = threading.Event()
         self._thread = None
-        self.use_colors = supports_color()
+        self.use_colors = USE_COLORS
     
     def _animate(self):
         """Animation loop that runs in a separate thread."""
@@ -41,7 +44,8 @@ class LoadingIndicator:
             display_char = colorize(char, ColorScheme.LOADING) if self.use_colors else char
             sys.stdout.write(f"\r{display_message} {display_char}")
             sys.stdout.flush()
-            time.sleep(0.1)
+            # Wait for the next frame, waking at once when stop() is called
+            self._stop_event.wait(0.1)
         
         # Clear the line when done
         sys.stdout.write(f"\r{' ' * (len(self.message) + 10)}\r")
@@ -54,6 +58,7 @@ class LoadingIndicator:
             return
             
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._animate)
         self._thread.daemon = True  # Thread will exit when main program exits
         self._thread.start()
@@ -61,6 +66,7 @@ class LoadingIndicator:
     def stop(self):
         """Stop the loading animation."""
         self._running = False
+        self._stop_event.set()
         if self._thread is not None and self._thread.is_alive():
             self._thread.join(timeout=0.5)
 
@@ -79,9 +85,10 @@ class ProgressBar:
         self.fill = fill
         self.print_end = print_end
         self._running = False
+        self._stop_event = threading.Event()
         self._thread = None
         self._value = 0
-        self.use_colors = supports_color()
+        self.use_colors = USE_COLORS
         
         # Get terminal width for better sizing
         self.term_width = shutil.get_terminal_size().columns
@@ -102,7 +109,8 @@ class ProgressBar:
                 self._print_progress()
                 last_value = self._value
             
-            time.sleep(0.1)
+            # Wait for the next frame, waking at once when stop() is called
+            self._stop_event.wait(0.1)
             
         # Print a newline when done
         sys.stdout.write('\n')
@@ -134,6 +142,7 @@ class ProgressBar:
             return
             
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._animate)
         self._thread.daemon = True
         self._thread.start()
@@ -144,6 +153,7 @@ class ProgressBar:
     def stop(self):
         """Stop the progress bar animation."""
         self._running = False
+        self._stop_event.set()
         if self._thread is not None and self._thread.is_alive():
             self._thread.join(timeout=0.5)
         
@@ -6,6 +6,7 @@ import html
 import datetime
 import sys
 import textwrap
+from functools import lru_cache
 from webbrowser import open as url_open
 
 from .colors import Colors, ColorScheme, colorize, supports_color
@@ -23,6 +24,7 @@ def clear_screen():
     """Clear the terminal screen."""
     os.system('cls' if os.name == 'nt' else 'clear')
 
+@lru_cache(maxsize=1024)
 def format_timestamp(unix_time):
     """Convert Unix timestamp to a human-readable format."""
     try:
@@ -7,7 +7,8 @@ import requests as req
 
 from .constants import DEFAULT_THREADS_NUMBER
 from .parser import get_parser_options
-from .utils import create_list_stories, create_menu, get_stories, filter_stories_by_keywords
+from .loading import with_loading
+from .utils import create_list_stories, create_menu, get_stories, filter_stories_by_keywords, iter_list_stories
 from .comments import display_comments_for_story
 from .ask_view import display_ask_discussions_dashboard, display_ask_story_details, display_top_scored_ask_stories
 from .job_view import display_job_details_with_live_comments, display_job_listings, display_jobs_discussion_dashboard
@@ -522,16 +523,25 @@ def main():
         options.threads if options.threads or 0 > 0 else DEFAULT_THREADS_NUMBER
     )
 
-    list_dict_stories = create_list_stories(
-        list_data, param[0], options.shuffle, max_threads
-    )
+    # Ask stories are filtered and sorted, which needs all of them first; other
+    # types are added to the menu as they arrive while the rest still load
+    if param[1] == "ask":
+        list_dict_stories = create_list_stories(
+            list_data, param[0], options.shuffle, max_threads
+        )
+        build_menu = create_menu
+    else:
+        list_dict_stories = iter_list_stories(
+            list_data, param[0], options.shuffle, max_threads
+        )
+        build_menu = with_loading(create_menu)
     
     # For Ask stories, we can sort by score (default), comments, or time
     sort_by_comments = param[1] == "ask" and options.sort_by_comments
     sort_by_time = param[1] == "ask" and options.sort_by_time
     
     # Create the menu with appropriate sorting and keyword filtering
-    menu = create_menu(
+    menu = build_menu(
         list_dict_stories, 
         param[1], 
         sort_by_score=not (sort_by_comments or sort_by_time),
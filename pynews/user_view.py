@@ -6,23 +6,34 @@ import html
 import datetime
 import textwrap
 import sys
-import requests
 import time
 from webbrowser import open as url_open
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 from .colors import Colors, colorize, supports_color
 from .getch import getch
-from .constants import URLS
+from .cache import TTLCache
+from .constants import REQUEST_TIMEOUT, URLS, USER_CACHE_SIZE, USER_CACHE_TTL, item_url
 from .loading import LoadingIndicator
-from .utils import format_time_ago
+from .utils import create_session, format_time_ago
 
 USE_COLORS = supports_color()
 
+# Kept-alive connections to the HN API, so a user's submissions are fetched
+# without a new handshake per item
+_SESSION = create_session()
+
+# Users already fetched this session, keyed by username
+_USER_CACHE = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+
 def clear_screen():
     """Clear the terminal screen."""
     os.system('cls' if os.name == 'nt' else 'clear')
 
+def clear_user_cache():
+    """Forget every user fetched so far, forcing the next lookups to hit the API."""
+    _USER_CACHE.clear()
+
 def fetch_user(username):
     """
     Fetch user data from the HackerNews API.
@@ -33,15 +44,22 @@ def fetch_user(username):
     Returns:
         User data dictionary or None if user not found
     """
+    user_data = _USER_CACHE.get(username)
+    if user_data is not None:
+        return user_data
+    
     try:
         loader = LoadingIndicator(message=f"Fetching user '{username}'...")
         loader.start()
         
         url = URLS["user"].format(username)
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
-            return response.json()
+            user_data = response.json()
+            if user_data is not None:
+                _USER_CACHE.set(username, user_data)
+            return user_data
         else:
             print(f"Error: Failed to fetch user '{username}'. Status code: {response.status_code}")
             return None
@@ -62,8 +80,8 @@ def fetch_item(item_id):
         Item data dictionary or None if not found
     """
     try:
-        url = URLS["item"].format(item_id)
-        response = requests.get(url)
+        url = item_url(item_id)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
             return response.json()
@@ -88,14 +106,18 @@ def fetch_submissions(username, max_items=100):
         loader.start()
         
         # First, get the user data to get their submission IDs
-        url = URLS["user"].format(username)
-        response = requests.get(url)
-        
-        if response.status_code != 200:
-            print(f"Error: Failed to fetch user '{username}'. Status code: {response.status_code}")
-            return None
+        user_data = _USER_CACHE.get(username)
+        if user_data is None:
+            url = URLS["user"].format(username)
+            response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
             
-        user_data = response.json()
+            if response.status_code != 200:
+                print(f"Error: Failed to fetch user '{username}'. Status code: {response.status_code}")
+                return None
+                
+            user_data = response.json()
+            if user_data is not None:
+                _USER_CACHE.set(username, user_data)
         submission_ids = user_data.get('submitted', [])
         
         # Limit the number of submissions to fetch
@@ -113,13 +135,10 @@ def fetch_submissions(username, max_items=100):
         print(f"Fetching {total_ids} submissions for user {username}...")
         completed = 0
         
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            # Submit all fetch tasks
-            future_to_id = {executor.submit(fetch_item, item_id): item_id for item_id in submission_ids}
-            
-            # Process results as they complete
-            for future in as_completed(future_to_id):
-                submission = future.result()
+        with ThreadPoolExecutor(max_workers=min(10, total_ids)) as executor:
+            # map keeps the user's submission order (newest first) while the
+            # fetches run in parallel
+            for submission in executor.map(fetch_item, submission_ids):
                 if submission:
                     submissions.append(submission)
                 completed += 1
@@ -157,12 +176,10 @@ def categorize_submissions(submissions):
         'other': []
     }
     
+    # Unknown types fall into 'other' with a single dict lookup per item
+    other = categories['other']
     for item in submissions:
-        item_type = item.get('type', 'other')
-        if item_type in categories:
-            categories[item_type].append(item)
-        else:
-            categories['other'].append(item)
+        categories.get(item.get('type'), other).append(item)
             
     return categories
 
@@ -177,16 +194,22 @@ def fetch_karma(username, silent=False):
     Returns:
         Karma value (int) or None if user not found
     """
+    user_data = _USER_CACHE.get(username)
+    if user_data is not None:
+        return user_data.get('karma', 0)
+    
     try:
         if not silent:
             loader = LoadingIndicator(message=f"Fetching karma for '{username}'...")
             loader.start()
             
         url = URLS["user"].format(username)
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
             user_data = response.json()
+            if user_data is not None:
+                _USER_CACHE.set(username, user_data)
             return user_data.get('karma', 0)
         else:
             if not silent:
@@ -211,16 +234,22 @@ def fetch_created_timestamp(username, silent=False):
     Returns:
         Creation timestamp (int) or None if user not found
     """
+    user_data = _USER_CACHE.get(username)
+    if user_data is not None:
+        return user_data.get('created', None)
+    
     try:
         if not silent:
             loader = LoadingIndicator(message=f"Fetching account creation date for '{username}'...")
             loader.start()
             
         url = URLS["user"].format(username)
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
             user_data = response.json()
+            if user_data is not None:
+                _USER_CACHE.set(username, user_data)
             return user_data.get('created', None)
         else:
             if not silent:
@@ -624,13 +653,12 @@ def format_account_age(created_at):
         return "Unknown"
         
     try:
-        created_date = datetime.datetime.fromtimestamp(created_at)
-        now = datetime.datetime.now()
-        delta = now - created_date
+        # Whole days since the account was created
+        age_days = int(time.time() - created_at) // 86400
         
-        years = delta.days // 365
-        months = (delta.days % 365) // 30
-        days = (delta.days % 365) % 30
+        years = age_days // 365
+        months = (age_days % 365) // 30
+        days = (age_days % 365) % 30
         
         if years > 0:
             return f"{years} year{'s' if years != 1 else ''}, {months} month{'s' if months != 1 else ''}"
@@ -750,20 +778,24 @@ def fetch_random_users(count=10):
         
         # First get some top stories
         url = URLS["top"]
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
         stories = response.json()
         
         # Now get the submitters from these stories
         users = set()  # Use a set to avoid duplicates
-        for story_id in stories[:min(50, len(stories))]:  # Check up to 50 stories
-            if len(users) >= count:
-                break
+        story_ids = stories[:min(50, len(stories))]  # Check up to 50 stories
+        batch_size = max(count, 1)
+        
+        # Fetch the stories a batch at a time in parallel, stopping as soon as
+        # a batch brings the number of submitters up to count
+        with ThreadPoolExecutor(max_workers=min(10, batch_size)) as executor:
+            for start in range(0, len(story_ids), batch_size):
+                if len(users) >= count:
+                    break
                 
-            story_url = URLS["item"].format(story_id)
-            story_data = requests.get(story_url).json()
-            
-            if story_data and 'by' in story_data:
-                users.add(story_data['by'])
+                for story_data in executor.map(fetch_item, story_ids[start:start + batch_size]):
+                    if story_data and 'by' in story_data:
+                        users.add(story_data['by'])
         
         return list(users)[:count]
     except Exception as e:
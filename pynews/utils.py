@@ -1,27 +1,48 @@
 import html
 import random
-import sys
-import datetime
 import re
 import shutil
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
 from webbrowser import open as url_open
 
 import requests as req
+from requests.adapters import HTTPAdapter
 from alive_progress import alive_it
 from cursesmenu import CursesMenu
 from cursesmenu.items import FunctionItem
 
-from .constants import URLS
+from .cache import TTLCache
+from .constants import HTTP_POOL_SIZE, ITEM_CACHE_SIZE, ITEM_CACHE_TTL, REQUEST_TIMEOUT, URLS, item_url
 from .loading import with_loading, LoadingIndicator
 from .colors import Colors, colorize, supports_color
 
 
+def create_session(pool_size=HTTP_POOL_SIZE):
+    """
+    Return a requests session that keeps connections to the HN API alive.
+    
+    Reusing one session avoids a new TCP+TLS handshake per request, and the
+    pool is sized so parallel item fetches each get a kept-alive connection.
+    """
+    session = req.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=pool_size))
+    return session
+
+
+_SESSION = create_session()
+
+# Stories already fetched this session, keyed by item id
+_STORY_CACHE = TTLCache(maxsize=ITEM_CACHE_SIZE, ttl=ITEM_CACHE_TTL)
+
+
 def clean_title(title):
-    result = title.encode("utf-8")
-    if sys.version_info.major == 3:
-        result = result.decode()
-    return result
+    """Return the title as text, decoding it only if it arrived as bytes."""
+    if isinstance(title, str):
+        return title
+    return title.decode("utf-8", "replace")
 
 
 def get_stories(type_url):
@@ -29,7 +50,7 @@ def get_stories(type_url):
     loader = LoadingIndicator(message=f"Fetching {type_url} story IDs...")
     loader.start()
     try:
-        data = req.get(URLS[type_url])
+        data = _SESSION.get(URLS[type_url], timeout=REQUEST_TIMEOUT)
         return data.json()
     except Exception as e:
         print(f"Error fetching stories: {e}")
@@ -38,11 +59,25 @@ def get_stories(type_url):
         loader.stop()
 
 
+def clear_story_cache():
+    """Forget every story fetched so far, forcing the next lookups to hit the API."""
+    _STORY_CACHE.clear()
+
+
 def get_story(new):
-    """Return a story of the given ID."""
-    url = URLS["item"].format(new)
+    """
+    Return a story of the given ID, reusing it if it was fetched recently.
+    
+    Callers get a shallow copy, so fields the views add to a story (such as
+    the filters' lowercased text) never leak into the cached one.
+    """
+    story = _STORY_CACHE.get(new)
+    if story is not None:
+        return dict(story)
+    
+    url = item_url(new)
     try:
-        data = req.get(url)
+        data = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
     except req.ConnectionError:
         raise
     except req.Timeout:
@@ -53,7 +88,45 @@ def get_story(new):
             of maximum redirections."
         )
     else:
-        return data.json()
+        story = data.json()
+        if story is not None:
+            _STORY_CACHE.set(new, story)
+            story = dict(story)
+        return story
+
+
+def iter_stories_batch(ids, max_threads=None):
+    """
+    Yield the stories for a list of ids as soon as each one is available.
+    
+    The HN API has no multi-item endpoint, so uncached ids are still fetched
+    one request each, but concurrently over the shared keep-alive session.
+    Duplicate ids are fetched once, and cached stories are yielded without
+    waiting on the network.
+    
+    Args:
+        ids: Story ids to look up
+        max_threads: Maximum number of parallel requests for the uncached ids
+    
+    Yields:
+        Stories in the order of ids, skipping ids that returned nothing
+    """
+    ids = list(dict.fromkeys(ids))
+    cached = {}
+    missing = []
+    for story_id in ids:
+        story = _STORY_CACHE.get(story_id)
+        if story is not None:
+            cached[story_id] = dict(story)
+        else:
+            missing.append(story_id)
+    
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        futures = {story_id: executor.submit(get_story, story_id) for story_id in missing}
+        for story_id in ids:
+            story = cached[story_id] if story_id in cached else futures[story_id].result()
+            if story:
+                yield story
 
 
 def _create_list_stories_no_loading(list_id_stories, number_of_stories, shuffle, max_threads):
@@ -80,6 +153,20 @@ def _create_list_stories_no_loading(list_id_stories, number_of_stories, shuffle,
     return list_stories
 
 
+def iter_list_stories(list_id_stories, number_of_stories, shuffle, max_threads):
+    """
+    Yield the stories for each item of the list while the rest are still loading.
+    
+    Lets a consumer such as create_menu start working on the first stories
+    instead of waiting for the slowest request.
+    """
+    ids = list_id_stories[:number_of_stories]
+    if shuffle:
+        # The batch keeps the order of the ids, so shuffle those up front
+        ids = random.sample(ids, len(ids))
+    return iter_stories_batch(ids, max_threads)
+
+
 @with_loading
 def create_list_stories(list_id_stories, number_of_stories, shuffle, max_threads):
     """
@@ -87,21 +174,90 @@ def create_list_stories(list_id_stories, number_of_stories, shuffle, max_threads
     Now with loading indicator.
     """
     # Replace the alive_it progress bar with our loading indicator
-    list_stories = []
-    with ThreadPoolExecutor(max_workers=max_threads) as executor:
-        futures = {
-            executor.submit(get_story, new)
-            for new in list_id_stories[:number_of_stories]
-        }
+    return list(iter_list_stories(list_id_stories, number_of_stories, shuffle, max_threads))
 
-        for future in as_completed(futures):
-            result = future.result()
-            if result:  # Make sure we have a valid result
-                list_stories.append(result)
 
-    if shuffle:
-        random.shuffle(list_stories)
-    return list_stories
+def _story_blob(story, case_sensitive=False):
+    """
+    Return the searchable title and text of a story as a single string.
+
+    The lowercased form is cached on the story dict under ``_lc_blob`` so that
+    repeated case-insensitive filtering doesn't lowercase the same story again.
+    Title and text are separated by a newline so a keyword can't match across
+    the boundary.
+    """
+    if case_sensitive:
+        return story.get('title', '') + '\n' + story.get('text', '')
+    blob = story.get('_lc_blob')
+    if blob is None:
+        blob = (story.get('title', '') + '\n' + story.get('text', '')).lower()
+        story['_lc_blob'] = blob
+    return blob
+
+
+def _story_author_lc(story):
+    """Return the story's author in lowercase, cached on the dict under ``_by_lc``."""
+    author = story.get('_by_lc')
+    if author is None:
+        author = (story.get('by') or '').lower()
+        story['_by_lc'] = author
+    return author
+
+
+@lru_cache(maxsize=128)
+def _reduce_keywords(keywords, match_all):
+    """
+    Return the smallest set of keywords that decides a match, in scan order.
+    
+    When one keyword contains another, one of the two is redundant: for
+    match_all the contained one is implied by the longer one, otherwise the
+    longer one can never match without the contained one matching first.
+    match_all scans the longest keywords first since they're the likeliest
+    to miss; match-any scans the shortest first since they're the likeliest
+    to hit.
+    """
+    unique = sorted(set(keywords), key=len, reverse=match_all)
+    reduced = []
+    for keyword in unique:
+        if match_all:
+            redundant = any(keyword in kept for kept in reduced)
+        else:
+            redundant = any(kept in keyword for kept in reduced)
+        if not redundant:
+            reduced.append(keyword)
+    return tuple(reduced)
+
+
+@lru_cache(maxsize=128)
+def compile_keyword_pattern(keywords, case_sensitive=False):
+    """
+    Compile a single regex matching any of the given keywords literally.
+    
+    Longer keywords come first in the alternation so that when one keyword
+    contains another, the longer match wins. Compiled patterns are cached
+    per keyword tuple, so highlighting many stories compiles once.
+    
+    Args:
+        keywords: Tuple of non-empty keyword strings
+        case_sensitive: Whether matching should be case-sensitive
+    
+    Returns:
+        Compiled regular expression
+    """
+    alternation = '|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+    return re.compile(alternation, 0 if case_sensitive else re.IGNORECASE)
+
+
+def _matches_keywords(blob, keywords, match_all=False):
+    """
+    Check prepared keywords against a story blob.
+    
+    Stops as soon as the outcome is known: at the first miss when all
+    keywords must match, at the first hit otherwise.
+    """
+    if match_all:
+        return all(blob.find(keyword) != -1 for keyword in keywords)
+    return any(blob.find(keyword) != -1 for keyword in keywords)
 
 
 def filter_stories_by_keyword(stories, keyword, case_sensitive=False):
@@ -126,17 +282,11 @@ def filter_stories_by_keyword(stories, keyword, case_sensitive=False):
         keyword = keyword.lower()
         
     for story in stories:
-        # Get the title and text content
-        title = story.get('title', '')
-        text = story.get('text', '')
-        
-        # If case-insensitive search, convert to lowercase
-        if not case_sensitive:
-            title = title.lower()
-            text = text.lower()
+        # Title and text joined once; the lowercased blob is cached on the story
+        blob = _story_blob(story, case_sensitive)
             
         # Check if keyword is in title or text
-        if keyword in title or keyword in text:
+        if blob.find(keyword) != -1:
             filtered_stories.append(story)
             
     return filtered_stories
@@ -163,29 +313,13 @@ def filter_stories_by_keywords(stories, keywords, match_all=False, case_sensitiv
     # Prepare the keywords for search
     if not case_sensitive:
         keywords = [k.lower() for k in keywords]
+    keywords = _reduce_keywords(tuple(keywords), match_all)
     
     for story in stories:
-        # Get the title and text content
-        title = story.get('title', '')
-        text = story.get('text', '')
-        
-        # For case-insensitive search, convert to lowercase
-        if not case_sensitive:
-            title = title.lower()
-            text = text.lower()
-        
-        # Check if the keywords are in the title or text
-        matches = []
-        for keyword in keywords:
-            if keyword in title or keyword in text:
-                matches.append(True)
-            else:
-                matches.append(False)
+        # Title and text joined once; the lowercased blob is cached on the story
+        blob = _story_blob(story, case_sensitive)
         
-        # Determine if the story should be included based on matching strategy
-        if match_all and all(matches):
-            filtered_stories.append(story)
-        elif not match_all and any(matches):
+        if _matches_keywords(blob, keywords, match_all):
             filtered_stories.append(story)
     
     return filtered_stories
@@ -213,12 +347,11 @@ def filter_stories_by_author(stories, author, case_sensitive=False):
         author = author.lower()
     
     for story in stories:
-        # Get the author of the story
-        story_author = story.get('by', '')
-        
-        # For case-insensitive search, convert to lowercase
-        if not case_sensitive and story_author:
-            story_author = story_author.lower()
+        # Get the author of the story (lowercased once and cached when case-insensitive)
+        if case_sensitive:
+            story_author = story.get('by', '')
+        else:
+            story_author = _story_author_lc(story)
         
         # Check if the author matches
         if story_author == author:
@@ -227,18 +360,83 @@ def filter_stories_by_author(stories, author, case_sensitive=False):
     return filtered_stories
 
 
+def iter_filter_stories(stories, author=None, keywords=None, match_all=False, case_sensitive=False):
+    """
+    Yield the stories matching an author and keywords, one at a time.
+    
+    Equivalent to filter_stories_by_author followed by filter_stories_by_keywords,
+    but walks the stories once, skips the keyword search for stories whose
+    author already doesn't match, and lets a sort consume the matches
+    without an intermediate list.
+    
+    Args:
+        stories: Iterable of story dictionaries
+        author: Username to filter by (None to skip author filtering)
+        keywords: List of strings to search for (None to skip keyword filtering)
+        match_all: If True, all keywords must match; if False, any keyword can match
+        case_sensitive: Whether the comparisons should be case-sensitive
+    
+    Yields:
+        Stories matching both filters, in their original order
+    """
+    keywords = [k for k in keywords or () if k]
+    if not author and not keywords:
+        yield from stories
+        return
+    
+    # Prepare the author and keywords once for the whole list
+    if not case_sensitive:
+        author = author.lower() if author else author
+        keywords = [k.lower() for k in keywords]
+    keywords = _reduce_keywords(tuple(keywords), match_all)
+    
+    for story in stories:
+        if author:
+            if case_sensitive:
+                story_author = story.get('by', '')
+            else:
+                story_author = _story_author_lc(story)
+            if story_author != author:
+                continue
+        
+        if keywords and not _matches_keywords(_story_blob(story, case_sensitive), keywords, match_all):
+            continue
+        
+        yield story
+
+
+_SCORE_KEY = itemgetter('score')
+_TIME_KEY = itemgetter('time')
+
+
+def _sort_stories(stories, key, fallback_key, reverse):
+    """
+    Sort an iterable of stories into a new list.
+    
+    The C-level key is tried first; if a story lacks the field it raises
+    KeyError before any item has moved, and the list is sorted again with
+    the fallback key.
+    """
+    result = list(stories)
+    try:
+        result.sort(key=key, reverse=reverse)
+    except KeyError:
+        result.sort(key=fallback_key, reverse=reverse)
+    return result
+
+
 def sort_stories_by_score(stories, reverse=True):
     """
     Sort stories by their score (points).
     
     Args:
-        stories: List of story dictionaries
+        stories: Iterable of story dictionaries
         reverse: If True, sort in descending order (highest score first)
         
     Returns:
         Sorted list of stories
     """
-    return sorted(stories, key=lambda x: x.get('score', 0), reverse=reverse)
+    return _sort_stories(stories, _SCORE_KEY, lambda x: x.get('score', 0), reverse)
 
 
 def sort_stories_by_comments(stories, reverse=True):
@@ -246,13 +444,13 @@ def sort_stories_by_comments(stories, reverse=True):
     Sort stories by their comment count.
     
     Args:
-        stories: List of story dictionaries
+        stories: Iterable of story dictionaries
         reverse: If True, sort in descending order (most comments first)
         
     Returns:
         Sorted list of stories
     """
-    return sorted(stories, key=lambda x: len(x.get('kids', [])), reverse=reverse)
+    return sorted(stories, key=lambda x: len(x.get('kids') or ()), reverse=reverse)
 
 
 def sort_stories_by_time(stories, reverse=True):
@@ -260,64 +458,87 @@ def sort_stories_by_time(stories, reverse=True):
     Sort stories by their submission time.
     
     Args:
-        stories: List of story dictionaries
+        stories: Iterable of story dictionaries
         reverse: If True, sort in descending order (newest first)
         
     Returns:
         Sorted list of stories
     """
-    return sorted(stories, key=lambda x: x.get('time', 0), reverse=reverse)
+    return _sort_stories(stories, _TIME_KEY, lambda x: x.get('time', 0), reverse)
+
+
+_SORTERS = {
+    "score": sort_stories_by_score,
+    "comments": sort_stories_by_comments,
+    "time": sort_stories_by_time,
+}
+
+
+def filter_and_sort_stories(stories, sort_by="score", author=None, keywords=None,
+                            match_all=False, case_sensitive=False, reverse=True):
+    """
+    Filter stories by author and keywords and sort the matches in one pipeline.
+    
+    The filter runs lazily inside the sort, so the sorted result is the only
+    list that gets built.
+    
+    Args:
+        stories: Iterable of story dictionaries
+        sort_by: 'score', 'comments' or 'time'
+        author: Username to filter by (None to skip author filtering)
+        keywords: List of strings to search for (None to skip keyword filtering)
+        match_all: If True, all keywords must match; if False, any keyword can match
+        case_sensitive: Whether the comparisons should be case-sensitive
+        reverse: If True, sort in descending order
+    
+    Returns:
+        Sorted list of the matching stories
+    """
+    if sort_by not in _SORTERS:
+        raise ValueError(f"Unknown sort order: {sort_by}")
+    matching = iter_filter_stories(stories, author, keywords, match_all, case_sensitive)
+    return _SORTERS[sort_by](matching, reverse=reverse)
 
 
 def format_comment_count(count):
-    """Format comment count with visual indicators based on activity level."""
-    if count >= 100:
-        return f"💬 {count}"  # Very active discussion
-    elif count >= 50:
-        return f"💬 {count}"  # Active discussion
-    elif count >= 10:
-        return f"💬 {count}"  # Notable discussion
-    elif count > 0:
-        return f"💬 {count}"  # Some discussion
-    else:
-        return f"💬 0"  # No discussion yet
+    """Format comment count with a comment indicator."""
+    return f"💬 {count if count > 0 else 0}"
 
 
-def format_time_ago(timestamp):
+def format_time_ago(timestamp, now=None):
     """
     Format a Unix timestamp as a human-readable 'time ago' string.
     
     Args:
         timestamp: Unix timestamp (seconds since epoch)
+        now: Current Unix time to measure from (defaults to time.time())
         
     Returns:
         String like "5 min ago" or "3 days ago"
     """
     if not timestamp:
         return "Unknown time"
-        
-    # Convert to datetime
-    dt = datetime.datetime.fromtimestamp(timestamp)
-    now = datetime.datetime.now()
     
-    # Calculate the time difference
-    diff = now - dt
+    if now is None:
+        now = time.time()
+    
+    # Work on whole seconds rather than building datetime/timedelta objects
+    diff = int(now - timestamp)
+    days, seconds = divmod(diff, 86400)
     
     # Format the time ago string based on the difference
-    if diff.days > 365:
-        years = diff.days // 365
-        return f"{years}y ago"
-    elif diff.days > 30:
-        months = diff.days // 30
-        return f"{months}mo ago"
-    elif diff.days > 0:
-        return f"{diff.days}d ago"
-    elif diff.seconds > 3600:
-        hours = diff.seconds // 3600
-        return f"{hours}h ago"
-    elif diff.seconds > 60:
-        minutes = diff.seconds // 60
-        return f"{minutes}m ago"
+    if diff < 0:
+        return "just now"
+    elif days > 365:
+        return f"{days // 365}y ago"
+    elif days > 30:
+        return f"{days // 30}mo ago"
+    elif days > 0:
+        return f"{days}d ago"
+    elif seconds > 3600:
+        return f"{seconds // 3600}h ago"
+    elif seconds > 60:
+        return f"{seconds // 60}m ago"
     else:
         return "just now"
 
@@ -345,7 +566,8 @@ def create_menu(list_dict_stories, type_new, sort_by_score=True, sort_by_time=Fa
     Create a menu with the stories to display.
     
     Args:
-        list_dict_stories: List of story dictionaries
+        list_dict_stories: Iterable of story dictionaries (non-Ask stories are
+            added to the menu as the iterable yields them)
         type_new: Type of stories ('ask', 'top', 'news')
         sort_by_score: Whether to sort Ask HN stories by score
         sort_by_time: Whether to sort Ask HN stories by submission time
@@ -356,34 +578,35 @@ def create_menu(list_dict_stories, type_new, sort_by_score=True, sort_by_time=Fa
     """
     title = f"Pynews - {type_new.capitalize()} stories"
     
-    # Apply author filtering if specified
-    if author_filter and type_new == "ask":
-        original_count = len(list_dict_stories)
-        list_dict_stories = filter_stories_by_author(list_dict_stories, author_filter, case_sensitive=False)
-        filtered_count = len(list_dict_stories)
-        title = f"Pynews - {type_new.capitalize()} stories by '{author_filter}' ({filtered_count}/{original_count})"
-    
-    # Apply keyword filtering if keywords are provided
-    if keywords and any(keywords) and type_new == "ask":
+    # For Ask stories, filter by author and keywords and sort in one pipeline
+    if type_new == "ask":
+        has_keywords = bool(keywords) and any(keywords)
+        if not isinstance(list_dict_stories, list):
+            list_dict_stories = list(list_dict_stories)
         original_count = len(list_dict_stories)
-        list_dict_stories = filter_stories_by_keywords(list_dict_stories, keywords)
+        
+        # Sort based on the specified criteria
+        if sort_by_time:
+            sort_by = "time"
+        elif sort_by_score:
+            sort_by = "score"
+        else:
+            sort_by = "comments"
+        list_dict_stories = filter_and_sort_stories(
+            list_dict_stories,
+            sort_by,
+            author=author_filter,
+            keywords=keywords if has_keywords else None,
+        )
+        
         filtered_count = len(list_dict_stories)
-        if author_filter:
+        if author_filter and has_keywords:
             title = f"Pynews - {type_new.capitalize()} stories by '{author_filter}' with keywords ({filtered_count}/{original_count})"
-        else:
+        elif author_filter:
+            title = f"Pynews - {type_new.capitalize()} stories by '{author_filter}' ({filtered_count}/{original_count})"
+        elif has_keywords:
             title = f"Pynews - {type_new.capitalize()} stories (filtered: {filtered_count}/{original_count})"
-    
-    # For Ask stories, sort based on the specified criteria
-    if type_new == "ask":
-        if sort_by_time:
-            list_dict_stories = sort_stories_by_time(list_dict_stories)
-            title += " (sorted by time)"
-        elif sort_by_score:
-            list_dict_stories = sort_stories_by_score(list_dict_stories)
-            title += " (sorted by score)"
-        else:  # Sort by comments
-            list_dict_stories = sort_stories_by_comments(list_dict_stories)
-            title += " (sorted by comments)"
+        title += f" (sorted by {sort_by})"
     
     # Create the menu
     menu = CursesMenu(title, "Select the story and press enter")
@@ -396,37 +619,53 @@ def create_menu(list_dict_stories, type_new, sort_by_score=True, sort_by_time=Fa
     if title_width < 30:  # Minimum reasonable title width
         title_width = term_width - 20
     
+    # These don't change between stories, so resolve them once per menu
+    is_ask = type_new == "ask"
+    plain_width = term_width - 5
+    
+    # Bind the names used on every iteration to locals to skip repeated lookups
+    _append = menu.append_item
+    _FItem = FunctionItem
+    _open = url_open
+    _trunc = truncate_string
+    _fmt_time = format_time_ago
+    _now = time.time()
+    _clean = clean_title
+    
     # Process each story
     for story in list_dict_stories:
+        _get = story.get
         # Get the basic story information
-        story_title = clean_title(story.get("title", "Untitled"))
-        author = story.get("by", "Anonymous")
-        points = story.get("score", 0)
-        comment_count = len(story.get('kids', []))
-        time_ago = format_time_ago(story.get('time', 0))
+        story_title = _clean(_get("title", "Untitled"))
         
         # Format the display title - FIXED: Use single line format with truncated title
         # Removed all ANSI color codes and highlighting to fix encoding issues
-        if type_new == "ask":
+        if is_ask:
+            # Only Ask HN entries show metadata, so only look it up for them
+            author = _get("by", "Anonymous")
+            points = _get("score", 0)
+            comment_count = len(_get('kids') or ())
+            time_ago = _fmt_time(_get('time', 0), _now)
+            
             # Truncate title if needed to fit in the available width
-            truncated_title = truncate_string(story_title, title_width)
+            truncated_title = _trunc(story_title, title_width)
             
             # For Ask HN, format everything on one line to prevent display issues
             # Fixed the author display by removing all color/highlighting
             display_title = f"{truncated_title} - {points} pts, {comment_count} cmts, {time_ago}, by {author}"
         else:
             # For other story types, just use the title with reasonable truncation
-            display_title = truncate_string(story_title, term_width - 5)
+            display_title = _trunc(story_title, plain_width)
         
         # Create the menu item with appropriate URL
         if "url" in story and story["url"]:
-            item = FunctionItem(display_title, url_open, args=[story["url"]])
+            item = _FItem(display_title, _open, args=[story["url"]])
         else:
             # For self-posts that don't have a URL, use the HN link
-            hn_url = f"https://news.ycombinator.com/item?id={story.get('id')}"
-            item = FunctionItem(display_title, url_open, args=[hn_url])
+            hn_url = f"https://news.ycombinator.com/item?id={_get('id')}"
+            item = _FItem(display_title, _open, args=[hn_url])
         
-        menu.append_item(item)
+        _append(item)
     
     return menu
 
@@ -454,7 +693,7 @@ def get_user_stories(username, story_type='submitted'):
     # Fetch the user profile
     user_url = f"https://hacker-news.firebaseio.com/v0/user/{username}.json"
     try:
-        response = req.get(user_url)
+        response = _SESSION.get(user_url, timeout=REQUEST_TIMEOUT)
         if response.status_code != 200:
             return []
         
@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration for the PyNews tests.
+
+The repository root and the tests directory are put on sys.path through
+``pythonpath`` in pyproject.toml, and test modules are imported with
+``--import-mode=importlib``.
+"""
+import pynews.comments  # noqa: F401  warm the module cache once per session
+
+# Shared fixture builders, imported by the test modules but holding no tests themselves
+collect_ignore_glob = ["test_*utils.py"]
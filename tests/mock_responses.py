@@ -0,0 +1,40 @@
+"""
+Stand-in HTTP responses shared by the test_*_utils fixture modules.
+"""
+from functools import lru_cache
+
+
+class _MockResponse:
+    """Minimal stand-in for requests.Response: just status_code and json()."""
+    
+    __slots__ = ("status_code", "_json_data")
+    
+    def __init__(self, status_code, json_data):
+        self.status_code = status_code
+        self._json_data = json_data
+    
+    def json(self):
+        return self._json_data
+
+
+@lru_cache(maxsize=None)
+def _payloadless_response(status_code):
+    """Return the shared response for a status code with no JSON body."""
+    return _MockResponse(status_code, None)
+
+
+def create_mock_response(status_code=200, json_data=None):
+    """
+    Create a mock requests response object with the given status code and JSON data.
+    
+    Args:
+        status_code: HTTP status code for the response
+        json_data: Dictionary to return as JSON data
+        
+    Returns:
+        Mock response object
+    """
+    # Responses without a body are interchangeable, so they're built once per status
+    if json_data is None:
+        return _payloadless_response(status_code)
+    return _MockResponse(status_code, json_data)
@@ -7,6 +7,9 @@ echo "---------------------------------------------"
 
 cd "$(dirname "$0")"
 
+# Ensure parent directory is in PYTHONPATH
+export PYTHONPATH="..:$PYTHONPATH"
+
 echo "1. Running core comment functionality tests (test_comments.py)"
 python -m unittest test_comments.py
 
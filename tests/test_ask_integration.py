@@ -1,24 +1,24 @@
 """
 Integration tests for the Ask HN functionality in PyNews.
 """
-import sys
 import unittest
 from unittest.mock import patch, MagicMock, call
 import json
 
-# Add the parent directory to the path
-sys.path.append("..") # Add parent directory to path
-
 from pynews.ask_view import display_ask_story_details, display_top_scored_ask_stories
 from pynews.pynews import main
-from pynews.constants import URLS
+from pynews.constants import REQUEST_TIMEOUT, URLS
+from pynews.utils import create_list_stories, create_menu, get_story, iter_list_stories, iter_stories_batch
 from test_ask_utils import create_mock_response, generate_mock_ask_story, generate_mock_ask_stories
+from test_utils import SilentViewMixin
 
 
-class TestAskViewIntegration(unittest.TestCase):
+class TestAskViewIntegration(SilentViewMixin, unittest.TestCase):
     """Integration tests for Ask HN view with other components."""
 
-    @patch('pynews.utils.req.get')
+    view_module = 'pynews.ask_view'
+
+    @patch('pynews.utils._SESSION.get')
     def test_get_story_integration(self, mock_get):
         """Test integration between get_story and display_ask_story_details."""
         # Arrange
@@ -28,15 +28,97 @@ class TestAskViewIntegration(unittest.TestCase):
         mock_get.return_value = mock_response
         
         # Act
-        with patch('pynews.ask_view.clear_screen'):
-            with patch('pynews.ask_view.print'):
-                with patch('pynews.ask_view.getch', return_value='q'):
-                    display_ask_story_details(story_id)
+        with self.silent_ui(return_value='q'):
+            display_ask_story_details(story_id)
+        
+        # Assert
+        mock_get.assert_called_with(URLS["item"].format(story_id), timeout=REQUEST_TIMEOUT)
+
+    @patch('pynews.utils._SESSION.get')
+    def test_get_story_reuses_cached_story(self, mock_get):
+        """Test that a story fetched once is served from the cache afterwards."""
+        # Arrange
+        mock_story = generate_mock_ask_story(12345)
+        mock_get.return_value = create_mock_response(200, mock_story)
+        
+        # Act
+        first = get_story(12345)
+        second = get_story(12345)
+        
+        # Assert
+        self.assertEqual(first, mock_story)
+        self.assertEqual(second, first)
+        mock_get.assert_called_once_with(URLS["item"].format(12345), timeout=REQUEST_TIMEOUT)
+
+    @patch('pynews.utils._SESSION.get')
+    def test_get_story_returns_copies_of_cached_story(self, mock_get):
+        """Test that fields a caller adds to a story don't reach later callers."""
+        # Arrange
+        mock_get.return_value = create_mock_response(200, generate_mock_ask_story(12345))
+        first = get_story(12345)
+        
+        # Act
+        first['company'] = 'Acme'
+        second = get_story(12345)
+        
+        # Assert
+        self.assertIsNot(second, first)
+        self.assertNotIn('company', second)
+        mock_get.assert_called_once()
+
+    @patch('pynews.utils._SESSION.get')
+    def test_iter_stories_batch_fetches_only_uncached_ids(self, mock_get):
+        """Test that a batch lookup skips cached and duplicate ids and keeps order."""
+        # Arrange
+        mock_get.side_effect = lambda url, **kwargs: create_mock_response(
+            200, generate_mock_ask_story(int(url.rsplit("/", 1)[1].split(".")[0]))
+        )
+        cached = get_story(2)
+        mock_get.reset_mock()
+        
+        # Act
+        result = list(iter_stories_batch([3, 2, 1, 3], max_threads=2))
+        
+        # Assert
+        self.assertEqual([story["id"] for story in result], [3, 2, 1])
+        self.assertEqual(result[1], cached)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('pynews.utils._SESSION.get')
+    def test_create_list_stories_shuffles_ids_before_fetching(self, mock_get):
+        """Test that shuffling picks the order of the top ids and skips the rest."""
+        # Arrange
+        mock_get.side_effect = lambda url, **kwargs: create_mock_response(
+            200, generate_mock_ask_story(int(url.rsplit("/", 1)[1].split(".")[0]))
+        )
+        
+        # Act
+        with patch('pynews.loading.LoadingIndicator'):
+            with patch('pynews.utils.random.sample', side_effect=lambda ids, k: ids[::-1]):
+                result = create_list_stories([1, 2, 3, 4, 5], 3, True, 2)
+        
+        # Assert
+        self.assertEqual([story["id"] for story in result], [3, 2, 1])
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('pynews.utils.CursesMenu')
+    @patch('pynews.utils._SESSION.get')
+    def test_create_menu_consumes_streamed_stories(self, mock_get, mock_menu_class):
+        """Test that non-Ask menus are built straight from the streaming fetch."""
+        # Arrange
+        mock_get.side_effect = lambda url, **kwargs: create_mock_response(
+            200, generate_mock_ask_story(int(url.rsplit("/", 1)[1].split(".")[0]))
+        )
+        
+        # Act
+        stories = iter_list_stories([7, 8, 9], 3, False, 2)
+        create_menu(stories, "top")
         
         # Assert
-        mock_get.assert_called_with(URLS["item"].format(story_id))
+        self.assertNotIsInstance(stories, list)
+        self.assertEqual(mock_menu_class.return_value.append_item.call_count, 3)
 
-    @patch('pynews.utils.req.get')
+    @patch('pynews.utils._SESSION.get')
     def test_api_error_handling(self, mock_get):
         """Test error handling during API calls."""
         # Arrange - Connection error
@@ -46,7 +128,7 @@ class TestAskViewIntegration(unittest.TestCase):
         with patch('pynews.ask_view.print'):
             display_ask_story_details(12345)
 
-    @patch('pynews.utils.req.get')
+    @patch('pynews.utils._SESSION.get')
     def test_ask_stories_list_integration(self, mock_get):
         """Test integration between API and Ask HN stories list display."""
         # Arrange
@@ -60,15 +142,13 @@ class TestAskViewIntegration(unittest.TestCase):
         ]
         
         # Act
-        with patch('pynews.ask_view.clear_screen'):
-            with patch('pynews.ask_view.print'):
-                with patch('pynews.ask_view.LoadingIndicator'):
-                    with patch('pynews.ask_view.getch', return_value='q'):
-                        display_top_scored_ask_stories(limit=5)
+        with self.silent_ui(return_value='q') as stack:
+            stack.enter_context(patch('pynews.ask_view.LoadingIndicator'))
+            display_top_scored_ask_stories(limit=5)
         
         # Assert
         # Should call the API at least for the Ask HN stories endpoint
-        mock_get.assert_any_call(URLS["ask"])
+        mock_get.assert_any_call(URLS["ask"], timeout=REQUEST_TIMEOUT)
 
 
 class TestPyNewsCommandLineIntegration(unittest.TestCase):
@@ -1,16 +1,16 @@
 """
 Tests for sorting and filtering functionality of Ask HN stories.
 """
-import sys
+import random
 import unittest
 from unittest.mock import patch, MagicMock
 
-# Add the parent directory to the path
-sys.path.append("..") # Add parent directory to path
-
-from pynews.utils import filter_stories_by_keywords, sort_stories_by_score, sort_stories_by_comments, sort_stories_by_time
+from pynews.utils import filter_and_sort_stories, filter_stories_by_author, iter_filter_stories, filter_stories_by_keywords, sort_stories_by_score, sort_stories_by_comments, sort_stories_by_time
 from test_ask_utils import generate_mock_ask_stories
 
+# Seeded so shuffled inputs are the same on every run
+_RNG = random.Random(0xC0FFEE)
+
 
 class TestStorySorting(unittest.TestCase):
     """Tests for sorting Ask HN stories by different criteria."""
@@ -26,8 +26,7 @@ class TestStorySorting(unittest.TestCase):
             })
         
         # Shuffle the stories to ensure they're not already sorted
-        import random
-        random.shuffle(stories)
+        _RNG.shuffle(stories)
         
         # Act
         sorted_stories = sort_stories_by_score(stories)
@@ -50,8 +49,7 @@ class TestStorySorting(unittest.TestCase):
             })
         
         # Shuffle the stories
-        import random
-        random.shuffle(stories)
+        _RNG.shuffle(stories)
         
         # Act
         sorted_stories = sort_stories_by_comments(stories)
@@ -62,7 +60,43 @@ class TestStorySorting(unittest.TestCase):
         self.assertEqual(sorted_stories[2]["descendants"], 20)
         self.assertEqual(sorted_stories[3]["descendants"], 10)
         self.assertEqual(sorted_stories[4]["descendants"], 0)
-    
+
+    def test_sort_by_comments_keeps_ties_in_order(self):
+        """Test that stories with equal comment counts keep their original order."""
+        # Arrange - Two pairs of ties plus a story without a kids field
+        stories = [
+            {"id": 1, "kids": [11]},
+            {"id": 2, "kids": [21, 22]},
+            {"id": 3},
+            {"id": 4, "kids": [41]},
+            {"id": 5, "kids": [51, 52]},
+        ]
+
+        # Act
+        descending = sort_stories_by_comments(stories)
+        ascending = sort_stories_by_comments(stories, reverse=False)
+
+        # Assert
+        self.assertEqual([s["id"] for s in descending], [2, 5, 1, 4, 3])
+        self.assertEqual([s["id"] for s in ascending], [3, 1, 4, 2, 5])
+
+    def test_sort_treats_missing_fields_as_zero(self):
+        """Test that stories without a score or time still sort, as zero."""
+        # Arrange
+        stories = [
+            {"id": 1, "score": 5, "time": 1000},
+            {"id": 2},
+            {"id": 3, "score": 10, "time": 2000},
+        ]
+
+        # Act
+        by_score = sort_stories_by_score(stories)
+        by_time = sort_stories_by_time(stories, reverse=False)
+
+        # Assert
+        self.assertEqual([s["id"] for s in by_score], [3, 1, 2])
+        self.assertEqual([s["id"] for s in by_time], [2, 1, 3])
+
     def test_sort_by_time(self):
         """Test sorting Ask HN stories by submission time."""
         # Arrange - Create stories with different timestamps
@@ -75,8 +109,7 @@ class TestStorySorting(unittest.TestCase):
             })
         
         # Shuffle the stories
-        import random
-        random.shuffle(stories)
+        _RNG.shuffle(stories)
         
         # Act
         sorted_stories = sort_stories_by_time(stories)
@@ -173,23 +206,168 @@ class TestStoryFiltering(unittest.TestCase):
         self.assertEqual(len(filtered), 1)
         self.assertEqual(filtered[0]["title"], "Ask HN: Python question?")
 
+    def test_filter_with_overlapping_keywords(self):
+        """Test keywords that contain one another under both matching strategies."""
+        # Arrange
+        stories = [
+            {"title": "Ask HN: Java or JavaScript?", "text": ""},
+            {"title": "Ask HN: Learning Java?", "text": ""},
+            {"title": "Ask HN: Career advice?", "text": ""}
+        ]
+
+        # Act
+        any_match = filter_stories_by_keywords(stories, ["javascript", "java", "java"])
+        all_match = filter_stories_by_keywords(stories, ["javascript", "java"], match_all=True)
+
+        # Assert
+        self.assertEqual(len(any_match), 2)
+        self.assertEqual([s["title"] for s in all_match], ["Ask HN: Java or JavaScript?"])
+
+    def test_filter_reuses_cached_lowercase_blob(self):
+        """Test that case-insensitive filtering lowercases each story only once."""
+        # Arrange
+        stories = [
+            {"title": "Ask HN: Python question?", "text": "Need help with code"},
+            {"title": "Ask HN: Career advice?", "text": "Should I learn Rust?"}
+        ]
+
+        # Act
+        filter_stories_by_keywords(stories, ["python"])
+        filtered = filter_stories_by_keywords(stories, ["rust"])
+
+        # Assert
+        self.assertEqual(stories[0]["_lc_blob"], "ask hn: python question?\nneed help with code")
+        self.assertEqual(len(filtered), 1)
+        self.assertEqual(filtered[0]["title"], "Ask HN: Career advice?")
+
+    def test_filter_keywords_match_literally(self):
+        """Test that regex metacharacters in keywords are matched as plain text."""
+        # Arrange
+        stories = [
+            {"title": "Ask HN: Is C++ still worth learning?", "text": ""},
+            {"title": "Ask HN: Node.js or Deno?", "text": ""},
+            {"title": "Ask HN: Nodejs hosting?", "text": "Cheap VPS for C"}
+        ]
+
+        # Act
+        filtered = filter_stories_by_keywords(stories, ["c++", "node.js"])
+
+        # Assert
+        self.assertEqual([s["title"] for s in filtered],
+                         ["Ask HN: Is C++ still worth learning?", "Ask HN: Node.js or Deno?"])
+
+    def test_keyword_does_not_match_across_title_and_text(self):
+        """Test that a keyword can't straddle the title/text boundary."""
+        # Arrange
+        stories = [{"title": "Ask HN: Py", "text": "thon"}]
+
+        # Act
+        filtered = filter_stories_by_keywords(stories, ["python"])
+
+        # Assert
+        self.assertEqual(len(filtered), 0)
+
+
+class TestAuthorFiltering(unittest.TestCase):
+    """Tests for filtering Ask HN stories by author."""
+
+    def test_filter_by_author_case_insensitive(self):
+        """Test that author filtering ignores case and skips stories without an author."""
+        # Arrange
+        stories = [
+            {"title": "Ask HN: First?", "by": "PG"},
+            {"title": "Ask HN: Second?", "by": "dang"},
+            {"title": "Ask HN: Third?", "by": "pg"},
+            {"title": "Ask HN: Deleted?"}
+        ]
+
+        # Act
+        filtered = filter_stories_by_author(stories, "pg")
+
+        # Assert
+        self.assertEqual([s["title"] for s in filtered], ["Ask HN: First?", "Ask HN: Third?"])
+        self.assertEqual(stories[0]["_by_lc"], "pg")
+
+    def test_filter_by_author_case_sensitive(self):
+        """Test case-sensitive author filtering."""
+        # Arrange
+        stories = [{"title": "Ask HN: First?", "by": "PG"}, {"title": "Ask HN: Third?", "by": "pg"}]
+
+        # Act
+        filtered = filter_stories_by_author(stories, "pg", case_sensitive=True)
+
+        # Assert
+        self.assertEqual([s["title"] for s in filtered], ["Ask HN: Third?"])
+
+
+class TestCombinedFiltering(unittest.TestCase):
+    """Tests for filtering Ask HN stories by author and keywords in one pass."""
+
+    def test_filter_by_author_and_keywords(self):
+        """Test that only stories matching both the author and the keywords are kept."""
+        # Arrange
+        stories = [
+            {"title": "Ask HN: Python question?", "text": "", "by": "alice"},
+            {"title": "Ask HN: Python tooling?", "text": "", "by": "bob"},
+            {"title": "Ask HN: Career advice?", "text": "Rust or Go?", "by": "Alice"}
+        ]
+
+        # Act
+        filtered = list(iter_filter_stories(stories, author="ALICE", keywords=["python"]))
+
+        # Assert
+        self.assertEqual([s["title"] for s in filtered], ["Ask HN: Python question?"])
+
+    def test_filter_without_criteria_keeps_every_story(self):
+        """Test that no author and no (or only empty) keywords keeps every story."""
+        # Arrange
+        stories = [{"title": "Ask HN: Anything?", "by": "alice"}]
+
+        # Act & Assert
+        self.assertEqual(list(iter_filter_stories(stories)), stories)
+        self.assertEqual(list(iter_filter_stories(stories, keywords=[""])), stories)
+
+    def test_iter_filter_feeds_sort_directly(self):
+        """Test that the lazy filter can be sorted without building a list first."""
+        # Arrange
+        stories = [
+            {"title": "Ask HN: Python basics?", "by": "alice", "score": 10},
+            {"title": "Ask HN: Rust basics?", "by": "alice", "score": 40},
+            {"title": "Ask HN: Python internals?", "by": "alice", "score": 30},
+            {"title": "Ask HN: Python jobs?", "by": "bob", "score": 50}
+        ]
+
+        # Act
+        matching = iter_filter_stories(stories, author="alice", keywords=["python"])
+        sorted_stories = sort_stories_by_score(matching)
+
+        # Assert
+        self.assertNotIsInstance(matching, list)
+        self.assertEqual([s["score"] for s in sorted_stories], [30, 10])
+
 
 class TestCombinedSortingAndFiltering(unittest.TestCase):
     """Tests for combined sorting and filtering operations."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build one story list shared by the tests; the filters may cache lowercased fields on it."""
+        cls.base_time = 1616513396
+        cls.stories = [
+            {"title": "Ask HN: Python basics?", "text": "Learning",
+             "score": 10, "descendants": 5, "time": cls.base_time},
+            {"title": "Ask HN: Advanced Python?", "text": "Expert tips",
+             "score": 50, "descendants": 20, "time": cls.base_time + 3600},
+            {"title": "Ask HN: JavaScript?", "text": "Web dev",
+             "score": 30, "descendants": 15, "time": cls.base_time + 7200},
+            {"title": "Ask HN: Career with Python?", "text": "Jobs",
+             "score": 20, "descendants": 10, "time": cls.base_time + 1800}
+        ]
+    
     def test_filter_then_sort_by_score(self):
         """Test filtering stories by keyword and then sorting by score."""
-        # Arrange
-        stories = [
-            {"title": "Ask HN: Python basics?", "text": "Learning", "score": 10},
-            {"title": "Ask HN: Advanced Python?", "text": "Expert tips", "score": 50},
-            {"title": "Ask HN: JavaScript?", "text": "Web dev", "score": 30},
-            {"title": "Ask HN: Career with Python?", "text": "Jobs", "score": 20}
-        ]
-        
         # Act
-        filtered = filter_stories_by_keywords(stories, ["python"])
-        sorted_stories = sort_stories_by_score(filtered)
+        sorted_stories = filter_and_sort_stories(self.stories, "score", keywords=["python"])
         
         # Assert
         self.assertEqual(len(sorted_stories), 3)  # Should match 3 Python stories
@@ -199,17 +377,8 @@ class TestCombinedSortingAndFiltering(unittest.TestCase):
     
     def test_filter_then_sort_by_comments(self):
         """Test filtering stories by keyword and then sorting by comments."""
-        # Arrange
-        stories = [
-            {"title": "Ask HN: Python basics?", "text": "Learning", "descendants": 5},
-            {"title": "Ask HN: Advanced Python?", "text": "Expert tips", "descendants": 20},
-            {"title": "Ask HN: JavaScript?", "text": "Web dev", "descendants": 15},
-            {"title": "Ask HN: Career with Python?", "text": "Jobs", "descendants": 10}
-        ]
-        
         # Act
-        filtered = filter_stories_by_keywords(stories, ["python"])
-        sorted_stories = sort_stories_by_comments(filtered)
+        sorted_stories = filter_and_sort_stories(self.stories, "comments", keywords=["python"])
         
         # Assert
         self.assertEqual(len(sorted_stories), 3)  # Should match 3 Python stories
@@ -219,24 +388,20 @@ class TestCombinedSortingAndFiltering(unittest.TestCase):
     
     def test_filter_then_sort_by_time(self):
         """Test filtering stories by keyword and then sorting by time."""
-        # Arrange
-        base_time = 1616513396
-        stories = [
-            {"title": "Ask HN: Python basics?", "text": "Learning", "time": base_time},
-            {"title": "Ask HN: Advanced Python?", "text": "Expert tips", "time": base_time + 3600},
-            {"title": "Ask HN: JavaScript?", "text": "Web dev", "time": base_time + 7200},
-            {"title": "Ask HN: Career with Python?", "text": "Jobs", "time": base_time + 1800}
-        ]
-        
         # Act
-        filtered = filter_stories_by_keywords(stories, ["python"])
-        sorted_stories = sort_stories_by_time(filtered)
+        sorted_stories = filter_and_sort_stories(self.stories, "time", keywords=["python"])
         
         # Assert
+        base_time = self.base_time
         self.assertEqual(len(sorted_stories), 3)  # Should match 3 Python stories
         self.assertEqual(sorted_stories[0]["time"], base_time + 3600)  # Newest first
         self.assertEqual(sorted_stories[1]["time"], base_time + 1800)
         self.assertEqual(sorted_stories[2]["time"], base_time)
+    
+    def test_filter_and_sort_rejects_unknown_order(self):
+        """Test that an unknown sort order is reported instead of ignored."""
+        with self.assertRaises(ValueError):
+            filter_and_sort_stories(self.stories, "popularity")
 
 
 if __name__ == '__main__':
@@ -1,24 +1,20 @@
 """
 Utilities for testing Ask HN functionality.
 """
-import json
-from unittest.mock import Mock
+from mock_responses import create_mock_response  # noqa: F401  re-exported for the test modules
 
 
-def create_mock_response(status_code=200, json_data=None):
-    """Create a mock requests response object with the given status code and JSON data."""
-    mock_response = Mock()
-    mock_response.status_code = status_code
-    
-    def mock_json():
-        return json_data
-        
-    mock_response.json = mock_json
-    
-    return mock_response
+# Fields shared by every mock Ask HN story; copied, then filled in per story
+_ASK_STORY_TEMPLATE = {
+    "by": "test_user",
+    "time": 1616513396,  # Example timestamp
+    "text": "This is a test Ask HN post with <b>some</b> <i>formatting</i>.",
+    "type": "story",
+}
 
 
-def generate_mock_ask_story(story_id=12345, score=100, descendants=20, title="Ask HN: Test Question?"):
+def generate_mock_ask_story(story_id=12345, score=100, descendants=20, title="Ask HN: Test Question?",
+                            text=None):
     """
     Generate a mock Ask HN story.
     
@@ -27,21 +23,20 @@ def generate_mock_ask_story(story_id=12345, score=100, descendants=20, title="As
         score: Story score (points)
         descendants: Number of comments
         title: Story title, should start with "Ask HN:"
+        text: Story body; the template text is kept when None
     
     Returns:
         Dictionary representing an Ask HN story
     """
-    return {
-        "id": story_id,
-        "title": title,
-        "by": "test_user",
-        "score": score,
-        "descendants": descendants,
-        "time": 1616513396,  # Example timestamp
-        "text": "This is a test Ask HN post with <b>some</b> <i>formatting</i>.",
-        "type": "story",
-        "kids": list(range(1000, 1000 + descendants)),  # Generate comment IDs
-    }
+    story = _ASK_STORY_TEMPLATE.copy()
+    story["id"] = story_id
+    story["title"] = title
+    story["score"] = score
+    story["descendants"] = descendants
+    story["kids"] = list(range(1000, 1000 + descendants))  # Generate comment IDs
+    if text is not None:
+        story["text"] = text
+    return story
 
 
 def generate_mock_ask_stories(num_stories=10, base_id=10000, with_random_scores=True):
@@ -1,15 +1,11 @@
 """
 Unit tests for the Ask HN functionality in PyNews.
 """
-import sys
 import unittest
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import DEFAULT, patch, MagicMock, call
 from io import StringIO
 import time
 
-# Add the parent directory to the path so we can import the modules
-sys.path.append("..") # Add parent directory to path
-
 from pynews.ask_view import (
     display_ask_story_details,
     display_top_scored_ask_stories,
@@ -20,14 +16,24 @@ from pynews.ask_view import (
     format_comment_count_detailed,
     highlight_keywords_in_text
 )
+from pynews.utils import format_time_ago
 from test_ask_utils import (
     create_mock_response,
     generate_mock_ask_story,
-    generate_mock_ask_stories,
-    generate_ask_story_ids
+    generate_mock_ask_stories
 )
 
 
+class _CountingPrint:
+    """Stand-in for print that counts calls without recording their arguments."""
+    
+    def __init__(self):
+        self.call_count = 0
+    
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+
+
 class TestAskViewUtilityFunctions(unittest.TestCase):
     """Tests for utility functions in the Ask HN view module."""
     
@@ -48,14 +54,10 @@ class TestAskViewUtilityFunctions(unittest.TestCase):
         expected = "Check \n\n    def test(): pass"
         self.assertEqual(clean_text(html_text), expected)
     
-    @patch('pynews.ask_view.time')
-    def test_format_timestamp(self, mock_time):
+    def test_format_timestamp(self):
         """Test format_timestamp function."""
-        # Mock current time
-        mock_time.time.return_value = 1616513396
-        
-        # Test with a valid timestamp
-        timestamp = 1616513396 - 3600  # 1 hour ago
+        # Test with a valid timestamp (absolute formatting doesn't depend on the current time)
+        timestamp = 1616513396 - 3600
         result = format_timestamp(timestamp)
         self.assertIn("2021", result)  # Contains year
         self.assertIn("Mar", result)   # Contains month
@@ -79,6 +81,21 @@ class TestAskViewUtilityFunctions(unittest.TestCase):
         result = format_time_detailed(None)
         self.assertEqual(result, "Unknown time")
     
+    def test_format_time_ago(self):
+        """Test format_time_ago against a fixed current time."""
+        now = 1616513396
+        
+        self.assertEqual(format_time_ago(now - 30, now), "just now")
+        self.assertEqual(format_time_ago(now - 5 * 60, now), "5m ago")
+        self.assertEqual(format_time_ago(now - 3 * 3600, now), "3h ago")
+        self.assertEqual(format_time_ago(now - 2 * 86400, now), "2d ago")
+        self.assertEqual(format_time_ago(now - 90 * 86400, now), "3mo ago")
+        self.assertEqual(format_time_ago(now - 800 * 86400, now), "2y ago")
+        
+        # Future timestamps and missing times
+        self.assertEqual(format_time_ago(now + 120, now), "just now")
+        self.assertEqual(format_time_ago(0, now), "Unknown time")
+    
     def test_format_score(self):
         """Test format_score function."""
         # Test with various scores
@@ -110,6 +127,12 @@ class TestAskViewUtilityFunctions(unittest.TestCase):
         # Case sensitive with exact case
         result = highlight_keywords_in_text(text, ["Python"], case_sensitive=True)
         self.assertNotEqual(result, text)  # Should match
+    
+    @patch('pynews.ask_view.USE_COLORS', False)
+    def test_highlight_overlapping_keywords_in_one_pass(self):
+        """Test that overlapping keywords are highlighted once, preferring the longer match."""
+        result = highlight_keywords_in_text("Java or JavaScript?", ["java", "javascript"])
+        self.assertEqual(result, "*Java* or *JavaScript*?")
 
 
 class TestDisplayAskStoryDetails(unittest.TestCase):
@@ -172,29 +195,63 @@ class TestDisplayAskStoryDetails(unittest.TestCase):
 class TestDisplayTopScoredAskStories(unittest.TestCase):
     """Tests for the display_top_scored_ask_stories function."""
     
-    @patch('pynews.ask_view.get_stories')
+    @classmethod
+    def setUpClass(cls):
+        """Build the mock stories once for the whole class; tests treat them as read-only."""
+        # Keyed by id so the mocked get_story is a plain dict lookup
+        cls.mock_stories_by_id = {s['id']: s for s in generate_mock_ask_stories(10)}
+        
+        # Scores: 50, 100, 150, ..., 500
+        cls.score_stories_by_id = {
+            10000 + i: generate_mock_ask_story(story_id=10000 + i, score=(i + 1) * 50)
+            for i in range(10)
+        }
+        
+        # Comment counts: 0, 5, 10, ..., 45
+        cls.comment_stories_by_id = {
+            10000 + i: generate_mock_ask_story(story_id=10000 + i, descendants=i * 5)
+            for i in range(10)
+        }
+
+    def setUp(self):
+        """Patch the loading indicator, key input and story lookup shared by every test."""
+        patcher = patch.multiple('pynews.ask_view', getch=DEFAULT)
+        self.mocks = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mocks['getch'].return_value = 'q'
+        
+        # ask_view imports LoadingIndicator inside the function, so patch its home module
+        loader_patcher = patch('pynews.loading.LoadingIndicator')
+        self.mocks['LoadingIndicator'] = loader_patcher.start()
+        self.addCleanup(loader_patcher.stop)
+        
+        # Autospec'd so calls are checked against get_story's real signature
+        story_patcher = patch('pynews.ask_view.get_story', autospec=True)
+        self.mocks['get_story'] = story_patcher.start()
+        self.addCleanup(story_patcher.stop)
+    
+    @patch('pynews.ask_view.get_stories', autospec=True)
     @patch('pynews.ask_view.clear_screen')
-    @patch('pynews.ask_view.print')
+    @patch('pynews.ask_view.print', new_callable=_CountingPrint)
     def test_display_top_scored_ask_stories_success(self, mock_print, mock_clear, mock_get_stories):
         """Test displaying top scored Ask HN stories."""
         # Arrange
-        mock_stories = generate_mock_ask_stories(10)
-        mock_get_stories.return_value = generate_ask_story_ids(100)
+        stories_by_id = self.mock_stories_by_id
+        mock_get_stories.return_value = list(stories_by_id)
         
         # Configure mock to return stories
-        with patch('pynews.ask_view.get_story', side_effect=lambda id: 
-                  next((s for s in mock_stories if s['id'] == id), None)):
-            # Act
-            with patch('pynews.ask_view.LoadingIndicator'):
-                with patch('pynews.ask_view.getch', return_value='q'):
-                    display_top_scored_ask_stories(limit=5)
+        self.mocks['get_story'].side_effect = stories_by_id.get
+        
+        # Act
+        display_top_scored_ask_stories(limit=5)
         
         # Assert
         mock_get_stories.assert_called_once()
         mock_clear.assert_called()
         self.assertTrue(mock_print.call_count > 5)  # Should print multiple stories
     
-    @patch('pynews.ask_view.get_stories')
+    @patch('pynews.ask_view.USE_COLORS', False)
+    @patch('pynews.ask_view.get_stories', autospec=True)
     @patch('pynews.ask_view.print')
     def test_display_top_scored_ask_stories_no_results(self, mock_print, mock_get_stories):
         """Test displaying top scored Ask HN stories with no matching results."""
@@ -202,71 +259,55 @@ class TestDisplayTopScoredAskStories(unittest.TestCase):
         mock_get_stories.return_value = []  # No stories
         
         # Act
-        with patch('pynews.ask_view.LoadingIndicator'):
-            display_top_scored_ask_stories()
+        display_top_scored_ask_stories()
         
         # Assert
         mock_get_stories.assert_called_once()
-        mock_print.assert_called_with("No Ask HN stories found matching your criteria.")
+        mock_print.assert_called_with("\nNo Ask HN stories found.")
     
-    @patch('pynews.ask_view.get_stories')
+    @patch('pynews.ask_view.get_stories', autospec=True)
     @patch('pynews.ask_view.clear_screen')
-    @patch('pynews.ask_view.print')
+    @patch('pynews.ask_view.print', new_callable=_CountingPrint)
     def test_display_top_scored_ask_stories_with_min_score(self, mock_print, mock_clear, mock_get_stories):
         """Test displaying Ask HN stories with minimum score filter."""
-        # Arrange
-        # Create stories with different scores
-        mock_stories = []
-        for i in range(10):
-            mock_stories.append(generate_mock_ask_story(
-                story_id=10000 + i,
-                score=(i + 1) * 50  # Scores: 50, 100, 150, ..., 500
-            ))
+        # Arrange - Stories with scores 50 to 500
+        stories_by_id = self.score_stories_by_id
         
-        mock_get_stories.return_value = [s['id'] for s in mock_stories]
+        mock_get_stories.return_value = list(stories_by_id)
         
         # Configure mock to return stories
-        with patch('pynews.ask_view.get_story', side_effect=lambda id: 
-                  next((s for s in mock_stories if s['id'] == id), None)):
-            # Act - Set min_score to 200
-            with patch('pynews.ask_view.LoadingIndicator'):
-                with patch('pynews.ask_view.getch', return_value='q'):
-                    display_top_scored_ask_stories(min_score=200)
+        self.mocks['get_story'].side_effect = stories_by_id.get
+        
+        # Act - Set min_score to 200
+        display_top_scored_ask_stories(min_score=200)
         
         # Assert
         mock_get_stories.assert_called_once()
         mock_clear.assert_called()
     
-    @patch('pynews.ask_view.get_stories')
+    @patch('pynews.ask_view.get_stories', autospec=True)
     @patch('pynews.ask_view.clear_screen')
-    @patch('pynews.ask_view.print')
+    @patch('pynews.ask_view.print', new_callable=_CountingPrint)
     def test_display_top_scored_ask_stories_sorted_by_comments(self, mock_print, mock_clear, mock_get_stories):
         """Test displaying Ask HN stories sorted by comment count."""
-        # Arrange
-        mock_stories = []
-        for i in range(10):
-            mock_stories.append(generate_mock_ask_story(
-                story_id=10000 + i,
-                descendants=i * 5  # Comment counts: 0, 5, 10, ..., 45
-            ))
+        # Arrange - Stories with 0 to 45 comments
+        stories_by_id = self.comment_stories_by_id
         
-        mock_get_stories.return_value = [s['id'] for s in mock_stories]
+        mock_get_stories.return_value = list(stories_by_id)
         
         # Configure mock to return stories
-        with patch('pynews.ask_view.get_story', side_effect=lambda id: 
-                  next((s for s in mock_stories if s['id'] == id), None)):
-            # Act - Sort by comments
-            with patch('pynews.ask_view.LoadingIndicator'):
-                with patch('pynews.ask_view.getch', return_value='q'):
-                    display_top_scored_ask_stories(sort_by_comments=True)
+        self.mocks['get_story'].side_effect = stories_by_id.get
+        
+        # Act - Sort by comments
+        display_top_scored_ask_stories(sort_by_comments=True)
         
         # Assert
         mock_get_stories.assert_called_once()
         mock_clear.assert_called()
     
-    @patch('pynews.ask_view.get_stories')
+    @patch('pynews.ask_view.get_stories', autospec=True)
     @patch('pynews.ask_view.clear_screen')
-    @patch('pynews.ask_view.print')
+    @patch('pynews.ask_view.print', new_callable=_CountingPrint)
     def test_display_top_scored_ask_stories_with_keywords(self, mock_print, mock_clear, mock_get_stories):
         """Test displaying Ask HN stories filtered by keywords."""
         # Arrange
@@ -279,15 +320,14 @@ class TestDisplayTopScoredAskStories(unittest.TestCase):
                                  text="Should I learn Python or JavaScript?")
         ]
         
-        mock_get_stories.return_value = [s['id'] for s in mock_stories]
+        stories_by_id = {s['id']: s for s in mock_stories}
+        mock_get_stories.return_value = list(stories_by_id)
         
         # Configure mock to return stories
-        with patch('pynews.ask_view.get_story', side_effect=lambda id: 
-                  next((s for s in mock_stories if s['id'] == id), None)):
-            # Act - Filter by Python keyword
-            with patch('pynews.ask_view.LoadingIndicator'):
-                with patch('pynews.ask_view.getch', return_value='q'):
-                    display_top_scored_ask_stories(keywords=["python"])
+        self.mocks['get_story'].side_effect = stories_by_id.get
+        
+        # Act - Filter by Python keyword
+        display_top_scored_ask_stories(keywords=["python"])
         
         # Assert
         mock_get_stories.assert_called_once()
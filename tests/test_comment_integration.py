@@ -4,31 +4,43 @@ Integration tests for the comment display functionality in PyNews.
 These tests focus on the display_comments_for_story function and how it
 integrates with other comment-related functionality.
 """
-import os
-import sys
 import unittest
-from unittest.mock import patch, MagicMock, call
-from io import StringIO
-
-# Add the parent directory to the path so we can import the modules
-sys.path.append("..")
+from unittest.mock import DEFAULT, patch, Mock
 
 from pynews.comments import display_comments_for_story
-from test_utils import generate_mock_story, generate_mock_comment, generate_comment_tree_data
+from pynews.loading import LoadingIndicator
+from test_utils import generate_mock_story, generate_flat_comments
 
 
 class TestDisplayCommentsForStory(unittest.TestCase):
     """Tests for the display_comments_for_story function."""
 
-    @patch('pynews.comments.fetch_item')
-    @patch('pynews.comments.fetch_comment_tree')
-    @patch('pynews.comments.display_page_of_comments')
-    @patch('pynews.comments.LoadingIndicator')
-    @patch('pynews.comments.clear_screen')
-    @patch('pynews.comments.print')
-    def test_display_story_with_comments(self, mock_print, mock_clear, mock_loader, 
-                                        mock_display_page, mock_fetch_tree, mock_fetch_item):
+    @classmethod
+    def setUpClass(cls):
+        """Build the 25-comment tree (three pages at the default size) once for the class."""
+        cls.comment_ids_25 = list(range(1000, 1025))
+        cls.comment_tree_25 = generate_flat_comments(cls.comment_ids_25)
+
+    def setUp(self):
+        """Patch the collaborators of display_comments_for_story once per test."""
+        patcher = patch.multiple(
+            'pynews.comments',
+            fetch_item=DEFAULT,
+            fetch_comment_tree=DEFAULT,
+            display_page_of_comments=DEFAULT,
+            LoadingIndicator=DEFAULT,
+            clear_screen=DEFAULT,
+            print=DEFAULT,
+        )
+        self.mocks = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_display_story_with_comments(self):
         """Test displaying a story with comments."""
+        mock_loader = self.mocks['LoadingIndicator']
+        mock_display_page = self.mocks['display_page_of_comments']
+        mock_fetch_tree = self.mocks['fetch_comment_tree']
+        mock_fetch_item = self.mocks['fetch_item']
         # Arrange
         story_id = 12345
         story = generate_mock_story(story_id)
@@ -41,7 +53,7 @@ class TestDisplayCommentsForStory(unittest.TestCase):
         ]
         
         # Configure mocks
-        mock_loader_instance = MagicMock()
+        mock_loader_instance = Mock(spec=LoadingIndicator)
         mock_loader.return_value = mock_loader_instance
         
         mock_fetch_item.return_value = story
@@ -60,10 +72,10 @@ class TestDisplayCommentsForStory(unittest.TestCase):
         # Verify the result
         self.assertEqual(result, (1, 1, 2))  # (total_pages, current_page, total_comments)
 
-    @patch('pynews.comments.fetch_item')
-    @patch('pynews.comments.print')
-    def test_display_story_not_found(self, mock_print, mock_fetch_item):
+    def test_display_story_not_found(self):
         """Test displaying a story that doesn't exist."""
+        mock_print = self.mocks['print']
+        mock_fetch_item = self.mocks['fetch_item']
         # Arrange
         story_id = 99999
         mock_fetch_item.return_value = None
@@ -76,22 +88,18 @@ class TestDisplayCommentsForStory(unittest.TestCase):
         mock_print.assert_called_once()  # Error message printed
         self.assertEqual(result, (0, 0, 0))  # (total_pages, current_page, total_comments)
 
-    @patch('pynews.comments.fetch_item')
-    @patch('pynews.comments.fetch_comment_tree')
-    @patch('pynews.comments.display_page_of_comments')
-    @patch('pynews.comments.LoadingIndicator')
-    @patch('pynews.comments.clear_screen')
-    @patch('pynews.comments.print')
-    def test_display_story_no_comments(self, mock_print, mock_clear, mock_loader, 
-                                     mock_display_page, mock_fetch_tree, mock_fetch_item):
+    def test_display_story_no_comments(self):
         """Test displaying a story with no comments."""
+        mock_loader = self.mocks['LoadingIndicator']
+        mock_fetch_tree = self.mocks['fetch_comment_tree']
+        mock_fetch_item = self.mocks['fetch_item']
         # Arrange
         story_id = 12345
         story = generate_mock_story(story_id)
         story['kids'] = []  # No comments
         
         # Configure mocks
-        mock_loader_instance = MagicMock()
+        mock_loader_instance = Mock(spec=LoadingIndicator)
         mock_loader.return_value = mock_loader_instance
         
         mock_fetch_item.return_value = story
@@ -108,16 +116,12 @@ class TestDisplayCommentsForStory(unittest.TestCase):
         # Verify the result
         self.assertEqual(result, (0, 1, 0))  # (total_pages, current_page, total_comments)
 
-    @patch('pynews.comments.fetch_item')
-    @patch('pynews.comments.fetch_comment_tree')
     @patch('pynews.comments.sort_comment_tree')
-    @patch('pynews.comments.display_page_of_comments')
-    @patch('pynews.comments.LoadingIndicator')
-    @patch('pynews.comments.clear_screen')
-    @patch('pynews.comments.print')
-    def test_comment_sorting(self, mock_print, mock_clear, mock_loader, mock_display_page, 
-                           mock_sort, mock_fetch_tree, mock_fetch_item):
+    def test_comment_sorting(self, mock_sort):
         """Test sorting comments in display_comments_for_story."""
+        mock_loader = self.mocks['LoadingIndicator']
+        mock_fetch_tree = self.mocks['fetch_comment_tree']
+        mock_fetch_item = self.mocks['fetch_item']
         # Arrange
         story_id = 12345
         story = generate_mock_story(story_id)
@@ -130,7 +134,7 @@ class TestDisplayCommentsForStory(unittest.TestCase):
         ]
         
         # Configure mocks
-        mock_loader_instance = MagicMock()
+        mock_loader_instance = Mock(spec=LoadingIndicator)
         mock_loader.return_value = mock_loader_instance
         
         mock_fetch_item.return_value = story
@@ -147,37 +151,25 @@ class TestDisplayCommentsForStory(unittest.TestCase):
         mock_fetch_tree.assert_called_once()
         
         # Verify that sort_comment_tree was called with "newest"
-        mock_sort.assert_called_with(comment_tree, "newest", None)
+        self.assertEqual(mock_sort.call_args.args, (comment_tree, "newest", None))
+        self.assertEqual(mock_sort.call_args.kwargs, {})
 
-    @patch('pynews.comments.fetch_item')
-    @patch('pynews.comments.fetch_comment_tree')
-    @patch('pynews.comments.display_page_of_comments')
-    @patch('pynews.comments.LoadingIndicator')
-    @patch('pynews.comments.clear_screen')
-    @patch('pynews.comments.print')
-    def test_pagination(self, mock_print, mock_clear, mock_loader, mock_display_page, 
-                       mock_fetch_tree, mock_fetch_item):
+    def test_pagination(self):
         """Test pagination in display_comments_for_story."""
+        mock_loader = self.mocks['LoadingIndicator']
+        mock_display_page = self.mocks['display_page_of_comments']
+        mock_fetch_tree = self.mocks['fetch_comment_tree']
+        mock_fetch_item = self.mocks['fetch_item']
         # Arrange
         story_id = 12345
         story = generate_mock_story(story_id)
         
-        # Generate 25 comments to fill multiple pages with default page size of 10
-        story['kids'] = list(range(1000, 1025))
-        
-        # Mock comment tree - create 25 comments
-        comment_tree = []
-        for i in range(1000, 1025):
-            comment_tree.append({
-                'id': i, 
-                'text': f'Comment {i}', 
-                'by': f'user{i}', 
-                'time': 1616513396 + i, 
-                'children': []
-            })
+        # 25 comments fill multiple pages with the default page size of 10
+        story['kids'] = list(self.comment_ids_25)
+        comment_tree = self.comment_tree_25
         
         # Configure mocks
-        mock_loader_instance = MagicMock()
+        mock_loader_instance = Mock(spec=LoadingIndicator)
         mock_loader.return_value = mock_loader_instance
         
         mock_fetch_item.return_value = story
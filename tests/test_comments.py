@@ -3,13 +3,16 @@ Unit tests for the comment fetching functionality in PyNews.
 """
 import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 
-# Add the parent directory to the path so we can import the modules
-# sys.path.append("..")
+import requests
 
-from pynews.comments import fetch_item, fetch_comment_tree, sort_comment_tree, clean_comment_text, count_comment_tree
-from pynews.constants import URLS
+from pynews.comments import (
+    CommentSortOrder, clear_item_cache, fetch_item, fetch_comment_tree, fetch_comment_tree_bulk, sort_comment_tree, clean_comment_text,
+    count_comment_tree
+)
+from pynews.constants import REQUEST_TIMEOUT, URLS, item_url
 from test_utils import create_mock_response, generate_mock_story, generate_mock_comment, generate_comment_tree_data
 import os
 
@@ -17,9 +20,17 @@ import os
 class TestFetchItem(unittest.TestCase):
     """Tests for the fetch_item function."""
 
-    @patch('pynews.comments.requests.get')
-    def test_fetch_item_success(self, mock_get):
+    def setUp(self):
+        """Patch the HTTP session and start from an empty item cache for each test."""
+        clear_item_cache()
+        self.addCleanup(clear_item_cache)
+        patcher = patch('pynews.comments._SESSION.get')
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_fetch_item_success(self):
         """Test fetch_item with a successful API response."""
+        mock_get = self.mock_get
         # Arrange
         item_id = 12345
         expected_data = {"id": item_id, "title": "Test Story", "by": "test_user"}
@@ -29,12 +40,12 @@ class TestFetchItem(unittest.TestCase):
         result = fetch_item(item_id)
         
         # Assert
-        mock_get.assert_called_once_with(URLS['item'].format(item_id))
+        mock_get.assert_called_once_with(item_url(item_id), timeout=REQUEST_TIMEOUT)
         self.assertEqual(result, expected_data)
 
-    @patch('pynews.comments.requests.get')
-    def test_fetch_item_not_found(self, mock_get):
+    def test_fetch_item_not_found(self):
         """Test fetch_item with a 404 response."""
+        mock_get = self.mock_get
         # Arrange
         item_id = 99999
         mock_get.return_value = create_mock_response(404, None)
@@ -43,12 +54,12 @@ class TestFetchItem(unittest.TestCase):
         result = fetch_item(item_id)
         
         # Assert
-        mock_get.assert_called_once_with(URLS['item'].format(item_id))
+        mock_get.assert_called_once_with(item_url(item_id), timeout=REQUEST_TIMEOUT)
         self.assertIsNone(result)
 
-    @patch('pynews.comments.requests.get')
-    def test_fetch_item_exception(self, mock_get):
+    def test_fetch_item_exception(self):
         """Test fetch_item handling a request exception."""
+        mock_get = self.mock_get
         # Arrange
         item_id = 12345
         mock_get.side_effect = Exception("Network error")
@@ -57,16 +68,64 @@ class TestFetchItem(unittest.TestCase):
         result = fetch_item(item_id)
         
         # Assert
-        mock_get.assert_called_once_with(URLS['item'].format(item_id))
+        mock_get.assert_called_once_with(item_url(item_id), timeout=REQUEST_TIMEOUT)
         self.assertIsNone(result)
 
 
+    def test_fetch_item_cached(self):
+        """Test fetch_item reuses a fetched item unless asked to refresh it."""
+        # Arrange
+        item_id = 12345
+        self.mock_get.return_value = create_mock_response(200, {"id": item_id, "kids": [111]})
+        
+        # Act
+        first = fetch_item(item_id)
+        second = fetch_item(item_id)
+        self.mock_get.return_value = create_mock_response(200, {"id": item_id, "kids": [111, 222]})
+        refreshed = fetch_item(item_id, refresh=True)
+        
+        # Assert
+        self.assertIs(second, first)
+        self.assertEqual(refreshed["kids"], [111, 222])
+        self.assertEqual(fetch_item(item_id), refreshed)  # The refresh updated the cache
+        self.assertEqual(self.mock_get.call_count, 2)
+
+    def test_fetch_item_missing_not_cached(self):
+        """Test fetch_item asks again for items that weren't found."""
+        self.mock_get.return_value = create_mock_response(404, None)
+        
+        self.assertIsNone(fetch_item(99999))
+        self.assertIsNone(fetch_item(99999))
+        self.assertEqual(self.mock_get.call_count, 2)
+
+
 class TestFetchCommentTree(unittest.TestCase):
     """Tests for the fetch_comment_tree function."""
 
-    @patch('pynews.comments.fetch_item')
-    def test_fetch_comment_tree_empty(self, mock_fetch_item):
+    @classmethod
+    def setUpClass(cls):
+        """Build the mock comments once; fetch_comment_tree copies rather than modifies them."""
+        # Top-level comments on story 12345
+        cls.top_111 = generate_mock_comment(111, 12345)
+        cls.top_222 = generate_mock_comment(222, 12345)
+        # 111 has replies 222 and 333; 222 may have reply 444
+        cls.parent_111 = generate_mock_comment(111, 12345, [222, 333])
+        cls.reply_222 = generate_mock_comment(222, 111)
+        cls.reply_222_with_reply = generate_mock_comment(222, 111, [444])
+        cls.deleted_222 = generate_mock_comment(222, 111, deleted=True)
+        cls.reply_333 = generate_mock_comment(333, 111)
+        cls.dead_333 = generate_mock_comment(333, 111, dead=True)
+        cls.reply_444 = generate_mock_comment(444, 222)
+
+    def setUp(self):
+        """Patch fetch_item for each test."""
+        patcher = patch('pynews.comments.fetch_item')
+        self.mock_fetch_item = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_fetch_comment_tree_empty(self):
         """Test fetch_comment_tree with empty comment IDs."""
+        mock_fetch_item = self.mock_fetch_item
         # Act
         result = fetch_comment_tree([])
         
@@ -74,19 +133,19 @@ class TestFetchCommentTree(unittest.TestCase):
         mock_fetch_item.assert_not_called()
         self.assertEqual(result, [])
 
-    @patch('pynews.comments.fetch_item')
-    def test_fetch_comment_tree_simple(self, mock_fetch_item):
+    def test_fetch_comment_tree_simple(self):
         """Test fetch_comment_tree with a simple list of comment IDs."""
+        mock_fetch_item = self.mock_fetch_item
         # Arrange
         comment_ids = [111, 222]
-        comment1 = generate_mock_comment(111, 12345)
-        comment2 = generate_mock_comment(222, 12345)
+        comment1 = self.top_111
+        comment2 = self.top_222
         
         # Configure mock to return different values based on input
-        mock_fetch_item.side_effect = lambda item_id: {
+        mock_fetch_item.side_effect = {
             111: comment1,
             222: comment2,
-        }.get(item_id)
+        }.get
         
         # Act
         result = fetch_comment_tree(comment_ids)
@@ -98,22 +157,22 @@ class TestFetchCommentTree(unittest.TestCase):
         self.assertEqual(result[0]['children'], [])  # No child comments
         self.assertEqual(result[1]['children'], [])
 
-    @patch('pynews.comments.fetch_item')
-    def test_fetch_comment_tree_nested(self, mock_fetch_item):
+    def test_fetch_comment_tree_nested(self):
         """Test fetch_comment_tree with nested comments."""
+        mock_fetch_item = self.mock_fetch_item
         # Arrange
         # Comment structure: 111 has children 222 and 333, 222 has child 444
-        comment1 = generate_mock_comment(111, 12345, [222, 333])
-        comment2 = generate_mock_comment(222, 111, [444])
-        comment3 = generate_mock_comment(333, 111)
-        comment4 = generate_mock_comment(444, 222)
+        comment1 = self.parent_111
+        comment2 = self.reply_222_with_reply
+        comment3 = self.reply_333
+        comment4 = self.reply_444
         
-        mock_fetch_item.side_effect = lambda item_id: {
+        mock_fetch_item.side_effect = {
             111: comment1,
             222: comment2,
             333: comment3,
             444: comment4,
-        }.get(item_id)
+        }.get
         
         # Act
         result = fetch_comment_tree([111])
@@ -133,19 +192,19 @@ class TestFetchCommentTree(unittest.TestCase):
         self.assertEqual(len(grandchildren), 1)
         self.assertEqual(grandchildren[0]['id'], 444)
 
-    @patch('pynews.comments.fetch_item')
-    def test_fetch_comment_tree_with_deleted(self, mock_fetch_item):
+    def test_fetch_comment_tree_with_deleted(self):
         """Test fetch_comment_tree properly handles deleted comments."""
+        mock_fetch_item = self.mock_fetch_item
         # Arrange
-        comment1 = generate_mock_comment(111, 12345, [222, 333])
-        comment2 = generate_mock_comment(222, 111, deleted=True)
-        comment3 = generate_mock_comment(333, 111)
+        comment1 = self.parent_111
+        comment2 = self.deleted_222
+        comment3 = self.reply_333
         
-        mock_fetch_item.side_effect = lambda item_id: {
+        mock_fetch_item.side_effect = {
             111: comment1,
             222: comment2,
             333: comment3,
-        }.get(item_id)
+        }.get
         
         # Act
         result = fetch_comment_tree([111])
@@ -159,19 +218,19 @@ class TestFetchCommentTree(unittest.TestCase):
         self.assertTrue(children[0].get('deleted', False))
         self.assertFalse(children[1].get('deleted', False))
 
-    @patch('pynews.comments.fetch_item')
-    def test_fetch_comment_tree_with_dead(self, mock_fetch_item):
+    def test_fetch_comment_tree_with_dead(self):
         """Test fetch_comment_tree properly handles dead comments."""
+        mock_fetch_item = self.mock_fetch_item
         # Arrange
-        comment1 = generate_mock_comment(111, 12345, [222, 333])
-        comment2 = generate_mock_comment(222, 111)
-        comment3 = generate_mock_comment(333, 111, dead=True)
+        comment1 = self.parent_111
+        comment2 = self.reply_222
+        comment3 = self.dead_333
         
-        mock_fetch_item.side_effect = lambda item_id: {
+        mock_fetch_item.side_effect = {
             111: comment1,
             222: comment2,
             333: comment3,
-        }.get(item_id)
+        }.get
         
         # Act
         result = fetch_comment_tree([111])
@@ -185,19 +244,19 @@ class TestFetchCommentTree(unittest.TestCase):
         self.assertFalse(children[0].get('dead', False))
         self.assertTrue(children[1].get('dead', False))
 
-    @patch('pynews.comments.fetch_item')
-    def test_fetch_comment_tree_with_none_response(self, mock_fetch_item):
+    def test_fetch_comment_tree_with_none_response(self):
         """Test fetch_comment_tree properly handles None responses from fetch_item."""
+        mock_fetch_item = self.mock_fetch_item
         # Arrange
-        comment1 = generate_mock_comment(111, 12345, [222, 333])
+        comment1 = self.parent_111
         # Simulate 222 not being found
-        comment3 = generate_mock_comment(333, 111)
+        comment3 = self.reply_333
         
-        mock_fetch_item.side_effect = lambda item_id: {
+        mock_fetch_item.side_effect = {
             111: comment1,
             222: None,
             333: comment3,
-        }.get(item_id)
+        }.get
         
         # Act
         result = fetch_comment_tree([111])
@@ -208,6 +267,174 @@ class TestFetchCommentTree(unittest.TestCase):
         self.assertEqual(len(children), 1)  # Only one child is included
         self.assertEqual(children[0]['id'], 333)
 
+    def test_fetch_comment_tree_one_pool_per_fetch(self):
+        """Test fetch_comment_tree fetches every level through one thread pool, keeping API order."""
+        mock_fetch_item = self.mock_fetch_item
+        # Arrange
+        # Comment structure: 111 has children 222 and 333, 222 has child 444
+        comments = {
+            111: self.parent_111,
+            222: self.reply_222_with_reply,
+            333: self.reply_333,
+            444: self.reply_444,
+        }
+        mock_fetch_item.side_effect = comments.get
+        
+        # Act
+        with patch('pynews.comments.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_pool:
+            result = fetch_comment_tree([111], max_threads=1)
+        
+        # Assert
+        mock_pool.assert_called_once_with(max_workers=1)
+        self.assertEqual(mock_fetch_item.call_count, 4)
+        self.assertEqual([c['id'] for c in result[0]['children']], [222, 333])
+        self.assertEqual(result[0]['children'][0]['children'][0]['id'], 444)
+
+
+class TestFetchCommentTreeBulk(unittest.TestCase):
+    """Tests for fetching a whole comment tree in one request."""
+
+    def setUp(self):
+        """Build an Algolia item for story 12345: 111 has children 222 and 333, 222 has child 444."""
+        def node(item_id, parent_id, children=()):
+            return {
+                'id': item_id,
+                'type': 'comment',
+                'author': f'user_{item_id}',
+                'text': f'This is comment {item_id}',
+                'created_at_i': 1616513396,
+                'parent_id': parent_id,
+                'children': list(children),
+            }
+        
+        self.item = {
+            'id': 12345,
+            'type': 'story',
+            'children': [
+                node(111, 12345, [node(222, 111, [node(444, 222)]), node(333, 111)]),
+            ],
+        }
+
+    @patch('pynews.comments._SESSION.get')
+    def test_fetch_comment_tree_bulk_single_request(self, mock_get):
+        """Test the four-comment tree is fetched with one request and keeps its shape."""
+        # Arrange
+        mock_get.return_value = create_mock_response(200, self.item)
+        
+        # Act
+        result = fetch_comment_tree_bulk(12345)
+        
+        # Assert
+        self.assertEqual(mock_get.call_count, 1)
+        mock_get.assert_called_once_with(URLS["item_tree"].format(12345), timeout=REQUEST_TIMEOUT)
+        self.assertEqual([c['id'] for c in result], [111])
+        self.assertEqual(result[0]['by'], 'user_111')
+        self.assertEqual(result[0]['kids'], [222, 333])
+        children = result[0]['children']
+        self.assertEqual([c['id'] for c in children], [222, 333])
+        self.assertEqual(children[0]['children'][0]['id'], 444)
+        self.assertEqual(children[0]['children'][0]['parent'], 222)
+
+    @patch('pynews.comments._SESSION.get')
+    def test_fetch_comment_tree_bulk_skips_deleted(self, mock_get):
+        """Test deleted comments, which have no author, are dropped with their replies."""
+        # Arrange
+        self.item['children'][0]['children'][0]['author'] = None
+        mock_get.return_value = create_mock_response(200, self.item)
+        
+        # Act
+        result = fetch_comment_tree_bulk(12345)
+        
+        # Assert
+        self.assertEqual([c['id'] for c in result[0]['children']], [333])
+
+    @patch('pynews.comments._SESSION.get')
+    def test_fetch_comment_tree_bulk_checks_known_replies(self, mock_get):
+        """Test the bulk tree is only used when it lists every known direct reply."""
+        # Arrange - 555 is deleted but still listed, 666 isn't indexed yet
+        deleted = {'id': 555, 'type': 'comment', 'author': None, 'parent_id': 12345, 'children': []}
+        self.item['children'].append(deleted)
+        mock_get.return_value = create_mock_response(200, self.item)
+        
+        # Act / Assert
+        self.assertEqual([c['id'] for c in fetch_comment_tree_bulk(12345, [111, 555])], [111])
+        self.assertIsNone(fetch_comment_tree_bulk(12345, [111, 555, 666]))
+
+    @patch('pynews.comments._SESSION.get')
+    def test_fetch_comment_tree_bulk_keeps_ranked_order(self, mock_get):
+        """Test the top-level comments follow the HN API's ranked order, not Algolia's."""
+        # Arrange - Algolia lists 777 after 111, HN ranks it first
+        later = {'id': 777, 'type': 'comment', 'author': 'user7', 'text': 'Later',
+                 'created_at_i': 1616513496, 'parent_id': 12345, 'children': []}
+        self.item['children'].append(later)
+        mock_get.return_value = create_mock_response(200, self.item)
+        
+        # Act
+        result = fetch_comment_tree_bulk(12345, [777, 111])
+        
+        # Assert
+        self.assertEqual([c['id'] for c in result], [777, 111])
+
+    @patch('pynews.comments._SESSION.get')
+    def test_fetch_comment_tree_bulk_unavailable(self, mock_get):
+        """Test fetch_comment_tree_bulk returns None when the tree can't be fetched."""
+        mock_get.return_value = create_mock_response(503, None)
+        self.assertIsNone(fetch_comment_tree_bulk(12345))
+        
+        mock_get.side_effect = requests.ConnectionError()
+        self.assertIsNone(fetch_comment_tree_bulk(12345))
+
+    @patch('pynews.comments.fetch_item')
+    @patch('pynews.comments.fetch_comment_tree_bulk')
+    def test_fetch_comment_tree_prefers_bulk(self, mock_bulk, mock_fetch_item):
+        """Test fetch_comment_tree uses the bulk tree when given the root ID."""
+        # Arrange
+        tree = [{'id': 111, 'children': []}]
+        mock_bulk.return_value = tree
+        progress = MagicMock()
+        
+        # Act
+        result = fetch_comment_tree([111], progress_callback=progress, root_id=12345)
+        
+        # Assert
+        self.assertIs(result, tree)
+        mock_bulk.assert_called_once_with(12345, [111])
+        mock_fetch_item.assert_not_called()
+        progress.assert_called_with(100)
+
+    @patch('pynews.comments.fetch_item')
+    @patch('pynews.comments.fetch_comment_tree_bulk', return_value=None)
+    def test_fetch_comment_tree_falls_back_to_items(self, mock_bulk, mock_fetch_item):
+        """Test fetch_comment_tree fetches item by item when the bulk tree is unavailable."""
+        # Arrange
+        mock_fetch_item.side_effect = {111: generate_mock_comment(111, 12345)}.get
+        
+        # Act
+        result = fetch_comment_tree([111], root_id=12345)
+        
+        # Assert
+        mock_bulk.assert_called_once_with(12345, [111])
+        mock_fetch_item.assert_called_once_with(111)
+        self.assertEqual([c['id'] for c in result], [111])
+
+    @patch('pynews.comments.fetch_item')
+    @patch('pynews.comments._SESSION.get')
+    def test_fetch_comment_tree_falls_back_when_bulk_tree_is_stale(self, mock_get, mock_fetch_item):
+        """Test fetch_comment_tree fetches item by item when the bulk tree misses known replies."""
+        # Arrange - the Algolia index hasn't caught up with the story's kids yet
+        mock_get.return_value = create_mock_response(200, {'id': 1, 'children': []})
+        mock_fetch_item.side_effect = {
+            2: generate_mock_comment(2, 1),
+            3: generate_mock_comment(3, 1),
+        }.get
+        
+        # Act
+        result = fetch_comment_tree([2, 3], root_id=1)
+        
+        # Assert
+        mock_get.assert_called_once()
+        self.assertEqual(sorted(c['id'] for c in result), [2, 3])
+
 
 class TestSortCommentTree(unittest.TestCase):
     """Tests for the sort_comment_tree function."""
@@ -300,6 +527,32 @@ class TestSortCommentTree(unittest.TestCase):
         self.assertEqual(children[0]['id'], 222)
         self.assertEqual(children[1]['id'], 333)
 
+    def test_sort_comment_tree_every_level(self):
+        """Test that every level is sorted, including grandchildren and comments without a time."""
+        # Arrange
+        comments = [
+            {'id': 111, 'time': 30, 'children': [
+                {'id': 222, 'time': 20, 'children': [
+                    {'id': 444, 'time': 40, 'children': []},
+                    {'id': 555, 'children': []},  # No time sorts as 0
+                    {'id': 666, 'time': 10, 'children': []},
+                ]},
+                {'id': 333, 'time': 10, 'children': []},
+            ]},
+            {'id': 777, 'time': 5, 'children': []},
+        ]
+        progress = MagicMock()
+        
+        # Act
+        sorted_comments = sort_comment_tree(comments, CommentSortOrder.OLDEST_FIRST, progress)
+        
+        # Assert
+        self.assertEqual([c['id'] for c in sorted_comments], [777, 111])
+        children = sorted_comments[1]['children']
+        self.assertEqual([c['id'] for c in children], [333, 222])
+        self.assertEqual([c['id'] for c in children[1]['children']], [555, 666, 444])
+        progress.assert_called_with(100)
+
 
 class TestCleanCommentText(unittest.TestCase):
     """Tests for the clean_comment_text function."""
@@ -348,6 +601,29 @@ class TestCleanCommentText(unittest.TestCase):
         # Assert
         self.assertEqual(cleaned, "Level 1 Level 2 Level 3")
 
+    def test_clean_comment_text_multiline_code(self):
+        """Test every line of a code block is indented and its entities decoded."""
+        # Arrange
+        html_text = "Try:<pre><code>if a &lt; b:\n    return a\n</code></pre>Done<p>Thanks"
+        
+        # Act
+        cleaned = clean_comment_text(html_text)
+        
+        # Assert
+        self.assertEqual(cleaned, "Try:\n\n    if a < b:\n        return a\nDone\n\nThanks")
+
+    def test_clean_comment_text_code_block_ends_its_line(self):
+        """Test a leading code block keeps every line indented and ends its line."""
+        cases = (
+            ("<pre><code>x = 1\ny &lt; 2</code></pre>after",
+             "    x = 1\n    y < 2\nafter"),
+            ("<pre><code>def f():\n    return 1</code></pre>after",
+             "    def f():\n        return 1\nafter"),
+        )
+        for html_text, expected in cases:
+            with self.subTest(html_text=html_text):
+                self.assertEqual(clean_comment_text(html_text), expected)
+
 
 class TestCountCommentTree(unittest.TestCase):
     """Tests for the count_comment_tree function."""
@@ -399,6 +675,25 @@ class TestCountCommentTree(unittest.TestCase):
         # Assert
         self.assertEqual(count, 4)  # 1 parent + 2 children + 1 grandchild
 
+    def test_count_comment_tree_deep_chain(self):
+        """Test counting a reply chain deeper than the recursion limit."""
+        # Arrange
+        depth = sys.getrecursionlimit() * 2
+        comments = []
+        level = comments
+        for comment_id in range(depth):
+            comment = {'id': comment_id, 'time': comment_id, 'children': []}
+            level.append(comment)
+            level = comment['children']
+        
+        # Act
+        count = count_comment_tree(comments)
+        sorted_comments = sort_comment_tree(comments, CommentSortOrder.NEWEST_FIRST)
+        
+        # Assert
+        self.assertEqual(count, depth)
+        self.assertEqual(sorted_comments[0]['id'], 0)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,21 +1,15 @@
 """
 Utilities for testing Job listings functionality.
 """
-import json
-from unittest.mock import Mock
+import argparse
+import io
+import random
+from contextlib import redirect_stdout
+from functools import lru_cache
+from unittest.mock import DEFAULT, patch
 
-
-def create_mock_response(status_code=200, json_data=None):
-    """Create a mock requests response object with the given status code and JSON data."""
-    mock_response = Mock()
-    mock_response.status_code = status_code
-    
-    def mock_json():
-        return json_data
-        
-    mock_response.json = mock_json
-    
-    return mock_response
+from pynews.parser import get_parser_options
+from mock_responses import create_mock_response  # noqa: F401  re-exported for the test modules
 
 
 def generate_mock_job_story(job_id=20000, score=5, title="Job: Software Engineer at Example Corp"):
@@ -42,7 +36,7 @@ def generate_mock_job_story(job_id=20000, score=5, title="Job: Software Engineer
     }
 
 
-def generate_mock_job_stories(num_jobs=10, base_id=20000, vary_timestamps=True, vary_scores=True):
+def generate_mock_job_stories(num_jobs=10, base_id=20000, vary_timestamps=True, vary_scores=True, seed=0):
     """
     Generate a list of mock job stories with various attributes.
     
@@ -51,11 +45,19 @@ def generate_mock_job_stories(num_jobs=10, base_id=20000, vary_timestamps=True,
         base_id: Starting ID for the jobs
         vary_timestamps: If True, give each job a different timestamp
         vary_scores: If True, vary job scores
+        seed: Seed for the random scores and keywords, so every run gets the same jobs
         
     Returns:
-        List of job story dictionaries
+        List of job story dictionaries, fresh copies the caller may modify
     """
-    import random
+    jobs = _build_mock_job_stories(num_jobs, base_id, vary_timestamps, vary_scores, seed)
+    return [dict(job) for job in jobs]
+
+
+@lru_cache(maxsize=None)
+def _build_mock_job_stories(num_jobs, base_id, vary_timestamps, vary_scores, seed):
+    """Build the jobs for generate_mock_job_stories once per set of arguments."""
+    rng = random.Random(seed)
     
     companies = ["Google", "Amazon", "Meta", "Apple", "Microsoft", "Netflix", "Startup", 
                 "Tesla", "SpaceX", "Remote Company"]
@@ -76,11 +78,11 @@ def generate_mock_job_stories(num_jobs=10, base_id=20000, vary_timestamps=True,
         timestamp = base_time + (3600 * i if vary_timestamps else 0)
         
         # Generate varying scores if requested
-        score = random.randint(1, 30) if vary_scores else 5
+        score = rng.randint(1, 30) if vary_scores else 5
         
         # Create job with keywords in the text for testing keyword filtering
         keywords = ["remote", "senior", "junior", "entry-level", "Python", "JavaScript", "React", "SQL"]
-        selected_keywords = random.sample(keywords, 3)  # Pick 3 random keywords
+        selected_keywords = rng.sample(keywords, 3)  # Pick 3 random keywords
         text = f"<p>This is a job for a {position} at {company}.</p><p>We're looking for someone with skills in {', '.join(selected_keywords)}.</p>"
         
         jobs.append({
@@ -94,9 +96,76 @@ def generate_mock_job_stories(num_jobs=10, base_id=20000, vary_timestamps=True,
             "url": f"https://example.com/jobs/{job_id}"
         })
     
-    return jobs
+    return tuple(jobs)
 
 
 def generate_job_story_ids(num_jobs=100):
     """Generate a list of mock job story IDs."""
-    return list(range(20000, 20000 + num_jobs))
\ No newline at end of file
+    return list(range(20000, 20000 + num_jobs))
+
+
+@lru_cache(maxsize=None)
+def _default_cli_options():
+    """Parse an empty command line once and return the option defaults."""
+    with patch('sys.argv', ['pynews']):
+        return dict(vars(get_parser_options()))
+
+
+def make_cli_options(**overrides):
+    """
+    Build command line options as main() receives them from the parser.
+    
+    Args:
+        **overrides: Option values to set instead of the parser defaults
+        
+    Returns:
+        argparse.Namespace with every parser option
+    """
+    return argparse.Namespace(**{**_default_cli_options(), **overrides})
+
+
+class JobViewPatchMixin:
+    """
+    Mixin that patches the job view's data sources and terminal input for each test.
+    
+    Output is captured in self.stdout instead of being patched out, so tests
+    can assert on what was printed.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the job IDs and mock jobs shared by every test of the class."""
+        super().setUpClass()
+        cls.job_ids = generate_job_story_ids(10)
+        cls.mock_jobs = generate_mock_job_stories(10)
+        cls.jobs_by_id = {job["id"]: job for job in cls.mock_jobs}
+
+    def setUp(self):
+        """Start one patcher for every collaborator of display_job_listings."""
+        patcher = patch.multiple(
+            'pynews.job_view',
+            get_stories=DEFAULT,
+            get_story=DEFAULT,
+            clear_screen=DEFAULT,
+            prompt_for_input=DEFAULT,
+            read_key=DEFAULT,
+            LoadingIndicator=DEFAULT,
+        )
+        self.mocks = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.stdout = io.StringIO()
+        redirect = redirect_stdout(self.stdout)
+        redirect.__enter__()
+        self.addCleanup(redirect.__exit__, None, None, None)
+
+    def serve_jobs(self, jobs=None):
+        """
+        Make the patched job view list self.job_ids and fetch jobs by their ID.
+        
+        Args:
+            jobs: Jobs get_story returns, looked up by 'id'; defaults to self.mock_jobs
+        """
+        self.mocks['get_stories'].return_value = self.job_ids
+        by_id = self.jobs_by_id if jobs is None else {job["id"]: job for job in jobs}
+        self.mocks['get_story'].side_effect = by_id.get
@@ -1,15 +1,12 @@
 """
 Unit tests for the Job listings functionality in PyNews.
 """
-import sys
 import unittest
 from unittest.mock import patch, MagicMock, call
 import time
 
-# Add the parent directory to the path so we can import the modules
-sys.path.append("..") # Add parent directory to path
-
 from pynews.job_view import (
+    _load_jobs,
     display_job_listings,
     extract_company_name,
     filter_jobs_by_company,
@@ -21,37 +18,36 @@ from pynews.job_view import (
     format_score
 )
 from test_job_utils import (
+    JobViewPatchMixin,
     create_mock_response,
-    generate_mock_job_story,
-    generate_mock_job_stories,
-    generate_job_story_ids
+    generate_mock_job_story
 )
 
 
 class TestJobViewUtilityFunctions(unittest.TestCase):
     """Tests for utility functions in the job view module."""
     
+    COMPANY_NAME_CASES = [
+        # (case, title, expected company)
+        ("standard", "Job: Software Engineer at Google", "Google"),
+        ("remote suffix", "Job: Frontend Developer at Startup (Remote)", "Startup"),
+        ("multi-word company", "Job: Data Scientist at Machine Learning Corp", "Machine Learning Corp"),
+        ("no company", "Job: DevOps Engineer", ""),
+        ("unusual format", "Software Engineer - Google", ""),
+    ]
+
+    HIGHLIGHT_CASES = [
+        # (case, text, keywords, case_sensitive, expect highlighting)
+        ("basic", "This is a Python job with JavaScript requirements", ["python", "javascript"], False, True),
+        ("case sensitive", "This is a Python job", ["python"], True, False),
+        ("no keywords", "This is a job description", None, False, False),
+    ]
+
     def test_extract_company_name(self):
         """Test extracting company name from job title."""
-        # Test standard job title format
-        title = "Job: Software Engineer at Google"
-        self.assertEqual(extract_company_name(title), "Google")
-        
-        # Test with 'remote' suffix
-        title = "Job: Frontend Developer at Startup (Remote)"
-        self.assertEqual(extract_company_name(title), "Startup")
-        
-        # Test with multi-word company name
-        title = "Job: Data Scientist at Machine Learning Corp"
-        self.assertEqual(extract_company_name(title), "Machine Learning Corp")
-        
-        # Test with no company name
-        title = "Job: DevOps Engineer"
-        self.assertEqual(extract_company_name(title), "")
-        
-        # Test with unusual format
-        title = "Software Engineer - Google"
-        self.assertEqual(extract_company_name(title), "")
+        for name, title, expected in self.COMPANY_NAME_CASES:
+            with self.subTest(case=name):
+                self.assertEqual(extract_company_name(title), expected)
     
     def test_format_absolute_date(self):
         """Test formatting timestamp to absolute date."""
@@ -64,6 +60,17 @@ class TestJobViewUtilityFunctions(unittest.TestCase):
         # Test with None
         result = format_absolute_date(None)
         self.assertEqual(result, "Unknown date")
+
+    def test_format_absolute_date_cached(self):
+        """Test that formatting the same timestamp again is served from the cache."""
+        format_absolute_date.cache_clear()
+        self.addCleanup(format_absolute_date.cache_clear)
+        
+        first = format_absolute_date(1616513396)
+        second = format_absolute_date(1616513396)
+        
+        self.assertEqual(second, first)
+        self.assertEqual(format_absolute_date.cache_info().hits, 1)
     
     def test_format_score(self):
         """Test formatting job score."""
@@ -76,22 +83,49 @@ class TestJobViewUtilityFunctions(unittest.TestCase):
     
     def test_highlight_keywords(self):
         """Test highlighting keywords in text."""
-        # Test basic highlighting
-        text = "This is a Python job with JavaScript requirements"
-        keywords = ["python", "javascript"]
-        highlighted = highlight_keywords(text, keywords)
-        self.assertNotEqual(highlighted, text)  # Should be different (highlighted)
+        for name, text, keywords, case_sensitive, changed in self.HIGHLIGHT_CASES:
+            with self.subTest(case=name):
+                highlighted = highlight_keywords(text, keywords, case_sensitive=case_sensitive)
+                if changed:
+                    self.assertNotEqual(highlighted, text)
+                else:
+                    self.assertEqual(highlighted, text)
+
+    @patch('pynews.job_view.USE_COLORS', False)
+    def test_highlight_keywords_single_pass(self):
+        """Test that overlapping keywords are highlighted once, keeping the original casing."""
+        highlighted = highlight_keywords("Java vs JavaScript", ["java", "javascript"])
+        self.assertEqual(highlighted, "*Java* vs *JavaScript*")
+
+    @patch('pynews.job_view.USE_COLORS', False)
+    def test_highlight_single_keyword(self):
+        """Test highlighting every occurrence of a single keyword."""
+        highlighted = highlight_keywords("Go, go, GO!", ["go"])
+        self.assertEqual(highlighted, "*Go*, *go*, *GO*!")
+        
+        highlighted = highlight_keywords("Go, go, GO!", ["go"], case_sensitive=True)
+        self.assertEqual(highlighted, "Go, *go*, GO!")
+
+    @patch('pynews.job_view.get_story')
+    def test_load_jobs(self, mock_get_story):
+        """Test jobs are fetched in ID order, skipping missing ones, with company, position and search text added."""
+        # Arrange
+        jobs = {
+            20000: generate_mock_job_story(20000, title="Acme is hiring engineers"),
+            20002: generate_mock_job_story(20002, title="Backend Engineer at Initech"),
+        }
+        mock_get_story.side_effect = jobs.get
         
-        # Test case sensitivity
-        text = "This is a Python job"
-        keywords = ["python"]
-        highlighted = highlight_keywords(text, keywords, case_sensitive=True)
-        self.assertEqual(highlighted, text)  # No match due to case sensitivity
+        # Act
+        result = _load_jobs([20002, 20001, 20000])
         
-        # Test with no keywords
-        text = "This is a job description"
-        highlighted = highlight_keywords(text, None)
-        self.assertEqual(highlighted, text)  # Should be unchanged
+        # Assert
+        self.assertEqual(mock_get_story.call_count, 3)
+        self.assertEqual([job['id'] for job in result], [20002, 20000])
+        self.assertEqual(result[0]['company'], "Initech")
+        self.assertEqual(result[1]['company'], "Acme")
+        self.assertEqual(result[1]['position'], "Acme is hiring engineers")
+        self.assertTrue(result[0]['search_text'].startswith("backend engineer at initech "))
 
 
 class TestJobFiltering(unittest.TestCase):
@@ -155,6 +189,13 @@ class TestJobFiltering(unittest.TestCase):
         filtered = filter_jobs_by_keywords(jobs, ["Python"], case_sensitive=True)
         self.assertEqual(len(filtered), 2)  # Two jobs mention Python with exact case
 
+    def test_filter_jobs_by_keywords_search_text(self):
+        """Test that a job's precomputed search text is used for case-insensitive matching only."""
+        jobs = [{"title": "Job: Engineer at Acme", "text": "Python", "search_text": "job: engineer at acme python"}]
+        
+        self.assertEqual(filter_jobs_by_keywords(jobs, ["PYTHON"]), jobs)
+        self.assertEqual(filter_jobs_by_keywords(jobs, ["python"], case_sensitive=True), [])
+
 
 class TestJobSorting(unittest.TestCase):
     """Tests for job sorting functionality."""
@@ -213,81 +254,57 @@ class TestJobSorting(unittest.TestCase):
         self.assertEqual(sorted_jobs[0]["id"], 3)  # Highest score first
 
 
-class TestDisplayJobListings(unittest.TestCase):
+class TestDisplayJobListings(JobViewPatchMixin, unittest.TestCase):
     """Tests for the display_job_listings function."""
     
-    @patch('pynews.job_view.get_stories')
-    @patch('pynews.job_view.get_story')
-    @patch('pynews.job_view.clear_screen')
-    @patch('pynews.job_view.print')
-    def test_display_job_listings_success(self, mock_print, mock_clear, mock_get_story, mock_get_stories):
+    def test_display_job_listings_success(self):
         """Test displaying job listings successfully."""
         # Arrange
-        job_ids = generate_job_story_ids(10)
-        mock_jobs = generate_mock_job_stories(10)
-        
-        mock_get_stories.return_value = job_ids
-        mock_get_story.side_effect = lambda id: next((j for j in mock_jobs if j["id"] == id), None)
+        self.serve_jobs()
         
         # Act - Simulate pressing 'q' to quit immediately
-        with patch('pynews.job_view.read_key', return_value='q'):
-            with patch('pynews.job_view.LoadingIndicator'):
-                display_job_listings(limit=5)
+        self.mocks['read_key'].return_value = 'q'
+        display_job_listings(limit=5)
         
         # Assert
-        mock_get_stories.assert_called_once_with("job")
-        mock_clear.assert_called()
-        self.assertTrue(mock_print.call_count > 5)  # Should print multiple job items
+        self.mocks['get_stories'].assert_called_once_with("job")
+        self.mocks['clear_screen'].assert_called()
+        self.assertGreater(self.stdout.getvalue().count("\n"), 5)  # Should print multiple job items
     
-    @patch('pynews.job_view.get_stories')
-    @patch('pynews.job_view.print')
-    def test_display_job_listings_no_jobs(self, mock_print, mock_get_stories):
+    def test_display_job_listings_no_jobs(self):
         """Test displaying jobs when none are found."""
         # Arrange
-        mock_get_stories.return_value = []  # No jobs found
+        self.mocks['get_stories'].return_value = []  # No jobs found
         
         # Act
-        with patch('pynews.job_view.LoadingIndicator'):
-            display_job_listings()
+        display_job_listings()
         
         # Assert
-        mock_get_stories.assert_called_once_with("job")
-        mock_print.assert_called_with("\nNo job listings found.")
+        self.mocks['get_stories'].assert_called_once_with("job")
+        self.assertIn("\nNo job listings found.\n", self.stdout.getvalue())
     
-    @patch('pynews.job_view.get_stories')
-    @patch('pynews.job_view.get_story')
-    @patch('pynews.job_view.clear_screen')
-    @patch('pynews.job_view.print')
-    def test_display_job_listings_with_company_filter(self, mock_print, mock_clear, mock_get_story, mock_get_stories):
+    def test_display_job_listings_with_company_filter(self):
         """Test displaying job listings filtered by company."""
         # Arrange
-        job_ids = generate_job_story_ids(10)
         mock_jobs = [
             generate_mock_job_story(20001, title="Job: Engineer at Google"),
             generate_mock_job_story(20002, title="Job: Designer at Microsoft"),
             generate_mock_job_story(20003, title="Job: Manager at Google")
         ]
         
-        mock_get_stories.return_value = job_ids
-        mock_get_story.side_effect = lambda id: next((j for j in mock_jobs if j["id"] == id), None)
+        self.serve_jobs(mock_jobs)
         
         # Act - Filter by Google, simulate pressing 'q' to quit
-        with patch('pynews.job_view.read_key', return_value='q'):
-            with patch('pynews.job_view.LoadingIndicator'):
-                display_job_listings(company_filter="Google")
+        self.mocks['read_key'].return_value = 'q'
+        display_job_listings(company_filter="Google")
         
         # Assert
-        mock_get_stories.assert_called_once_with("job")
-        mock_clear.assert_called()
+        self.mocks['get_stories'].assert_called_once_with("job")
+        self.mocks['clear_screen'].assert_called()
     
-    @patch('pynews.job_view.get_stories')
-    @patch('pynews.job_view.get_story')
-    @patch('pynews.job_view.clear_screen')
-    @patch('pynews.job_view.print')
-    def test_display_job_listings_with_keyword_filter(self, mock_print, mock_clear, mock_get_story, mock_get_stories):
+    def test_display_job_listings_with_keyword_filter(self):
         """Test displaying job listings filtered by keywords."""
         # Arrange
-        job_ids = generate_job_story_ids(10)
         mock_jobs = [
             {
                 "id": 20001,
@@ -312,17 +329,15 @@ class TestDisplayJobListings(unittest.TestCase):
             }
         ]
         
-        mock_get_stories.return_value = job_ids
-        mock_get_story.side_effect = lambda id: next((j for j in mock_jobs if j["id"] == id), None)
+        self.serve_jobs(mock_jobs)
         
         # Act - Filter by Python keyword, simulate pressing 'q' to quit
-        with patch('pynews.job_view.read_key', return_value='q'):
-            with patch('pynews.job_view.LoadingIndicator'):
-                display_job_listings(keywords=["python"])
+        self.mocks['read_key'].return_value = 'q'
+        display_job_listings(keywords=["python"])
         
         # Assert
-        mock_get_stories.assert_called_once_with("job")
-        mock_clear.assert_called()
+        self.mocks['get_stories'].assert_called_once_with("job")
+        self.mocks['clear_screen'].assert_called()
 
 
 if __name__ == '__main__':
@@ -1,16 +1,12 @@
 """
 Integration tests for the Poll stories functionality in PyNews.
 """
-import sys
 import unittest
-from unittest.mock import patch, MagicMock, call
-
-# Add the parent directory to the path
-sys.path.append("..") # Add parent directory to path
+from unittest.mock import patch, MagicMock
 
 from pynews.poll_view import display_poll_titles, display_poll_details
 from pynews.pynews import main
-from pynews.constants import URLS
+from pynews.constants import REQUEST_TIMEOUT, URLS, item_url
 from test_poll_utils import (
     create_mock_response,
     generate_mock_poll_story,
@@ -18,114 +14,93 @@ from test_poll_utils import (
     generate_mock_poll_with_options,
     generate_poll_ids
 )
+from test_utils import SilentViewMixin
+
 
+def _requested_urls(mock_get):
+    """Return the (url, timeout) pairs a patched session.get was called with."""
+    return {(c.args[0], c.kwargs.get('timeout')) for c in mock_get.call_args_list if c.args}
 
-class TestPollViewIntegration(unittest.TestCase):
+
+class TestPollViewIntegration(SilentViewMixin, unittest.TestCase):
     """Integration tests for Poll view with other components."""
 
-    @patch('pynews.utils.req.get')
+    view_module = 'pynews.poll_view'
+
+    @patch('pynews.utils._SESSION.get')
     def test_poll_api_integration(self, mock_get):
         """Test integration between poll view and the HackerNews API."""
         # Arrange
         # Setup for API call to get story IDs
         story_ids = generate_poll_ids(10)
-        story_ids_response = create_mock_response(200, story_ids)
         
-        # Create a poll and options
+        # Create the options of the first poll
         poll_id = 30000
-        poll, options = generate_mock_poll_with_options(poll_id, 100, 20, 3)
+        _, options = generate_mock_poll_with_options(poll_id, 100, 20, 3)
         
-        # Mock responses for poll and options
-        poll_response = create_mock_response(200, poll)
-        option_responses = [create_mock_response(200, option) for option in options]
+        # Create mock API responses, keyed by URL: the story list, a poll for
+        # every story ID (to ensure we find polls) and the first poll's options
+        responses = {URLS["top"]: create_mock_response(200, story_ids)}
+        responses.update(
+            (item_url(story_id), create_mock_response(200, generate_mock_poll_story(story_id, 100, 20, 3)))
+            for story_id in story_ids
+        )
+        responses.update(
+            (item_url(option["id"]), create_mock_response(200, option))
+            for option in options
+        )
+        not_found = create_mock_response(404, None)
         
         # Configure mock to return different responses for different URLs
-        def side_effect(url):
-            if url == URLS["top"]:
-                return story_ids_response
-            elif url == URLS["item"].format(poll_id):
-                return poll_response
-            
-            # Return option responses for option IDs
-            for i, option in enumerate(options):
-                if url == URLS["item"].format(option["id"]):
-                    return option_responses[i]
-                    
-            # Return a poll for other story IDs (to ensure we find polls)
-            for story_id in story_ids:
-                if url == URLS["item"].format(story_id):
-                    if story_id == poll_id:
-                        return poll_response
-                    else:
-                        new_poll, _ = generate_mock_poll_with_options(story_id, 100, 20, 3)
-                        return create_mock_response(200, new_poll)
-            
-            return create_mock_response(404, None)
-            
-        mock_get.side_effect = side_effect
+        mock_get.side_effect = lambda url, **kwargs: responses.get(url, not_found)
         
         # Act - simulate pressing 'q' to quit immediately
-        with patch('pynews.poll_view.getch', return_value='q'):
-            with patch('pynews.poll_view.clear_screen'):
-                with patch('pynews.poll_view.print'):
-                    with patch('pynews.poll_view.LoadingIndicator'):
-                        display_poll_titles(limit=5)
+        with self.silent_ui(return_value='q'):
+            display_poll_titles(limit=5)
         
         # Assert - Check that API was called
-        mock_get.assert_any_call(URLS["top"])  # Should call for story list
+        requested = _requested_urls(mock_get)
+        self.assertIn((URLS["top"], REQUEST_TIMEOUT), requested)  # Should call for story list
         # Should call for at least one poll
-        self.assertTrue(any(call(URLS["item"].format(id)) in mock_get.call_args_list 
-                          for id in story_ids))
+        self.assertTrue(requested & {(item_url(id), REQUEST_TIMEOUT) for id in story_ids})
 
-    @patch('pynews.utils.req.get')
+    @patch('pynews.utils._SESSION.get')
     def test_poll_details_api_integration(self, mock_get):
         """Test API integration when displaying poll details."""
         # Arrange
         poll_id = 30000
         poll, options = generate_mock_poll_with_options(poll_id, 100, 20, 3)
         
-        # Configure mock responses
-        poll_response = create_mock_response(200, poll)
-        option_responses = {
-            opt["id"]: create_mock_response(200, opt) for opt in options
-        }
+        # Create mock API responses for the poll and its options, keyed by URL
+        responses = {item_url(poll_id): create_mock_response(200, poll)}
+        responses.update(
+            (item_url(opt["id"]), create_mock_response(200, opt))
+            for opt in options
+        )
+        not_found = create_mock_response(404, None)
         
-        def side_effect(url):
-            if url == URLS["item"].format(poll_id):
-                return poll_response
-            
-            for opt_id, response in option_responses.items():
-                if url == URLS["item"].format(opt_id):
-                    return response
-            
-            return create_mock_response(404, None)
-            
-        mock_get.side_effect = side_effect
+        mock_get.side_effect = lambda url, **kwargs: responses.get(url, not_found)
         
         # Act - simulate pressing 'q' to quit
-        with patch('pynews.poll_view.getch', return_value='q'):
-            with patch('pynews.poll_view.clear_screen'):
-                with patch('pynews.poll_view.print'):
-                    display_poll_details(poll_id)
+        with self.silent_ui(return_value='q'):
+            display_poll_details(poll_id)
         
         # Assert
-        mock_get.assert_any_call(URLS["item"].format(poll_id))  # Should call for poll
+        requested = _requested_urls(mock_get)
+        self.assertIn((item_url(poll_id), REQUEST_TIMEOUT), requested)  # Should call for poll
         # Should call for each option
-        for opt_id in poll["parts"]:
-            mock_get.assert_any_call(URLS["item"].format(opt_id))
+        expected = {(item_url(opt_id), REQUEST_TIMEOUT) for opt_id in poll["parts"]}
+        self.assertLessEqual(expected, requested)
 
-    @patch('pynews.utils.req.get')
+    @patch('pynews.utils._SESSION.get')
     def test_poll_error_handling(self, mock_get):
         """Test error handling during API calls in the poll view."""
         # Arrange - API fails with exception
         mock_get.side_effect = Exception("API Error")
         
         # Act & Assert - Should handle exception without crashing
-        with patch('pynews.poll_view.clear_screen'):
-            with patch('pynews.poll_view.print'):
-                with patch('pynews.poll_view.LoadingIndicator'):
-                    with patch('pynews.poll_view.getch', return_value='q'):
-                        display_poll_titles()
+        with self.silent_ui(return_value='q'):
+            display_poll_titles()
 
 
 class TestPyNewsCommandLineIntegration(unittest.TestCase):
@@ -1,21 +1,9 @@
 """
 Utilities for testing Poll stories functionality.
 """
-import json
-from unittest.mock import Mock
+import random
 
-
-def create_mock_response(status_code=200, json_data=None):
-    """Create a mock requests response object with the given status code and JSON data."""
-    mock_response = Mock()
-    mock_response.status_code = status_code
-    
-    def mock_json():
-        return json_data
-        
-    mock_response.json = mock_json
-    
-    return mock_response
+from mock_responses import create_mock_response  # noqa: F401  re-exported for the test modules
 
 
 def generate_mock_poll_story(poll_id=30000, score=100, descendants=20, option_count=3):
@@ -72,6 +60,15 @@ def generate_mock_poll_option(option_id, poll_id, score, text):
     }
 
 
+_OPTION_TEXTS = (
+    "Option A - First choice",
+    "Option B - Second choice",
+    "Option C - Third choice",
+    "Option D - Fourth choice",
+    "Option E - Fifth choice",
+)
+
+
 def generate_mock_poll_with_options(poll_id=30000, score=100, descendants=20, option_count=3):
     """
     Generate a mock poll with its options.
@@ -88,13 +85,6 @@ def generate_mock_poll_with_options(poll_id=30000, score=100, descendants=20, op
     poll = generate_mock_poll_story(poll_id, score, descendants, option_count)
     
     options = []
-    option_texts = [
-        "Option A - First choice",
-        "Option B - Second choice",
-        "Option C - Third choice",
-        "Option D - Fourth choice",
-        "Option E - Fifth choice"
-    ]
     
     total_votes = 50  # Total votes to distribute
     votes_per_option = total_votes // option_count
@@ -102,7 +92,7 @@ def generate_mock_poll_with_options(poll_id=30000, score=100, descendants=20, op
     for i, part_id in enumerate(poll["parts"]):
         # Distribute votes, giving more to earlier options
         option_score = votes_per_option * (option_count - i)
-        option_text = option_texts[i] if i < len(option_texts) else f"Option {i+1}"
+        option_text = _OPTION_TEXTS[i] if i < len(_OPTION_TEXTS) else f"Option {i+1}"
         
         options.append(generate_mock_poll_option(
             part_id, poll_id, option_score, option_text
@@ -111,7 +101,7 @@ def generate_mock_poll_with_options(poll_id=30000, score=100, descendants=20, op
     return poll, options
 
 
-def generate_mock_poll_list(num_polls=10, base_id=30000, vary_scores=True, vary_comments=True):
+def generate_mock_poll_list(num_polls=10, base_id=30000, vary_scores=True, vary_comments=True, seed=0):
     """
     Generate a list of mock polls.
     
@@ -120,20 +110,21 @@ def generate_mock_poll_list(num_polls=10, base_id=30000, vary_scores=True, vary_
         base_id: Starting ID for polls
         vary_scores: Whether to generate different scores for each poll
         vary_comments: Whether to generate different comment counts
+        seed: Seed for the random scores, comment and option counts, so every run gets the same polls
         
     Returns:
         List of poll dictionaries
     """
-    import random
+    rng = random.Random(seed)
     polls = []
     
     for i in range(num_polls):
         poll_id = base_id + (i * 100)  # Space out IDs to allow for options
         
         # Vary attributes if requested
-        score = random.randint(5, 500) if vary_scores else 100
-        descendants = random.randint(0, 50) if vary_comments else 20
-        option_count = random.randint(2, 5)
+        score = rng.randint(5, 500) if vary_scores else 100
+        descendants = rng.randint(0, 50) if vary_comments else 20
+        option_count = rng.randint(2, 5)
         
         poll = generate_mock_poll_story(
             poll_id=poll_id,
@@ -1,14 +1,10 @@
 """
 Unit tests for Poll stories functionality in PyNews.
 """
-import sys
 import unittest
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import DEFAULT, patch
 import time
 
-# Add the parent directory to the path
-sys.path.append("..") # Add parent directory to path
-
 from pynews.poll_view import (
     is_poll,
     get_poll_list,
@@ -65,313 +61,263 @@ class TestPollUtilityFunctions(unittest.TestCase):
         # Test with None
         result = format_timestamp(None)
         self.assertEqual(result, "Unknown time")
+    
+    def test_format_timestamp_cached(self):
+        """Test that formatting the same timestamp again is served from the cache."""
+        format_timestamp.cache_clear()
+        self.addCleanup(format_timestamp.cache_clear)
+        
+        first = format_timestamp(1616513396)
+        second = format_timestamp(1616513396)
+        
+        self.assertEqual(second, first)
+        self.assertEqual(format_timestamp.cache_info().hits, 1)
 
 
 class TestGetPollList(unittest.TestCase):
     """Tests for get_poll_list functionality."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the read-only story ids and polls shared by every test."""
+        cls.story_ids_5 = generate_poll_ids(5)
+        cls.story_ids_10 = generate_poll_ids(10)
+        cls.polls_10 = generate_mock_poll_list(10)
+
+    def setUp(self):
+        """Patch the story sources get_poll_list reads from."""
+        patcher = patch.multiple(
+            'pynews.poll_view',
+            get_stories=DEFAULT,
+            get_story=DEFAULT,
+        )
+        self.mocks = patcher.start()
+        self.addCleanup(patcher.stop)
     
-    @patch('pynews.poll_view.get_stories')
-    @patch('pynews.poll_view.get_story')
-    def test_get_poll_list_basic(self, mock_get_story, mock_get_stories):
+    def test_get_poll_list_basic(self):
         """Test basic poll list retrieval."""
         # Arrange
-        story_ids = generate_poll_ids(10)
-        mock_polls = generate_mock_poll_list(10)
-        
-        mock_get_stories.return_value = story_ids
-        mock_get_story.side_effect = lambda id: next((p for p in mock_polls if p["id"] == id), None)
+        self.mocks['get_stories'].return_value = self.story_ids_10
+        self.mocks['get_story'].side_effect = {p["id"]: p for p in self.polls_10}.get
         
         # Act
-        with patch('pynews.poll_view.LoadingIndicator'):
-            result = get_poll_list(limit=5)
+        result = get_poll_list(limit=5)
         
         # Assert
         self.assertEqual(len(result), 5)  # Should limit to 5 polls
-        mock_get_stories.assert_called_once_with("top")
-        self.assertEqual(mock_get_story.call_count, 10)  # Should try all 10 polls to find valid ones
-    
-    @patch('pynews.poll_view.get_stories')
-    @patch('pynews.poll_view.get_story')
-    def test_get_poll_list_min_score(self, mock_get_story, mock_get_stories):
-        """Test poll list with minimum score filtering."""
-        # Arrange
-        story_ids = generate_poll_ids(10)
-        
-        # Create polls with alternating high/low scores
-        mock_polls = []
-        for i in range(10):
-            poll_id = 30000 + (i * 100)
-            score = 200 if i % 2 == 0 else 50  # Alternating high/low scores
-            mock_polls.append(generate_mock_poll_story(poll_id, score))
-        
-        mock_get_stories.return_value = story_ids
-        mock_get_story.side_effect = lambda id: next((p for p in mock_polls if p["id"] == id), None)
-        
-        # Act - filter for polls with score > 100
-        with patch('pynews.poll_view.LoadingIndicator'):
-            result = get_poll_list(min_score=100)
-        
-        # Assert
-        self.assertEqual(len(result), 5)  # Half the polls should meet the criteria
-        for poll in result:
-            self.assertGreaterEqual(poll["score"], 100)
+        self.mocks['get_stories'].assert_called_once_with("top")
+        self.assertEqual(self.mocks['get_story'].call_count, 10)  # Should try all 10 polls to find valid ones
     
-    @patch('pynews.poll_view.get_stories')
-    @patch('pynews.poll_view.get_story')
-    def test_get_poll_list_keyword_filter(self, mock_get_story, mock_get_stories):
-        """Test poll list with keyword filtering."""
-        # Arrange
-        story_ids = generate_poll_ids(5)
+    def test_get_poll_list_filters(self):
+        """Test get_poll_list filtering and sorting options."""
+        # Arrange - polls with alternating high/low scores
+        score_polls = [
+            generate_mock_poll_story(30000 + (i * 100), 200 if i % 2 == 0 else 50)
+            for i in range(10)
+        ]
         
-        # Create polls with specific keywords
-        mock_polls = [
-            {
-                "id": 30000,
-                "type": "poll",
-                "parts": [30001, 30002],
-                "title": "Poll: What Python framework do you prefer?",
-                "text": "Choose your favorite Python web framework",
-                "score": 100
-            },
-            {
-                "id": 30100,
-                "type": "poll",
-                "parts": [30101, 30102],
-                "title": "Poll: Best JavaScript framework?",
-                "text": "Vote for your preferred JS framework",
-                "score": 150
-            },
-            {
-                "id": 30200,
-                "type": "poll",
-                "parts": [30201, 30202],
-                "title": "Poll: Python vs. JavaScript?",
-                "text": "Which language do you prefer for web development",
-                "score": 200
-            },
-            {
-                "id": 30300,
-                "type": "poll",
-                "parts": [30301, 30302],
-                "title": "Poll: Favorite database?",
-                "text": "SQL or NoSQL?",
-                "score": 120
-            },
+        # Polls with specific keywords: (title, text, score)
+        poll_data = [
+            ("Poll: What Python framework do you prefer?", "Choose your favorite Python web framework", 100),
+            ("Poll: Best JavaScript framework?", "Vote for your preferred JS framework", 150),
+            ("Poll: Python vs. JavaScript?", "Which language do you prefer for web development", 200),
+            ("Poll: Favorite database?", "SQL or NoSQL?", 120),
+            ("Poll: Text editor preference?", "Which code editor or IDE do you use?", 80),
+        ]
+        keyword_polls = [
             {
-                "id": 30400,
+                "id": poll_id,
                 "type": "poll",
-                "parts": [30401, 30402],
-                "title": "Poll: Text editor preference?",
-                "text": "Which code editor or IDE do you use?",
-                "score": 80
+                "parts": [poll_id + 1, poll_id + 2],
+                "title": title,
+                "text": text,
+                "score": score
             }
+            for poll_id, (title, text, score) in zip(self.story_ids_5, poll_data)
         ]
         
-        mock_get_stories.return_value = story_ids
-        mock_get_story.side_effect = lambda id: next((p for p in mock_polls if p["id"] == id), None)
-        
-        # Act - filter for polls with Python keyword
-        with patch('pynews.poll_view.LoadingIndicator'):
-            result = get_poll_list(keywords=["python"])
-        
-        # Assert
-        self.assertEqual(len(result), 2)  # Should find two polls with Python
-        for poll in result:
-            python_in_title = "Python" in poll["title"] or "python" in poll["title"]
-            python_in_text = "Python" in poll["text"] or "python" in poll["text"]
-            self.assertTrue(python_in_title or python_in_text)
-    
-    @patch('pynews.poll_view.get_stories')
-    @patch('pynews.poll_view.get_story')
-    def test_get_poll_list_sort_by_comments(self, mock_get_story, mock_get_stories):
-        """Test poll list sorted by comment count."""
-        # Arrange
-        story_ids = generate_poll_ids(5)
-        
-        # Create polls with different comment counts
-        mock_polls = []
-        for i in range(5):
-            poll_id = 30000 + (i * 100)
-            descendants = i * 10  # 0, 10, 20, 30, 40 comments
-            mock_polls.append(generate_mock_poll_story(poll_id, 100, descendants))
-        
-        mock_get_stories.return_value = story_ids
-        mock_get_story.side_effect = lambda id: next((p for p in mock_polls if p["id"] == id), None)
-        
-        # Act - sort by comments
-        with patch('pynews.poll_view.LoadingIndicator'):
-            result = get_poll_list(sort_by_comments=True)
-        
-        # Assert
-        self.assertEqual(len(result), 5)
-        # Check descending order by comment count
-        for i in range(1, len(result)):
-            self.assertGreaterEqual(result[i-1]["descendants"], result[i]["descendants"])
-    
-    @patch('pynews.poll_view.get_stories')
-    @patch('pynews.poll_view.get_story')
-    def test_get_poll_list_sort_by_time(self, mock_get_story, mock_get_stories):
-        """Test poll list sorted by submission time."""
-        # Arrange
-        story_ids = generate_poll_ids(5)
+        # Polls with 0, 10, 20, 30, 40 comments
+        comment_polls = [
+            generate_mock_poll_story(30000 + (i * 100), 100, i * 10)
+            for i in range(5)
+        ]
         
-        # Create polls with different timestamps
-        mock_polls = []
+        # Polls submitted an hour apart
         base_time = 1616513396
+        time_polls = []
         for i in range(5):
-            poll_id = 30000 + (i * 100)
-            timestamp = base_time + (i * 3600)  # Each 1 hour newer
-            poll = generate_mock_poll_story(poll_id, 100, 20)
-            poll["time"] = timestamp
-            mock_polls.append(poll)
-        
-        mock_get_stories.return_value = story_ids
-        mock_get_story.side_effect = lambda id: next((p for p in mock_polls if p["id"] == id), None)
-        
-        # Act - sort by time (newest first)
-        with patch('pynews.poll_view.LoadingIndicator'):
-            result = get_poll_list(sort_by_time=True)
+            poll = generate_mock_poll_story(30000 + (i * 100), 100, 20)
+            poll["time"] = base_time + (i * 3600)
+            time_polls.append(poll)
+        
+        def assert_descending(field):
+            def check(result):
+                values = [poll[field] for poll in result]
+                self.assertEqual(values, sorted(values, reverse=True))
+            return check
+        
+        def assert_min_score(result):
+            self.assertGreaterEqual(min(poll["score"] for poll in result), 100)
+        
+        def assert_mentions_python(result):
+            self.assertTrue(all("python" in f"{p['title']} {p['text']}".lower() for p in result))
+        
+        # (name, story ids, polls, kwargs, expected count, assertion on the result)
+        cases = [
+            ("min_score", self.story_ids_10, score_polls, {"min_score": 100}, 5, assert_min_score),
+            ("keywords", self.story_ids_5, keyword_polls, {"keywords": ["python"]}, 2, assert_mentions_python),
+            ("sort_by_comments", self.story_ids_5, comment_polls, {"sort_by_comments": True}, 5,
+             assert_descending("descendants")),
+            ("sort_by_time", self.story_ids_5, time_polls, {"sort_by_time": True}, 5,
+             assert_descending("time")),
+        ]
         
-        # Assert
-        self.assertEqual(len(result), 5)
-        # Check descending order by timestamp (newest first)
-        for i in range(1, len(result)):
-            self.assertGreaterEqual(result[i-1]["time"], result[i]["time"])
+        for name, story_ids, polls, kwargs, expected_count, check in cases:
+            with self.subTest(name):
+                self.mocks['get_stories'].return_value = story_ids
+                self.mocks['get_story'].side_effect = {p["id"]: p for p in polls}.get
+                
+                # Act
+                result = get_poll_list(**kwargs)
+                
+                # Assert
+                self.assertEqual(len(result), expected_count)
+                check(result)
 
 
 class TestDisplayPollTitles(unittest.TestCase):
     """Tests for display_poll_titles functionality."""
+
+    def setUp(self):
+        """Patch the poll list and the terminal input and output."""
+        patcher = patch.multiple(
+            'pynews.poll_view',
+            get_poll_list=DEFAULT,
+            clear_screen=DEFAULT,
+            print=DEFAULT,
+            getch=DEFAULT,
+        )
+        self.mocks = patcher.start()
+        self.addCleanup(patcher.stop)
     
-    @patch('pynews.poll_view.get_poll_list')
-    @patch('pynews.poll_view.clear_screen')
-    @patch('pynews.poll_view.print')
-    def test_display_poll_titles_basic(self, mock_print, mock_clear, mock_get_poll_list):
+    def test_display_poll_titles_basic(self):
         """Test basic poll titles display."""
         # Arrange
         mock_polls = generate_mock_poll_list(5)
-        mock_get_poll_list.return_value = mock_polls
+        self.mocks['get_poll_list'].return_value = mock_polls
         
         # Act - simulate pressing 'q' to quit
-        with patch('pynews.poll_view.getch', return_value='q'):
-            display_poll_titles(limit=5)
+        self.mocks['getch'].return_value = 'q'
+        display_poll_titles(limit=5)
         
         # Assert
-        mock_get_poll_list.assert_called_once_with(
+        self.mocks['get_poll_list'].assert_called_once_with(
             limit=5, min_score=0, sort_by_comments=False, 
             sort_by_time=False, keywords=None, match_all=False, 
             case_sensitive=False
         )
-        mock_clear.assert_called()
-        self.assertTrue(mock_print.call_count > 5)  # Should print header and polls
+        self.mocks['clear_screen'].assert_called()
+        self.assertTrue(self.mocks['print'].call_count > 5)  # Should print header and polls
     
-    @patch('pynews.poll_view.get_poll_list')
-    @patch('pynews.poll_view.clear_screen')
-    @patch('pynews.poll_view.print')
-    def test_display_poll_titles_empty(self, mock_print, mock_clear, mock_get_poll_list):
+    def test_display_poll_titles_empty(self):
         """Test displaying poll titles when no polls found."""
         # Arrange
-        mock_get_poll_list.return_value = []  # No polls found
+        self.mocks['get_poll_list'].return_value = []  # No polls found
         
         # Act
-        with patch('pynews.poll_view.getch', return_value='q'):
-            display_poll_titles()
+        self.mocks['getch'].return_value = 'q'
+        display_poll_titles()
         
         # Assert
-        mock_get_poll_list.assert_called_once()
-        mock_print.assert_any_call("No poll posts found matching your criteria.")
+        self.mocks['get_poll_list'].assert_called_once()
+        self.mocks['print'].assert_any_call("No poll posts found matching your criteria.")
     
-    @patch('pynews.poll_view.get_poll_list')
     @patch('pynews.poll_view.display_poll_details')
-    @patch('pynews.poll_view.clear_screen')
-    @patch('pynews.poll_view.print')
-    def test_display_poll_titles_view_details(self, mock_print, mock_clear, 
-                                             mock_display_details, mock_get_poll_list):
+    def test_display_poll_titles_view_details(self, mock_display_details):
         """Test viewing poll details from the poll list."""
         # Arrange
         mock_polls = generate_mock_poll_list(5)
-        mock_get_poll_list.return_value = mock_polls
+        self.mocks['get_poll_list'].return_value = mock_polls
         mock_display_details.return_value = {"action": "return_to_list"}
         
         # Act - simulate pressing Enter to view details, then q to quit
-        with patch('pynews.poll_view.getch', side_effect=['\r', 'q']):
-            display_poll_titles(limit=5)
+        self.mocks['getch'].side_effect = ['\r', 'q']
+        display_poll_titles(limit=5)
         
         # Assert
-        mock_get_poll_list.assert_called_once()
+        self.mocks['get_poll_list'].assert_called_once()
         mock_display_details.assert_called_once_with(mock_polls[0]["id"])
     
-    @patch('pynews.poll_view.get_poll_list')
-    @patch('pynews.poll_view.clear_screen')
-    @patch('pynews.poll_view.print')
-    def test_display_poll_titles_pagination(self, mock_print, mock_clear, mock_get_poll_list):
+    def test_display_poll_titles_pagination(self):
         """Test pagination in poll titles display."""
         # Arrange
         mock_polls = generate_mock_poll_list(15)  # 15 polls for multiple pages
-        mock_get_poll_list.return_value = mock_polls
+        self.mocks['get_poll_list'].return_value = mock_polls
         
         # Act - simulate pressing 'n' (next page), 'p' (prev page), then 'q' to quit
-        with patch('pynews.poll_view.getch', side_effect=['n', 'p', 'q']):
-            display_poll_titles(limit=15, page_size=5)  # 5 polls per page
+        self.mocks['getch'].side_effect = ['n', 'p', 'q']
+        display_poll_titles(limit=15, page_size=5)  # 5 polls per page
         
         # Assert
-        mock_get_poll_list.assert_called_once()
+        self.mocks['get_poll_list'].assert_called_once()
         # clear_screen should be called multiple times for each page navigation
-        self.assertTrue(mock_clear.call_count >= 3)
+        self.assertTrue(self.mocks['clear_screen'].call_count >= 3)
 
 
 class TestDisplayPollDetails(unittest.TestCase):
     """Tests for display_poll_details functionality."""
+
+    def setUp(self):
+        """Patch the story source and the terminal input and output."""
+        patcher = patch.multiple(
+            'pynews.poll_view',
+            get_story=DEFAULT,
+            clear_screen=DEFAULT,
+            print=DEFAULT,
+            getch=DEFAULT,
+        )
+        self.mocks = patcher.start()
+        self.addCleanup(patcher.stop)
     
-    @patch('pynews.poll_view.get_story')
-    @patch('pynews.poll_view.clear_screen')
-    @patch('pynews.poll_view.print')
-    def test_display_poll_details_success(self, mock_print, mock_clear, mock_get_story):
+    def test_display_poll_details_success(self):
         """Test successful display of poll details."""
         # Arrange
         poll_id = 30000
         poll, options = generate_mock_poll_with_options(poll_id, 100, 20, 3)
         
         # Configure mock to return poll and options
-        def side_effect(id):
-            if id == poll_id:
-                return poll
-            return next((opt for opt in options if opt["id"] == id), None)
-            
-        mock_get_story.side_effect = side_effect
+        stories = {poll_id: poll, **{opt["id"]: opt for opt in options}}
+        self.mocks['get_story'].side_effect = stories.get
         
         # Act - simulate pressing 'q' to return to list
-        with patch('pynews.poll_view.getch', return_value='q'):
-            result = display_poll_details(poll_id)
+        self.mocks['getch'].return_value = 'q'
+        result = display_poll_details(poll_id)
         
         # Assert
-        mock_get_story.assert_called_with(poll_id)  # Should fetch poll first
+        self.mocks['get_story'].assert_called_with(poll_id)  # Should fetch poll first
         for option in poll["parts"]:
-            mock_get_story.assert_any_call(option)  # Should fetch each option
+            self.mocks['get_story'].assert_any_call(option)  # Should fetch each option
         
-        mock_clear.assert_called()
-        self.assertTrue(mock_print.call_count > 5)  # Should print poll and options
+        self.mocks['clear_screen'].assert_called()
+        self.assertTrue(self.mocks['print'].call_count > 5)  # Should print poll and options
         self.assertEqual(result["action"], "return_to_list")
     
-    @patch('pynews.poll_view.get_story')
-    @patch('pynews.poll_view.print')
-    def test_display_poll_details_not_found(self, mock_print, mock_get_story):
+    def test_display_poll_details_not_found(self):
         """Test displaying details for a non-existent poll."""
         # Arrange
         poll_id = 99999
-        mock_get_story.return_value = None  # Poll not found
+        self.mocks['get_story'].return_value = None  # Poll not found
         
         # Act - simulate pressing any key to continue
-        with patch('pynews.poll_view.getch', return_value='x'):
-            result = display_poll_details(poll_id)
+        self.mocks['getch'].return_value = 'x'
+        result = display_poll_details(poll_id)
         
         # Assert
-        mock_get_story.assert_called_once_with(poll_id)
-        mock_print.assert_any_call("Poll not found or not a valid poll.")
+        self.mocks['get_story'].assert_called_once_with(poll_id)
+        self.mocks['print'].assert_any_call("Poll not found or not a valid poll.")
         self.assertEqual(result, None)
     
-    @patch('pynews.poll_view.get_story')
-    @patch('pynews.poll_view.print')
-    def test_display_poll_details_not_a_poll(self, mock_print, mock_get_story):
+    def test_display_poll_details_not_a_poll(self):
         """Test displaying details for a post that's not a poll."""
         # Arrange
         story_id = 30000
@@ -380,40 +326,33 @@ class TestDisplayPollDetails(unittest.TestCase):
             "title": "Not a poll",
             "type": "story"  # Not a poll type
         }
-        mock_get_story.return_value = story
+        self.mocks['get_story'].return_value = story
         
         # Act - simulate pressing any key to continue
-        with patch('pynews.poll_view.getch', return_value='x'):
-            result = display_poll_details(story_id)
+        self.mocks['getch'].return_value = 'x'
+        result = display_poll_details(story_id)
         
         # Assert
-        mock_get_story.assert_called_once_with(story_id)
-        mock_print.assert_any_call("Poll not found or not a valid poll.")
+        self.mocks['get_story'].assert_called_once_with(story_id)
+        self.mocks['print'].assert_any_call("Poll not found or not a valid poll.")
         self.assertEqual(result, None)
     
-    @patch('pynews.poll_view.get_story')
-    @patch('pynews.poll_view.clear_screen')
-    @patch('pynews.poll_view.print')
-    def test_display_poll_details_view_comments(self, mock_print, mock_clear, mock_get_story):
+    def test_display_poll_details_view_comments(self):
         """Test viewing comments from poll details."""
         # Arrange
         poll_id = 30000
         poll, options = generate_mock_poll_with_options(poll_id, 100, 20, 3)
         
         # Configure mock to return poll and options
-        def side_effect(id):
-            if id == poll_id:
-                return poll
-            return next((opt for opt in options if opt["id"] == id), None)
-            
-        mock_get_story.side_effect = side_effect
+        stories = {poll_id: poll, **{opt["id"]: opt for opt in options}}
+        self.mocks['get_story'].side_effect = stories.get
         
         # Act - simulate pressing 'c' to view comments
-        with patch('pynews.poll_view.getch', return_value='c'):
-            result = display_poll_details(poll_id)
+        self.mocks['getch'].return_value = 'c'
+        result = display_poll_details(poll_id)
         
         # Assert
-        mock_get_story.assert_called_with(poll_id)
+        self.mocks['get_story'].assert_called_with(poll_id)
         self.assertEqual(result["action"], "view_comments")
         self.assertEqual(result["story_id"], poll_id)
 
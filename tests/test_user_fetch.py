@@ -1,14 +1,12 @@
 """
 Unit tests for user information fetching in PyNews.
 """
-import sys
 import unittest
-from unittest.mock import patch, MagicMock, call
-
-# Add the parent directory to the path
-sys.path.append("..") # Add parent directory to path
+from unittest.mock import patch, call
 
+from pynews import user_view as _uv
 from pynews.user_view import (
+    clear_user_cache,
     fetch_user, 
     fetch_submissions, 
     fetch_item,
@@ -22,8 +20,10 @@ from pynews.user_view import (
     display_user_stories,
     format_account_age
 )
-from pynews.constants import URLS
+from pynews.constants import REQUEST_TIMEOUT, URLS
+from test_utils import FROZEN_NOW
 from test_user_utils import (
+    UserFetchPatchMixin,
     create_mock_response,
     generate_mock_user,
     generate_mock_story,
@@ -32,177 +32,163 @@ from test_user_utils import (
 )
 
 
-class TestFetchUser(unittest.TestCase):
+class TestFetchUser(UserFetchPatchMixin, unittest.TestCase):
     """Tests for the fetch_user function."""
 
-    @patch('pynews.user_view.requests.get')
-    @patch('pynews.user_view.LoadingIndicator')
-    def test_fetch_user_success(self, mock_loader, mock_get):
+    def test_fetch_user_success(self):
         """Test fetching a user successfully."""
         # Arrange
         username = "test_user"
         mock_user_data = generate_mock_user(username)
-        mock_get.return_value = create_mock_response(200, mock_user_data)
-        mock_loader_instance = MagicMock()
-        mock_loader.return_value = mock_loader_instance
+        self.mock_get.return_value = create_mock_response(200, mock_user_data)
         
         # Act
         result = fetch_user(username)
         
         # Assert
-        mock_get.assert_called_once_with(URLS["user"].format(username))
-        mock_loader_instance.start.assert_called_once()
+        self.mock_get.assert_called_once_with(URLS["user"].format(username), timeout=REQUEST_TIMEOUT)
+        self.mock_loader.return_value.start.assert_called_once()
         self.assertEqual(result, mock_user_data)
 
-    @patch('pynews.user_view.requests.get')
-    @patch('pynews.user_view.LoadingIndicator')
-    @patch('pynews.user_view.print')
-    def test_fetch_user_not_found(self, mock_print, mock_loader, mock_get):
-        """Test fetching a non-existent user."""
+    def test_fetch_user_reuses_cached_user(self):
+        """Test that later lookups of the same user are served from the cache."""
         # Arrange
-        username = "nonexistent_user"
-        mock_get.return_value = create_mock_response(404, None)
-        mock_loader_instance = MagicMock()
-        mock_loader.return_value = mock_loader_instance
+        username = "test_user"
+        mock_user_data = generate_mock_user(username, karma=1234, created=1234567890)
+        self.mock_get.return_value = create_mock_response(200, mock_user_data)
         
         # Act
-        result = fetch_user(username)
+        user = fetch_user(username)
+        karma = fetch_karma(username)
+        created = fetch_created_timestamp(username)
         
         # Assert
-        mock_get.assert_called_once_with(URLS["user"].format(username))
-        mock_loader_instance.start.assert_called_once()
-        mock_print.assert_called_once()  # Should print error
-        self.assertIsNone(result)
+        self.mock_get.assert_called_once_with(URLS["user"].format(username), timeout=REQUEST_TIMEOUT)
+        self.assertEqual(user, mock_user_data)
+        self.assertEqual(karma, 1234)
+        self.assertEqual(created, 1234567890)
 
-    @patch('pynews.user_view.requests.get')
-    @patch('pynews.user_view.LoadingIndicator')
     @patch('pynews.user_view.print')
-    def test_fetch_user_network_error(self, mock_print, mock_loader, mock_get):
-        """Test handling network errors when fetching a user."""
-        # Arrange
-        username = "test_user"
-        mock_get.side_effect = Exception("Network error")
-        mock_loader_instance = MagicMock()
-        mock_loader.return_value = mock_loader_instance
-        
-        # Act
-        result = fetch_user(username)
+    def test_fetch_user_failures(self, mock_print):
+        """Test that a missing user or a network error yields None and an error message."""
+        # (case, username, response, side_effect)
+        cases = [
+            ("not found", "nonexistent_user", create_mock_response(404, None), None),
+            ("network error", "test_user", None, Exception("Network error")),
+        ]
         
-        # Assert
-        mock_get.assert_called_once_with(URLS["user"].format(username))
-        mock_loader_instance.start.assert_called_once()
-        mock_print.assert_called_once()  # Should print error
-        self.assertIsNone(result)
+        for name, username, response, side_effect in cases:
+            with self.subTest(name):
+                # Arrange
+                self.mock_get.reset_mock(return_value=True, side_effect=True)
+                self.mock_loader.reset_mock()
+                mock_print.reset_mock()
+                self.mock_get.return_value = response
+                self.mock_get.side_effect = side_effect
+                
+                # Act
+                result = fetch_user(username)
+                
+                # Assert
+                self.mock_get.assert_called_once_with(URLS["user"].format(username), timeout=REQUEST_TIMEOUT)
+                self.mock_loader.return_value.start.assert_called_once()
+                mock_print.assert_called_once()  # Should print error
+                self.assertIsNone(result)
 
 
-class TestFetchItem(unittest.TestCase):
+class TestFetchItem(UserFetchPatchMixin, unittest.TestCase):
     """Tests for the fetch_item function."""
 
-    @patch('pynews.user_view.requests.get')
-    def test_fetch_item_success(self, mock_get):
-        """Test fetching an item successfully."""
-        # Arrange
-        item_id = 10000
-        mock_story = generate_mock_story(item_id)
-        mock_get.return_value = create_mock_response(200, mock_story)
-        
-        # Act
-        result = fetch_item(item_id)
-        
-        # Assert
-        mock_get.assert_called_once_with(URLS["item"].format(item_id))
-        self.assertEqual(result, mock_story)
-
-    @patch('pynews.user_view.requests.get')
-    def test_fetch_item_not_found(self, mock_get):
-        """Test fetching a non-existent item."""
-        # Arrange
-        item_id = 99999
-        mock_get.return_value = create_mock_response(404, None)
-        
-        # Act
-        result = fetch_item(item_id)
-        
-        # Assert
-        mock_get.assert_called_once_with(URLS["item"].format(item_id))
-        self.assertIsNone(result)
-
-    @patch('pynews.user_view.requests.get')
-    def test_fetch_item_error(self, mock_get):
-        """Test handling errors when fetching an item."""
-        # Arrange
-        item_id = 10000
-        mock_get.side_effect = Exception("Network error")
-        
-        # Act
-        result = fetch_item(item_id)
+    def test_fetch_item(self):
+        """Test fetching an item, a missing item and an item whose request fails."""
+        mock_story = generate_mock_story(10000)
+        # (case, item_id, response, side_effect, expected result)
+        cases = [
+            ("success", 10000, create_mock_response(200, mock_story), None, mock_story),
+            ("not found", 99999, create_mock_response(404, None), None, None),
+            ("network error", 10000, None, Exception("Network error"), None),
+        ]
         
-        # Assert
-        mock_get.assert_called_once_with(URLS["item"].format(item_id))
-        self.assertIsNone(result)
+        for name, item_id, response, side_effect, expected in cases:
+            with self.subTest(name):
+                # Arrange
+                self.mock_get.reset_mock(return_value=True, side_effect=True)
+                self.mock_get.return_value = response
+                self.mock_get.side_effect = side_effect
+                
+                # Act
+                result = fetch_item(item_id)
+                
+                # Assert
+                self.mock_get.assert_called_once_with(URLS["item"].format(item_id), timeout=REQUEST_TIMEOUT)
+                self.assertEqual(result, expected)
 
 
-class TestFetchSubmissions(unittest.TestCase):
+class TestFetchSubmissions(UserFetchPatchMixin, unittest.TestCase):
     """Tests for the fetch_submissions function."""
 
-    @patch('pynews.user_view.requests.get')
     @patch('pynews.user_view.fetch_item')
-    @patch('pynews.user_view.LoadingIndicator')
-    def test_fetch_submissions_success(self, mock_loader, mock_fetch_item, mock_get):
+    def test_fetch_submissions_success(self, mock_fetch_item):
         """Test fetching user submissions successfully."""
         # Arrange
         username = "test_user"
         max_items = 5
         mock_user_data = generate_mock_user(username)
-        mock_get.return_value = create_mock_response(200, mock_user_data)
+        self.mock_get.return_value = create_mock_response(200, mock_user_data)
         
         # Generate mock submissions (stories and comments)
         mock_items = generate_mock_submissions(5, username)
-        mock_fetch_item.side_effect = lambda item_id: next(
-            (item for item in mock_items if item["id"] == item_id), None
-        )
+        mock_fetch_item.side_effect = {item["id"]: item for item in mock_items}.get
         
-        mock_loader_instance = MagicMock()
-        mock_loader.return_value = mock_loader_instance
         
         # Act
         result = fetch_submissions(username, max_items)
         
         # Assert
-        mock_get.assert_called_once_with(URLS["user"].format(username))
-        mock_loader_instance.start.assert_called_once()
+        self.mock_get.assert_called_once_with(URLS["user"].format(username), timeout=REQUEST_TIMEOUT)
+        self.mock_loader.return_value.start.assert_called_once()
         self.assertEqual(mock_fetch_item.call_count, max_items)
         self.assertEqual(len(result), max_items)
 
-    @patch('pynews.user_view.requests.get')
-    @patch('pynews.user_view.LoadingIndicator')
+    @patch('pynews.user_view.fetch_item')
+    def test_fetch_submissions_keeps_submission_order(self, mock_fetch_item):
+        """Test that parallel fetching returns submissions in the user's order."""
+        # Arrange
+        username = "test_user"
+        mock_user_data = generate_mock_user(username)
+        mock_user_data["submitted"] = [50003, 50001, 50004, 50002]
+        self.mock_get.return_value = create_mock_response(200, mock_user_data)
+        mock_fetch_item.side_effect = lambda item_id: {"id": item_id, "type": "story"}
+        
+        # Act
+        result = fetch_submissions(username)
+        
+        # Assert
+        self.assertEqual([item["id"] for item in result], mock_user_data["submitted"])
+
     @patch('pynews.user_view.print')
-    def test_fetch_submissions_user_not_found(self, mock_print, mock_loader, mock_get):
+    def test_fetch_submissions_user_not_found(self, mock_print):
         """Test fetching submissions for a non-existent user."""
         # Arrange
         username = "nonexistent_user"
-        mock_get.return_value = create_mock_response(404, None)
-        mock_loader_instance = MagicMock()
-        mock_loader.return_value = mock_loader_instance
+        self.mock_get.return_value = create_mock_response(404, None)
         
         # Act
         result = fetch_submissions(username)
         
         # Assert
-        mock_get.assert_called_once_with(URLS["user"].format(username))
-        mock_loader_instance.start.assert_called_once()
+        self.mock_get.assert_called_once_with(URLS["user"].format(username), timeout=REQUEST_TIMEOUT)
+        self.mock_loader.return_value.start.assert_called_once()
         mock_print.assert_called_once()  # Should print error
         self.assertIsNone(result)
 
-    @patch('pynews.user_view.requests.get')
     @patch('pynews.user_view.fetch_item')
-    @patch('pynews.user_view.LoadingIndicator')
-    def test_fetch_submissions_with_deleted_items(self, mock_loader, mock_fetch_item, mock_get):
+    def test_fetch_submissions_with_deleted_items(self, mock_fetch_item):
         """Test fetching submissions and handling deleted items."""
         # Arrange
         username = "test_user"
         mock_user_data = generate_mock_user(username)
-        mock_get.return_value = create_mock_response(200, mock_user_data)
+        self.mock_get.return_value = create_mock_response(200, mock_user_data)
         
         # Set up some items to be None (deleted)
         def side_effect(item_id):
@@ -213,14 +199,12 @@ class TestFetchSubmissions(unittest.TestCase):
                 
         mock_fetch_item.side_effect = side_effect
         
-        mock_loader_instance = MagicMock()
-        mock_loader.return_value = mock_loader_instance
         
         # Act
         result = fetch_submissions(username, max_items=10)
         
         # Assert
-        mock_get.assert_called_once_with(URLS["user"].format(username))
+        self.mock_get.assert_called_once_with(URLS["user"].format(username), timeout=REQUEST_TIMEOUT)
         self.assertEqual(mock_fetch_item.call_count, 10)
         # Should filter out deleted items (Nones)
         self.assertEqual(len(result), 5)
@@ -294,6 +278,11 @@ class TestCategorizeSubmissions(unittest.TestCase):
 class TestFetchUserAttributes(unittest.TestCase):
     """Tests for fetching specific user attributes."""
 
+    def setUp(self):
+        """Start every test without users cached by earlier ones."""
+        clear_user_cache()
+        self.addCleanup(clear_user_cache)
+
     @patch('pynews.user_view.fetch_user')
     def test_fetch_karma_success(self, mock_fetch_user):
         """Test fetching a user's karma successfully."""
@@ -356,11 +345,18 @@ class TestFetchUserAttributes(unittest.TestCase):
 class TestFormatAccountAge(unittest.TestCase):
     """Tests for formatting account age."""
 
+    NOW = FROZEN_NOW
+
+    def setUp(self):
+        """Freeze the clock so account ages are measured from a constant."""
+        patcher = patch.object(_uv.time, 'time', return_value=self.NOW)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_format_account_age_years(self):
         """Test formatting account age in years."""
         # Arrange - Set creation time to 3 years ago
-        now = int(time.time())
-        created = now - (3 * 365 * 24 * 60 * 60)  # 3 years ago
+        created = self.NOW - (3 * 365 * 24 * 60 * 60)
         
         # Act
         result = format_account_age(created)
@@ -371,8 +367,7 @@ class TestFormatAccountAge(unittest.TestCase):
     def test_format_account_age_months(self):
         """Test formatting account age in months."""
         # Arrange - Set creation time to 5 months ago
-        now = int(time.time())
-        created = now - (5 * 30 * 24 * 60 * 60)  # ~5 months ago
+        created = self.NOW - (5 * 30 * 24 * 60 * 60)
         
         # Act
         result = format_account_age(created)
@@ -383,8 +378,7 @@ class TestFormatAccountAge(unittest.TestCase):
     def test_format_account_age_days(self):
         """Test formatting account age in days."""
         # Arrange - Set creation time to 12 days ago
-        now = int(time.time())
-        created = now - (12 * 24 * 60 * 60)  # 12 days ago
+        created = self.NOW - (12 * 24 * 60 * 60)
         
         # Act
         result = format_account_age(created)
@@ -404,17 +398,15 @@ class TestFormatAccountAge(unittest.TestCase):
         self.assertEqual(result, "Unknown")
 
 
-class TestFetchRandomUsers(unittest.TestCase):
+class TestFetchRandomUsers(UserFetchPatchMixin, unittest.TestCase):
     """Tests for the fetch_random_users function."""
 
-    @patch('pynews.user_view.requests.get')
-    @patch('pynews.user_view.LoadingIndicator')
     @patch('pynews.user_view.fetch_user')
-    def test_fetch_random_users_success(self, mock_fetch_user, mock_loader, mock_get):
+    def test_fetch_random_users_success(self, mock_fetch_user):
         """Test fetching random users successfully."""
         # Arrange
         story_ids = [10001, 10002, 10003, 10004, 10005]
-        mock_get.return_value = create_mock_response(200, story_ids)
+        self.mock_get.return_value = create_mock_response(200, story_ids)
         
         # Set up mock stories with different authors
         mock_stories = [
@@ -433,34 +425,52 @@ class TestFetchRandomUsers(unittest.TestCase):
             # Mock fetch_user to return a user for each username
             mock_fetch_user.side_effect = lambda username: generate_mock_user(username)
             
-            mock_loader_instance = MagicMock()
-            mock_loader.return_value = mock_loader_instance
             
             # Act
             result = fetch_random_users(count=3)
             
             # Assert
-            mock_get.assert_called_once()
+            self.mock_get.assert_called_once()
             self.assertEqual(len(result), 3)
             for user in result:
                 self.assertTrue(isinstance(user, dict))
                 self.assertIn("id", user)
                 self.assertIn("karma", user)
 
-    @patch('pynews.user_view.requests.get')
-    @patch('pynews.user_view.LoadingIndicator')
-    def test_fetch_random_users_api_failure(self, mock_loader, mock_get):
+    @patch('pynews.user_view.fetch_item')
+    def test_fetch_random_users_stops_after_enough_submitters(self, mock_fetch_item):
+        """Test that stories are fetched a batch at a time until enough submitters are found."""
+        # Arrange
+        story_ids = [10001, 10002, 10003, 10004, 10005, 10006]
+        self.mock_get.return_value = create_mock_response(200, story_ids)
+        authors = {10001: "alice", 10002: "bob", 10003: "alice", 10004: "carol", 10005: "dave", 10006: "erin"}
+        mock_fetch_item.side_effect = lambda item_id: {"id": item_id, "by": authors[item_id]}
+        
+        # Act
+        result = fetch_random_users(count=3)
+        
+        # Assert - the first batch only has two distinct submitters, the second completes the set
+        self.assertEqual(len(result), 3)
+        self.assertTrue(set(result) <= {"alice", "bob", "carol", "dave", "erin"})
+        self.assertEqual(mock_fetch_item.call_count, 6)
+        
+        mock_fetch_item.reset_mock()
+        authors[10003] = "carol"
+        result = fetch_random_users(count=3)
+        
+        self.assertEqual(set(result), {"alice", "bob", "carol"})
+        self.assertEqual(mock_fetch_item.call_count, 3)
+
+    def test_fetch_random_users_api_failure(self):
         """Test handling API failures when fetching random users."""
         # Arrange
-        mock_get.return_value = create_mock_response(500, None)
-        mock_loader_instance = MagicMock()
-        mock_loader.return_value = mock_loader_instance
+        self.mock_get.return_value = create_mock_response(500, None)
         
         # Act
         result = fetch_random_users(count=3)
         
         # Assert
-        mock_get.assert_called_once()
+        self.mock_get.assert_called_once()
         self.assertEqual(result, [])
 
 
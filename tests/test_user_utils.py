@@ -1,22 +1,15 @@
 """
 Utilities for testing user information fetching functionality.
 """
-import json
-from unittest.mock import Mock
 import time
+from unittest.mock import patch
 
+from pynews.user_view import clear_user_cache
+from mock_responses import create_mock_response  # noqa: F401  re-exported for the test modules
 
-def create_mock_response(status_code=200, json_data=None):
-    """Create a mock requests response object with the given status code and JSON data."""
-    mock_response = Mock()
-    mock_response.status_code = status_code
-    
-    def mock_json():
-        return json_data
-        
-    mock_response.json = mock_json
-    
-    return mock_response
+# Read once: the mock items are only placed relative to "now" and a test run
+# is far shorter than the hour they're backdated by
+_NOW = int(time.time())
 
 
 def generate_mock_user(username="test_user", karma=1000, created=1234567890, about="Test user bio"):
@@ -59,7 +52,7 @@ def generate_mock_story(story_id=10000, by="test_user", score=100, title="Test S
         "by": by,
         "score": score,
         "title": title,
-        "time": int(time.time()) - 86400,  # 1 day ago
+        "time": _NOW - 86400,  # 1 day ago
         "type": "story",
         "descendants": 10,  # Number of comments
         "url": f"https://example.com/story/{story_id}"
@@ -83,7 +76,7 @@ def generate_mock_comment(comment_id=10000, by="test_user", parent_id=9000):
         "by": by,
         "parent": parent_id,
         "text": f"This is a test comment {comment_id} by {by}",
-        "time": int(time.time()) - 3600,  # 1 hour ago
+        "time": _NOW - 3600,  # 1 hour ago
         "type": "comment"
     }
 
@@ -100,20 +93,39 @@ def generate_mock_submissions(count=50, by="test_user", mix_ratio=0.7):
     Returns:
         List of submission dictionaries
     """
-    submissions = []
     story_count = int(count * mix_ratio)
     comment_count = count - story_count
     
-    # Generate stories
-    for i in range(story_count):
-        story_id = 10000 + i
-        score = 50 + i * 2  # Increasing scores
-        submissions.append(generate_mock_story(story_id, by, score, f"Test Story {i+1}"))
+    # Stories with increasing scores, then comments
+    stories = [
+        generate_mock_story(10000 + i, by, 50 + i * 2, f"Test Story {i+1}")
+        for i in range(story_count)
+    ]
+    comments = [
+        generate_mock_comment(20000 + i, by, 9000 + i)
+        for i in range(comment_count)
+    ]
     
-    # Generate comments
-    for i in range(comment_count):
-        comment_id = 20000 + i
-        parent_id = 9000 + i
-        submissions.append(generate_mock_comment(comment_id, by, parent_id))
+    return stories + comments
+
+
+class UserFetchPatchMixin:
+    """
+    Mixin that patches the user view's API session and loading indicator for each test.
     
-    return submissions
\ No newline at end of file
+    The patched session.get is self.mock_get and the LoadingIndicator class is
+    self.mock_loader; every test also starts with no cached users.
+    """
+
+    def setUp(self):
+        """Clear the user cache and start the session and loader patchers."""
+        clear_user_cache()
+        self.addCleanup(clear_user_cache)
+        
+        session_patcher = patch('pynews.user_view._SESSION.get')
+        self.mock_get = session_patcher.start()
+        self.addCleanup(session_patcher.stop)
+        
+        loader_patcher = patch('pynews.user_view.LoadingIndicator')
+        self.mock_loader = loader_patcher.start()
+        self.addCleanup(loader_patcher.stop)
@@ -2,30 +2,14 @@
 Test utilities for PyNews tests.
 Contains mock data generators and helper functions for testing.
 """
-import json
-from unittest.mock import Mock
+from contextlib import ExitStack
+from unittest.mock import patch
 
+from mock_responses import create_mock_response  # noqa: F401  re-exported for the test modules
+from pynews.utils import clear_story_cache
 
-def create_mock_response(status_code=200, json_data=None):
-    """
-    Create a mock requests response object with the given status code and JSON data.
-    
-    Args:
-        status_code: HTTP status code for the response
-        json_data: Dictionary to return as JSON data
-        
-    Returns:
-        Mock response object
-    """
-    mock_response = Mock()
-    mock_response.status_code = status_code
-    
-    def mock_json():
-        return json_data
-        
-    mock_response.json = mock_json
-    
-    return mock_response
+# Fixed "current time" for tests that freeze the clock
+FROZEN_NOW = 1616513496
 
 
 def generate_mock_story(story_id=12345):
@@ -133,15 +117,60 @@ def generate_comment_tree_data(story_id=12345, levels=2, width=2):
     return story, comment_dict
 
 
-def simulate_fetch_item(comment_id, comment_dict):
+def generate_flat_comments(comment_ids, base_time=1616513396):
     """
-    Simulate fetching an item from the API based on the given comment dictionary.
+    Generate top-level comments with no replies, one per ID, for pagination tests.
     
     Args:
-        comment_id: ID to fetch
-        comment_dict: Dictionary mapping comment IDs to comment objects
+        comment_ids: IDs of the comments to generate, in display order
+        base_time: Timestamp that each comment ID is added to
         
     Returns:
-        Comment data or None if not found
+        List of comment dictionaries as returned by fetch_comment_tree
     """
-    return comment_dict.get(comment_id)
\ No newline at end of file
+    return [
+        {
+            'id': i,
+            'text': f'Comment {i}',
+            'by': f'user{i}',
+            'time': base_time + i,
+            'children': []
+        }
+        for i in comment_ids
+    ]
+
+
+class SilentViewMixin:
+    """
+    Mixin for view integration tests: clears the story cache before each test
+    and patches a view's terminal input and output around a display call.
+    
+    Subclasses set view_module to the module under test (e.g. 'pynews.ask_view'),
+    input_name to the key-reading function it calls, and silenced to the other
+    names to patch out.
+    """
+
+    view_module = None
+    input_name = 'getch'
+    silenced = ('clear_screen', 'print')
+
+    def setUp(self):
+        """Start each test without stories cached by a previous one."""
+        super().setUp()
+        clear_story_cache()
+
+    def silent_ui(self, **key_input):
+        """
+        Patch the view's terminal input and output for one display call.
+        
+        Args:
+            **key_input: return_value or side_effect for the patched input function
+            
+        Returns:
+            ExitStack that removes the patches when it exits
+        """
+        stack = ExitStack()
+        stack.enter_context(patch(f'{self.view_module}.{self.input_name}', **key_input))
+        for target in self.silenced:
+            stack.enter_context(patch(f'{self.view_module}.{target}'))
+        return stack